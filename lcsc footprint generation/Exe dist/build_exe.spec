@@ -7,14 +7,13 @@ from pathlib import Path
 
 # Get the project root directory
 project_root = Path(SPECPATH).parent
-src_dir = project_root / 'src'
 main_script = project_root / 'main.py'
 
 block_cipher = None
 
 a = Analysis(
     [str(main_script)],
-    pathex=[str(project_root), str(src_dir)],
+    pathex=[str(project_root)],
     binaries=[],
     datas=[
         # Include sample files if needed
@@ -6,8 +6,19 @@ Checks for and installs required dependencies on first run.
 import sys
 import subprocess
 import os
+from importlib.metadata import distribution, PackageNotFoundError
 from pathlib import Path
 
+REQUIRED_PACKAGES = [
+    "PyQt6",
+    "httpx",
+    "lxml",
+    "pandas",
+    "openpyxl"
+]
+
+FLAG_FILE = Path(__file__).parent / ".dependencies_installed"
+
 def check_python_version():
     """Check if Python version is 3.10 or higher."""
     version = sys.version_info
@@ -65,31 +76,35 @@ def install_dependencies():
 
 def check_dependencies():
     """Check if all required packages are installed."""
-    required_packages = [
-        "PyQt6",
-        "httpx",
-        "lxml",
-        "pandas",
-        "openpyxl"
-    ]
-
     missing = []
     print("\nChecking installed packages...")
 
-    for package in required_packages:
+    for package in REQUIRED_PACKAGES:
+        # Only reads the installed metadata; importing pandas/PyQt6 is slow
         try:
-            __import__(package.lower().replace("-", "_"))
+            distribution(package)
             print(f"  ✓ {package}")
-        except ImportError:
+        except PackageNotFoundError:
             print(f"  ✗ {package} (missing)")
             missing.append(package)
 
     return len(missing) == 0, missing
 
+def dependencies_fingerprint():
+    """Identify the Python version and package list the checks ran against."""
+    version = sys.version_info
+    return f"{version.major}.{version.minor}|{','.join(REQUIRED_PACKAGES)}"
+
+def flag_file_is_current():
+    """Check if a previous run already verified this Python and package list."""
+    try:
+        return FLAG_FILE.read_text(encoding="utf-8").strip() == dependencies_fingerprint()
+    except OSError:
+        return False
+
 def create_flag_file():
     """Create a flag file to indicate dependencies are installed."""
-    flag_file = Path(__file__).parent / ".dependencies_installed"
-    flag_file.touch()
+    FLAG_FILE.write_text(dependencies_fingerprint(), encoding="utf-8")
 
 def main():
     """Main dependency installation routine."""
@@ -97,6 +112,11 @@ def main():
     print("OpenPnP Footprint Manager - Dependency Checker")
     print("="*60 + "\n")
 
+    # Skip the pip subprocess and package checks on warm runs
+    if flag_file_is_current():
+        print("✓ Dependencies already verified")
+        return True
+
     # Check Python version
     if not check_python_version():
         input("\nPress Enter to exit...")
@@ -8,17 +8,14 @@ Usage:
     python main.py
 """
 
+import multiprocessing
 import sys
-from pathlib import Path
-
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 
 def main():
     """Application entry point."""
     from PyQt6.QtWidgets import QApplication
-    from gui.main_window import MainWindow
+    from src.gui.main_window import MainWindow
     
     app = QApplication(sys.argv)
     app.setApplicationName("OpenPnP Footprint Manager")
@@ -31,4 +28,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # Footprint parsing runs in worker processes; needed for frozen builds
+    multiprocessing.freeze_support()
     main()
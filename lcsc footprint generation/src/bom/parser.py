@@ -3,12 +3,30 @@
 Handles parsing CSV and Excel BOM files into structured data.
 """
 
-from pathlib import Path
-from typing import List, Optional, Dict
-import pandas as pd
+import importlib.util
 import sys
-sys.path.insert(0, str(Path(__file__).parent.parent))
-from models.part import BomEntry, FootprintGroup
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator, List, Optional, Dict, Tuple, Union, TYPE_CHECKING
+from ..models.part import BomEntry, FootprintGroup
+
+if TYPE_CHECKING:
+    # Imported lazily at runtime; pandas alone takes seconds to load
+    import numpy as np
+    import pandas as pd
+
+# Byte order marks, longest first so UTF-32 LE isn't taken for UTF-16 LE.
+# The "utf-16"/"utf-32" codecs consume the mark and pick the byte order.
+_BYTE_ORDER_MARKS = (
+    (b"\xff\xfe\x00\x00", "utf-32"),
+    (b"\x00\x00\xfe\xff", "utf-32"),
+    (b"\xef\xbb\xbf", "utf-8-sig"),
+    (b"\xff\xfe", "utf-16"),
+    (b"\xfe\xff", "utf-16"),
+)
+
+# Optional faster CSV reader
+_HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
 
 
 class BomParseError(Exception):
@@ -16,6 +34,80 @@ class BomParseError(Exception):
     pass
 
 
+@dataclass
+class BomEntryBatch:
+    """Column-wise BOM entries held as parallel NumPy object arrays.
+    
+    Only the BOM columns are kept; processing status lives on BomEntry.
+    
+    Attributes:
+        reference: Reference designators
+        value: Component values
+        footprint_name: Footprint/package names
+        lcsc_number: LCSC part numbers, None where not provided
+    """
+    reference: "np.ndarray"
+    value: "np.ndarray"
+    footprint_name: "np.ndarray"
+    lcsc_number: "np.ndarray"
+    
+    @classmethod
+    def from_entries(cls, entries: List[BomEntry]) -> "BomEntryBatch":
+        """Build a batch from a list of BOM entries.
+        
+        Args:
+            entries: List of BOM entries
+            
+        Returns:
+            BomEntryBatch with one row per entry
+        """
+        import numpy as np
+        
+        columns = [np.empty(len(entries), dtype=object) for _ in range(4)]
+        for i, e in enumerate(entries):
+            columns[0][i] = e.reference
+            columns[1][i] = e.value
+            columns[2][i] = e.footprint_name
+            columns[3][i] = e.lcsc_number
+        return cls(*columns)
+    
+    def __len__(self) -> int:
+        return len(self.footprint_name)
+    
+    def __getitem__(self, mask: "np.ndarray") -> "BomEntryBatch":
+        return BomEntryBatch(
+            self.reference[mask], self.value[mask],
+            self.footprint_name[mask], self.lcsc_number[mask]
+        )
+    
+    @property
+    def has_lcsc(self) -> "np.ndarray":
+        """Boolean mask of rows with a non-blank LCSC number."""
+        import numpy as np
+        
+        present = self.lcsc_number != None  # noqa: E711 - elementwise
+        lcsc = np.where(present, self.lcsc_number, "").astype(str)
+        return np.char.str_len(np.char.strip(lcsc)) > 0
+    
+    def to_entries(self) -> List[BomEntry]:
+        """Convert the batch to a list of BOM entries.
+        
+        Reference, value, footprint and LCSC strings are interned so rows
+        sharing them share one object and dict lookups on them hash once.
+        
+        Returns:
+            List of BomEntry objects
+        """
+        intern = sys.intern
+        return [
+            BomEntry(intern(reference), intern(value), intern(footprint),
+                     intern(lcsc) if lcsc is not None else None)
+            for reference, value, footprint, lcsc in zip(
+                self.reference, self.value, self.footprint_name, self.lcsc_number
+            )
+        ]
+
+
 class BomParser:
     """Parser for BOM files in CSV and Excel formats.
     
@@ -31,6 +123,12 @@ class BomParser:
         "lcsc": ["supplier part", "LCSC", "LCSC Part", "LCSC#", "JLCPCB Part", "JLCPCB Part #", "JLCPCB", "MPN", "Manufacturer Part"]
     }
     
+    # Lowercased aliases, built once for case-insensitive matching
+    _DEFAULT_COLUMNS_LC = {
+        field: tuple(alias.lower() for alias in aliases)
+        for field, aliases in DEFAULT_COLUMNS.items()
+    }
+    
     def __init__(self, 
                  footprint_column: Optional[str] = None,
                  lcsc_column: Optional[str] = None,
@@ -48,6 +146,8 @@ class BomParser:
         self._lcsc_column = lcsc_column
         self._reference_column = reference_column
         self._value_column = value_column
+        # Resolved column mappings keyed by the file's column names
+        self._col_cache: Dict[tuple, Dict[str, Optional[str]]] = {}
     
     def parse(self, filepath: Path) -> List[BomEntry]:
         """Parse a BOM file.
@@ -58,35 +158,65 @@ class BomParser:
         Returns:
             List of BomEntry objects
             
+        Raises:
+            BomParseError: If parsing fails
+        """
+        return self.parse_batch(filepath).to_entries()
+    
+    def parse_iter(self, filepath: Path, chunk_size: int = 1000) -> Iterator[List[BomEntry]]:
+        """Parse a BOM file, yielding entries in chunks.
+        
+        The file is read in one pass as for parse(); entries are then
+        built a chunk at a time so callers can show the first rows early.
+        
+        Args:
+            filepath: Path to BOM file (CSV or Excel)
+            chunk_size: Maximum entries per chunk
+            
+        Yields:
+            Lists of BomEntry objects, in file order
+            
+        Raises:
+            BomParseError: If parsing fails
+        """
+        batch = self.parse_batch(filepath)
+        for start in range(0, len(batch), chunk_size):
+            yield batch[start:start + chunk_size].to_entries()
+    
+    def parse_batch(self, filepath: Path) -> BomEntryBatch:
+        """Parse a BOM file into column arrays.
+        
+        Args:
+            filepath: Path to BOM file (CSV or Excel)
+            
+        Returns:
+            BomEntryBatch with one row per valid entry
+            
         Raises:
             BomParseError: If parsing fails
         """
         if not filepath.exists():
             raise BomParseError(f"File not found: {filepath}")
         
+        import pandas as pd
+        
         suffix = filepath.suffix.lower()
         
         try:
             if suffix == ".csv":
                 # Try different encodings and separators for CSV files
-                configs = [
-                    ('utf-8', ','),
-                    ('utf-8', '\t'),
-                    ('utf-16', '\t'),
-                    ('utf-16-le', '\t'),
-                    ('latin-1', ','),
-                ]
+                configs = self._csv_read_configs(filepath)
                 df = None
                 last_error = None
 
                 for encoding, separator in configs:
                     try:
-                        df = pd.read_csv(filepath, encoding=encoding, sep=separator)
+                        # Sniff the header only, then read just the mapped columns
+                        header = pd.read_csv(filepath, encoding=encoding, sep=separator, nrows=0)
                         # Check if we got valid columns
-                        if len(df.columns) > 1:
+                        if len(header.columns) > 1:
+                            df = self._read_csv_columns(filepath, encoding, separator, header)
                             break
-                        else:
-                            df = None
                     except (UnicodeDecodeError, pd.errors.ParserError) as e:
                         last_error = e
                         continue
@@ -105,14 +235,76 @@ class BomParser:
         
         return self._parse_dataframe(df)
     
-    def _parse_dataframe(self, df: pd.DataFrame) -> List[BomEntry]:
+    def _csv_read_configs(self, filepath: Path) -> List[Tuple[str, str]]:
+        """Get the (encoding, separator) combinations to try for a CSV file.
+        
+        A byte order mark pins the encoding, so only the separators need
+        trying; otherwise every known combination is tried in order.
+        
+        Args:
+            filepath: Path to CSV file
+            
+        Returns:
+            List of (encoding, separator) tuples
+        """
+        with open(filepath, "rb") as f:
+            head = f.read(4)
+        
+        for mark, encoding in _BYTE_ORDER_MARKS:
+            if head.startswith(mark):
+                return [(encoding, ','), (encoding, '\t')]
+        
+        return [
+            ('utf-8', ','),
+            ('utf-8', '\t'),
+            ('utf-16', '\t'),
+            ('utf-16-le', '\t'),
+            ('latin-1', ','),
+        ]
+    
+    def _read_csv_columns(self, filepath: Path, encoding: str, separator: str,
+                          header: "pd.DataFrame") -> "pd.DataFrame":
+        """Read only the columns needed for BOM entries from a CSV file.
+        
+        Uses the multithreaded pyarrow reader when it is installed and
+        falls back to the default C engine otherwise.
+        
+        Args:
+            filepath: Path to CSV file
+            encoding: File encoding
+            separator: Field separator
+            header: Empty DataFrame with the file's column names
+            
+        Returns:
+            DataFrame containing the mapped columns
+        """
+        columns = self._find_columns(header.columns.tolist())
+        if not columns.get("footprint"):
+            # Nothing to read; _parse_dataframe reports the missing column
+            return header
+        
+        import pandas as pd
+        
+        usecols = list(dict.fromkeys(c for c in columns.values() if c))
+        
+        if _HAS_PYARROW:
+            try:
+                return pd.read_csv(filepath, encoding=encoding, sep=separator,
+                                   usecols=usecols, engine="pyarrow")
+            except (ValueError, NotImplementedError):
+                # pyarrow rejects some encodings and malformed rows
+                pass
+        
+        return pd.read_csv(filepath, encoding=encoding, sep=separator, usecols=usecols)
+    
+    def _parse_dataframe(self, df: "pd.DataFrame") -> BomEntryBatch:
         """Parse a pandas DataFrame into BOM entries.
         
         Args:
             df: DataFrame with BOM data
             
         Returns:
-            List of BomEntry objects
+            BomEntryBatch with one row per valid entry
         """
         # Find column mappings
         columns = self._find_columns(df.columns.tolist())
@@ -123,17 +315,40 @@ class BomParser:
                 f"Expected one of: {self.DEFAULT_COLUMNS['footprint']}"
             )
         
-        entries = []
+        # Pull each mapped column out once as a stripped string array
+        # instead of building a Series per row with iterrows()
+        footprints = self._column_values(df, columns["footprint"])
+        references = self._column_values(df, columns.get("reference"))
+        values = self._column_values(df, columns.get("value"))
+        lcsc_numbers = self._column_values(df, columns.get("lcsc"))
         
-        for idx, row in df.iterrows():
-            try:
-                entry = self._parse_row(row, columns)
-                if entry:
-                    entries.append(entry)
-            except (KeyError, ValueError):
-                continue
+        import numpy as np
         
-        return entries
+        # Footprint is required; drop empty and "nan" rows
+        valid = (footprints != "") & (np.char.lower(footprints.astype(str)) != "nan")
+        
+        lcsc_missing = (lcsc_numbers == "") | (np.char.lower(lcsc_numbers.astype(str)) == "nan")
+        lcsc_numbers = np.where(lcsc_missing, None, lcsc_numbers)
+        
+        return BomEntryBatch(
+            references[valid], values[valid], footprints[valid], lcsc_numbers[valid]
+        )
+    
+    @staticmethod
+    def _column_values(df: "pd.DataFrame", column: Optional[str]) -> "np.ndarray":
+        """Extract a column as an array of stripped strings.
+        
+        Args:
+            df: DataFrame with BOM data
+            column: Column name, or None if the column was not found
+            
+        Returns:
+            Array of strings with missing values as ""
+        """
+        if not column:
+            import numpy as np
+            return np.full(len(df), "", dtype=object)
+        return df[column].fillna("").astype(str).str.strip().to_numpy()
     
     def _find_columns(self, column_names: List[str]) -> Dict[str, Optional[str]]:
         """Find the actual column names in the DataFrame.
@@ -144,8 +359,18 @@ class BomParser:
         Returns:
             Dict mapping field names to actual column names
         """
+        key = tuple(column_names)
+        cached = self._col_cache.get(key)
+        if cached is not None:
+            return cached
+        
         result = {}
         
+        # Lowercase each column once; first occurrence wins like the old scan
+        lookup: Dict[str, str] = {}
+        for col_name in column_names:
+            lookup.setdefault(col_name.lower(), col_name)
+        
         # Check for custom columns first
         custom_mappings = {
             "reference": self._reference_column,
@@ -161,68 +386,16 @@ class BomParser:
             
             # Search for default column names (case-insensitive)
             found = None
-            for default_name in self.DEFAULT_COLUMNS[field]:
-                for col_name in column_names:
-                    if col_name.lower() == default_name.lower():
-                        found = col_name
-                        break
+            for default_name in self._DEFAULT_COLUMNS_LC[field]:
+                found = lookup.get(default_name)
                 if found:
                     break
             
             result[field] = found
         
+        self._col_cache[key] = result
         return result
     
-    def _parse_row(self, row: pd.Series, columns: Dict[str, Optional[str]]) -> Optional[BomEntry]:
-        """Parse a single row into a BomEntry.
-        
-        Args:
-            row: DataFrame row
-            columns: Column name mapping
-            
-        Returns:
-            BomEntry or None if row is invalid
-        """
-        # Get footprint (required)
-        footprint_col = columns.get("footprint")
-        if not footprint_col:
-            return None
-        
-        footprint = str(row.get(footprint_col, "")).strip()
-        if not footprint or footprint.lower() == "nan":
-            return None
-        
-        # Get reference
-        reference_col = columns.get("reference")
-        reference = ""
-        if reference_col:
-            ref_val = row.get(reference_col, "")
-            reference = str(ref_val).strip() if pd.notna(ref_val) else ""
-        
-        # Get value
-        value_col = columns.get("value")
-        value = ""
-        if value_col:
-            val_val = row.get(value_col, "")
-            value = str(val_val).strip() if pd.notna(val_val) else ""
-        
-        # Get LCSC number (optional)
-        lcsc_col = columns.get("lcsc")
-        lcsc_number = None
-        if lcsc_col:
-            lcsc_val = row.get(lcsc_col, "")
-            if pd.notna(lcsc_val):
-                lcsc_str = str(lcsc_val).strip()
-                if lcsc_str and lcsc_str.lower() != "nan":
-                    lcsc_number = lcsc_str
-        
-        return BomEntry(
-            reference=reference,
-            value=value,
-            footprint_name=footprint,
-            lcsc_number=lcsc_number
-        )
-    
     def group_by_footprint(self, entries: List[BomEntry]) -> List[FootprintGroup]:
         """Group BOM entries by footprint name.
         
@@ -234,25 +407,10 @@ class BomParser:
         Returns:
             List of FootprintGroup objects
         """
-        # Group by base footprint name
-        groups: Dict[str, List[BomEntry]] = {}
-        
-        for entry in entries:
-            base = entry.base_footprint
-            if base not in groups:
-                groups[base] = []
-            groups[base].append(entry)
-        
-        # Create FootprintGroup objects
-        result = []
-        for footprint_name, group_entries in groups.items():
-            group = FootprintGroup.from_entries(footprint_name, group_entries)
-            result.append(group)
-        
-        # Sort by footprint name
-        result.sort(key=lambda g: g.footprint_name)
-        
-        return result
+        # Group by base footprint name, sorted by footprint name
+        groups = FootprintGroup.group_bom_entries(entries)
+        groups.sort(key=lambda group: group.footprint_name)
+        return groups
 
 
 def parse_bom(filepath: Path) -> List[BomEntry]:
@@ -268,40 +426,55 @@ def parse_bom(filepath: Path) -> List[BomEntry]:
     return parser.parse(filepath)
 
 
-def get_unique_footprints(entries: List[BomEntry]) -> List[str]:
+def get_unique_footprints(entries: Union[List[BomEntry], BomEntryBatch]) -> List[str]:
     """Get list of unique footprint names from BOM entries.
     
     Args:
-        entries: List of BOM entries
+        entries: List of BOM entries or a BomEntryBatch
         
     Returns:
         Sorted list of unique footprint names
     """
+    if isinstance(entries, BomEntryBatch):
+        import numpy as np
+        
+        # Strip suffixes once per distinct name rather than once per row
+        names = np.unique(entries.footprint_name.astype(str)).tolist()
+        return sorted({BomEntry.strip_footprint_suffixes(n) for n in names})
+    
     footprints = set()
     for entry in entries:
         footprints.add(entry.base_footprint)
     return sorted(footprints)
 
 
-def filter_entries_with_lcsc(entries: List[BomEntry]) -> List[BomEntry]:
+def filter_entries_with_lcsc(
+    entries: Union[List[BomEntry], BomEntryBatch]
+) -> Union[List[BomEntry], BomEntryBatch]:
     """Filter entries to only those with LCSC numbers.
     
     Args:
-        entries: List of BOM entries
+        entries: List of BOM entries or a BomEntryBatch
         
     Returns:
-        Entries that have LCSC numbers
+        Entries that have LCSC numbers, in the same form as given
     """
+    if isinstance(entries, BomEntryBatch):
+        return entries[entries.has_lcsc]
     return [e for e in entries if e.has_lcsc]
 
 
-def filter_entries_without_lcsc(entries: List[BomEntry]) -> List[BomEntry]:
+def filter_entries_without_lcsc(
+    entries: Union[List[BomEntry], BomEntryBatch]
+) -> Union[List[BomEntry], BomEntryBatch]:
     """Filter entries to only those without LCSC numbers.
     
     Args:
-        entries: List of BOM entries
+        entries: List of BOM entries or a BomEntryBatch
         
     Returns:
-        Entries that lack LCSC numbers
+        Entries that lack LCSC numbers, in the same form as given
     """
+    if isinstance(entries, BomEntryBatch):
+        return entries[~entries.has_lcsc]
     return [e for e in entries if not e.has_lcsc]
@@ -0,0 +1,192 @@
+"""Table model for the BOM contents view.
+
+Keeps each column as a plain list so the view only builds display values
+for the rows it actually paints. Height and nozzle are stored only for rows
+that were changed; every other row shows the defaults.
+"""
+
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex
+from typing import Dict, List, Optional, Any
+from ..models.part import BomEntry
+
+
+class BomTableModel(QAbstractTableModel):
+    """Read-only model of BOM entries with per-row height and nozzle.
+
+    Height and nozzle start at their defaults and are changed by the main
+    window as footprints are confirmed or edited.
+    """
+
+    HEADERS = (
+        "Reference", "Value", "OpenPnP Part Name", "Footprint", "LCSC #", "Height (mm)", "Nozzle", "Status"
+    )
+    REFERENCE_COLUMN = 0
+    VALUE_COLUMN = 1
+    PART_NAME_COLUMN = 2
+    FOOTPRINT_COLUMN = 3
+    LCSC_COLUMN = 4
+    HEIGHT_COLUMN = 5
+    NOZZLE_COLUMN = 6
+    STATUS_COLUMN = 7
+
+    # Status text indexed by the row's has-LCSC flag
+    STATUS_TEXT = ("No LCSC", "Has LCSC")
+
+    DEFAULT_HEIGHT = "0.5"
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._columns: Dict[int, List[str]] = self._empty_columns()
+        self._heights: Dict[int, str] = {}  # row -> height text, if changed
+        self._nozzles: Dict[int, str] = {}  # row -> nozzle name, if set
+        self._nozzle_ids: Dict[int, Optional[str]] = {}  # row -> nozzle tip ID, if set
+        self._has_lcsc: List[bool] = []
+        self._lcsc_count = 0
+        self._row_count = 0
+        self._rows_by_reference: Dict[str, int] = {}
+
+    def _empty_columns(self) -> Dict[int, List[str]]:
+        """Build empty lists for the columns taken from the entries."""
+        return {
+            column: [] for column in range(len(self.HEADERS))
+            if column not in (self.HEIGHT_COLUMN, self.NOZZLE_COLUMN, self.STATUS_COLUMN)
+        }
+
+    def load(self, entries: List[BomEntry]):
+        """Replace the table contents with a new set of BOM entries.
+
+        Args:
+            entries: BOM entries, one per row
+        """
+        self.beginResetModel()
+        self._columns = self._empty_columns()
+        self._heights = {}
+        self._nozzles = {}
+        self._nozzle_ids = {}
+        self._has_lcsc = []
+        self._lcsc_count = 0
+        self._row_count = 0
+        self._rows_by_reference = {}
+        self._extend(entries)
+        self.endResetModel()
+
+    def append_rows(self, entries: List[BomEntry]):
+        """Add BOM entries after the existing rows.
+
+        Args:
+            entries: BOM entries, one per new row
+        """
+        if not entries:
+            return
+        first = self._row_count
+        self.beginInsertRows(QModelIndex(), first, first + len(entries) - 1)
+        self._extend(entries)
+        self.endInsertRows()
+
+    def _extend(self, entries: List[BomEntry]):
+        """Append the column values and reference index for entries."""
+        first = self._row_count
+        references = [e.reference for e in entries]
+        self._columns[self.REFERENCE_COLUMN].extend(references)
+        self._columns[self.VALUE_COLUMN].extend(e.value for e in entries)
+        self._columns[self.PART_NAME_COLUMN].extend(e.part_id for e in entries)
+        self._columns[self.FOOTPRINT_COLUMN].extend(e.footprint_name for e in entries)
+        self._columns[self.LCSC_COLUMN].extend(e.lcsc_number or "" for e in entries)
+        has_lcsc = [e.has_lcsc for e in entries]
+        self._has_lcsc.extend(has_lcsc)
+        self._lcsc_count += sum(has_lcsc)
+        self._row_count += len(entries)
+        for row, reference in enumerate(references, first):
+            self._rows_by_reference.setdefault(reference, row)
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Number of BOM entries (no children for valid parents)."""
+        return 0 if parent.isValid() else self._row_count
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Number of displayed columns."""
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        """Cell text for the display role."""
+        if role != Qt.ItemDataRole.DisplayRole or not index.isValid():
+            return None
+        column = index.column()
+        if column == self.HEIGHT_COLUMN:
+            return self.height(index.row())
+        if column == self.NOZZLE_COLUMN:
+            return self.nozzle(index.row())
+        if column == self.STATUS_COLUMN:
+            return self.STATUS_TEXT[self._has_lcsc[index.row()]]
+        return self._columns[column][index.row()]
+
+    def headerData(self, section: int, orientation: Qt.Orientation,
+                   role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        """Column titles and 1-based row numbers."""
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return section + 1
+
+    @property
+    def lcsc_count(self) -> int:
+        """Number of rows with an LCSC number."""
+        return self._lcsc_count
+
+    def row_for_reference(self, reference: str) -> Optional[int]:
+        """Get the first row with a reference designator.
+
+        Args:
+            reference: Reference designator (e.g., "R1")
+
+        Returns:
+            Row index, or None if not in the table
+        """
+        return self._rows_by_reference.get(reference)
+
+    def height(self, row: int) -> str:
+        """Get the height text shown for a row."""
+        return self._heights.get(row, self.DEFAULT_HEIGHT)
+
+    def nozzle(self, row: int) -> str:
+        """Get the nozzle name shown for a row ("" until one is set)."""
+        return self._nozzles.get(row, "")
+
+    def nozzle_id(self, row: int) -> Optional[str]:
+        """Get the nozzle tip ID for a row, or None until one is set."""
+        return self._nozzle_ids.get(row)
+
+    def set_part_settings(self, row: int, height: str, nozzle: str, nozzle_id: Optional[str]):
+        """Update the height and nozzle shown for a row.
+
+        Args:
+            row: Row index
+            height: Height text in mm
+            nozzle: Nozzle tip name
+            nozzle_id: Nozzle tip ID, kept so it needn't be looked up by name
+        """
+        self.set_rows_part_settings([row], height, nozzle, nozzle_id)
+
+    def set_rows_part_settings(self, rows: List[int], height: str, nozzle: str,
+                               nozzle_id: Optional[str]):
+        """Update the height and nozzle shown for several rows at once.
+
+        Emits a single dataChanged covering all the rows rather than one
+        per row.
+
+        Args:
+            rows: Row indices
+            height: Height text in mm
+            nozzle: Nozzle tip name
+            nozzle_id: Nozzle tip ID
+        """
+        if not rows:
+            return
+        for row in rows:
+            self._heights[row] = height
+            self._nozzles[row] = nozzle
+            self._nozzle_ids[row] = nozzle_id
+        self.dataChanged.emit(
+            self.index(min(rows), self.HEIGHT_COLUMN), self.index(max(rows), self.NOZZLE_COLUMN)
+        )
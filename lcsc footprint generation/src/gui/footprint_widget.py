@@ -4,13 +4,11 @@ Renders footprint pads with scale markings and dimensions.
 """
 
 from PyQt6.QtWidgets import QWidget
-from PyQt6.QtCore import Qt, QRectF, QPointF, pyqtSignal
-from PyQt6.QtGui import QPainter, QPen, QBrush, QColor, QFont
+from PyQt6.QtCore import Qt, QRectF, QPointF, QLineF, pyqtSignal
+from PyQt6.QtGui import QPainter, QPen, QBrush, QColor, QFont, QPixmap
 from typing import Optional
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent))
-from models.footprint import Footprint, Pad
+import numpy as np
+from ..models.footprint import Footprint, Pad
 
 
 class FootprintPreviewWidget(QWidget):
@@ -33,6 +31,10 @@ class FootprintPreviewWidget(QWidget):
         super().__init__(parent)
         self._footprint: Optional[Footprint] = None
         self._selected_pad: Optional[Pad] = None
+        self._pad_bounds = np.empty((0, 4))  # (min_x, min_y, max_x, max_y) per pad in mm
+        self._footprint_w = 10.0  # Footprint extent in mm including margin
+        self._footprint_h = 10.0
+        self._static_pixmap: Optional[QPixmap] = None  # Cached grid/body/pads/dimensions
         self._scale = 1.0
         self._center_x = 0.0
         self._center_y = 0.0
@@ -46,6 +48,20 @@ class FootprintPreviewWidget(QWidget):
         self._pad_color = QColor("#d4af37")  # Gold color for pads
         self._body_color = QColor("#505050")
         self._text_color = QColor("#cccccc")
+        self._pad_text_color = QColor("#000000")  # Black text on gold pad
+
+        # Pens, brushes and fonts, built once and reused on every paint
+        self._grid_pen = QPen(self._grid_color, 1)
+        self._center_pen = QPen(self._center_color, 1, Qt.PenStyle.DashLine)
+        self._body_pen = QPen(self._body_color, 2)
+        self._pad_pen = QPen(self._pad_color, 1)
+        self._pad_brush = QBrush(self._pad_color)
+        self._sel_pen = QPen(QColor("#ff6600"), 3)  # Orange highlight
+        self._sel_brush = QBrush(QColor("#ffaa00"))  # Lighter orange fill
+        self._placeholder_font = QFont("Arial", 12)
+        self._grid_font = QFont("Arial", 8)
+        self._label_font = QFont("Arial", 8, QFont.Weight.Bold)
+        self._dimension_font = QFont("Arial", 10)
 
     def set_footprint(self, footprint: Optional[Footprint]):
         """Set the footprint to display.
@@ -55,51 +71,92 @@ class FootprintPreviewWidget(QWidget):
         """
         self._footprint = footprint
         self._selected_pad = None
+
+        # Precompute pad bounds for click hit-testing
+        pads = footprint.pads if footprint else []
+        self._pad_bounds = np.array(
+            [(p.x - p.width / 2, p.y - p.height / 2, p.x + p.width / 2, p.y + p.height / 2)
+             for p in pads],
+            dtype=np.float64
+        ).reshape(-1, 4)
+
+        if footprint:
+            # Footprint extent with margin (20% of size)
+            min_x, min_y, max_x, max_y = footprint.calculate_bounds()
+            margin_factor = 1.4
+            self._footprint_w = (max_x - min_x) * margin_factor
+            self._footprint_h = (max_y - min_y) * margin_factor
+
+            # Prevent division by zero
+            if self._footprint_w <= 0:
+                self._footprint_w = 10
+            if self._footprint_h <= 0:
+                self._footprint_h = 10
+
+        self._static_pixmap = None
         self.update()  # Trigger repaint
 
+    def resizeEvent(self, event):
+        """Invalidate the cached rendering when the widget size changes."""
+        self._static_pixmap = None
+        super().resizeEvent(event)
+
     def paintEvent(self, event):
-        """Paint the footprint."""
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        """Paint the footprint.
 
-        # Fill background
-        painter.fillRect(self.rect(), self._bg_color)
+        The static layers are rendered once into a pixmap and reused until
+        the footprint or widget size changes; only the selected pad is drawn
+        on top each frame.
+        """
+        painter = QPainter(self)
 
         if not self._footprint:
             # Show placeholder message
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.fillRect(self.rect(), self._bg_color)
             painter.setPen(self._text_color)
-            painter.setFont(QFont("Arial", 12))
+            painter.setFont(self._placeholder_font)
             painter.drawText(self.rect(), Qt.AlignmentFlag.AlignCenter,
                            "No footprint loaded")
             return
 
-        # Calculate scaling to fit footprint in widget
-        widget_w = self.width()
-        widget_h = self.height()
+        if self._static_pixmap is None:
+            self._static_pixmap = self._render_static_layers()
+
+        painter.drawPixmap(0, 0, self._static_pixmap)
+
+        # Overlay selection highlight
+        if self._selected_pad is not None:
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            self._draw_pad(painter, self._selected_pad, self._center_x, self._center_y,
+                           self._scale, selected=True)
+
+    def _render_static_layers(self) -> QPixmap:
+        """Render grid, body, crosshair, pads and dimensions offscreen.
 
-        # Get footprint bounds
-        bounds = self._footprint.calculate_bounds()
-        min_x, min_y, max_x, max_y = bounds
+        Also updates the scale and center used for mouse click handling.
 
-        # Add margin (20% of size)
-        margin_factor = 1.4
-        footprint_w = (max_x - min_x) * margin_factor
-        footprint_h = (max_y - min_y) * margin_factor
+        Returns:
+            Pixmap the size of the widget
+        """
+        ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(round(self.width() * ratio), round(self.height() * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
-        # Prevent division by zero
-        if footprint_w <= 0:
-            footprint_w = 10
-        if footprint_h <= 0:
-            footprint_h = 10
+        # Fill background
+        painter.fillRect(self.rect(), self._bg_color)
 
-        # Calculate scale (pixels per mm)
-        scale_x = widget_w / footprint_w
-        scale_y = widget_h / footprint_h
+        # Calculate scale (pixels per mm) to fit footprint in widget
+        scale_x = self.width() / self._footprint_w
+        scale_y = self.height() / self._footprint_h
         scale = min(scale_x, scale_y)
 
         # Center point in widget coordinates
-        center_x = widget_w / 2
-        center_y = widget_h / 2
+        center_x = self.width() / 2
+        center_y = self.height() / 2
 
         # Store for mouse click handling
         self._scale = scale
@@ -107,7 +164,7 @@ class FootprintPreviewWidget(QWidget):
         self._center_y = center_y
 
         # Draw grid and scale markings
-        self._draw_grid(painter, center_x, center_y, scale, footprint_w, footprint_h)
+        self._draw_grid(painter, center_x, center_y, scale, self._footprint_w, self._footprint_h)
 
         # Draw body outline
         self._draw_body(painter, center_x, center_y, scale)
@@ -121,6 +178,9 @@ class FootprintPreviewWidget(QWidget):
         # Draw dimensions
         self._draw_dimensions(painter, center_x, center_y, scale)
 
+        painter.end()
+        return pixmap
+
     def _draw_grid(self, painter: QPainter, cx: float, cy: float, scale: float,
                    footprint_w: float, footprint_h: float):
         """Draw grid lines and scale markings.
@@ -133,7 +193,7 @@ class FootprintPreviewWidget(QWidget):
             footprint_w: Footprint width in mm
             footprint_h: Footprint height in mm
         """
-        painter.setPen(QPen(self._grid_color, 1))
+        painter.setPen(self._grid_pen)
 
         # Determine grid spacing (1mm, 2mm, 5mm, or 10mm)
         if scale > 50:
@@ -145,39 +205,39 @@ class FootprintPreviewWidget(QWidget):
         else:
             grid_spacing = 10.0
 
-        # Draw vertical grid lines
-        num_lines = int(footprint_w / grid_spacing) + 1
-        for i in range(-num_lines, num_lines + 1):
-            x_mm = i * grid_spacing
-            x_px = cx + x_mm * scale
-            if 0 <= x_px <= self.width():
-                painter.drawLine(QPointF(x_px, 0), QPointF(x_px, self.height()))
+        width = self.width()
+        height = self.height()
 
-        # Draw horizontal grid lines
+        # Grid line offsets from center in mm
+        num_lines = int(footprint_w / grid_spacing) + 1
+        xs_mm = np.arange(-num_lines, num_lines + 1) * grid_spacing
         num_lines = int(footprint_h / grid_spacing) + 1
-        for i in range(-num_lines, num_lines + 1):
-            y_mm = i * grid_spacing
-            y_px = cy + y_mm * scale
-            if 0 <= y_px <= self.height():
-                painter.drawLine(QPointF(0, y_px), QPointF(self.width(), y_px))
+        ys_mm = np.arange(-num_lines, num_lines + 1) * grid_spacing
+
+        # Draw vertical grid lines in one batched call
+        xs_px = cx + xs_mm * scale
+        xs_px = xs_px[(0 <= xs_px) & (xs_px <= width)]
+        painter.drawLines([QLineF(x, 0, x, height) for x in xs_px.tolist()])
+
+        # Draw horizontal grid lines in one batched call
+        ys_px = cy + ys_mm * scale
+        visible_y = (0 <= ys_px) & (ys_px <= height)
+        painter.drawLines([QLineF(0, y, width, y) for y in ys_px[visible_y].tolist()])
 
         # Draw scale markings
         painter.setPen(self._text_color)
-        painter.setFont(QFont("Arial", 8))
+        painter.setFont(self._grid_font)
 
-        # X-axis markings (bottom)
-        for i in range(-num_lines, num_lines + 1):
-            x_mm = i * grid_spacing
-            x_px = cx + x_mm * scale
-            if 0 <= x_px <= self.width() and x_mm != 0:
-                painter.drawText(QPointF(x_px - 15, self.height() - 5), f"{x_mm:.0f}")
+        # X-axis markings (bottom), labelled over the horizontal line range
+        label_xs = cx + ys_mm * scale
+        mask = (0 <= label_xs) & (label_xs <= width) & (ys_mm != 0)
+        for x_mm, x_px in zip(ys_mm[mask].tolist(), label_xs[mask].tolist()):
+            painter.drawText(QPointF(x_px - 15, height - 5), f"{x_mm:.0f}")
 
         # Y-axis markings (left)
-        for i in range(-num_lines, num_lines + 1):
-            y_mm = i * grid_spacing
-            y_px = cy + y_mm * scale
-            if 0 <= y_px <= self.height() and y_mm != 0:
-                painter.drawText(QPointF(5, y_px + 5), f"{y_mm:.0f}")
+        mask = visible_y & (ys_mm != 0)
+        for y_mm, y_px in zip(ys_mm[mask].tolist(), ys_px[mask].tolist()):
+            painter.drawText(QPointF(5, y_px + 5), f"{y_mm:.0f}")
 
     def _draw_center(self, painter: QPainter, cx: float, cy: float, scale: float):
         """Draw center crosshair.
@@ -188,7 +248,7 @@ class FootprintPreviewWidget(QWidget):
             cy: Center Y
             scale: Pixels per mm
         """
-        painter.setPen(QPen(self._center_color, 1, Qt.PenStyle.DashLine))
+        painter.setPen(self._center_pen)
 
         # Crosshair size in mm
         crosshair_size = 2.0 * scale
@@ -212,7 +272,7 @@ class FootprintPreviewWidget(QWidget):
         body_w = self._footprint.body_width * scale
         body_h = self._footprint.body_height * scale
 
-        painter.setPen(QPen(self._body_color, 2))
+        painter.setPen(self._body_pen)
         painter.setBrush(Qt.BrushStyle.NoBrush)
 
         # Draw rectangle centered at origin
@@ -227,6 +287,9 @@ class FootprintPreviewWidget(QWidget):
     def _draw_pads(self, painter: QPainter, cx: float, cy: float, scale: float):
         """Draw all pads.
 
+        Pads are batched by draw state: all unrotated rectangles in one
+        drawRects call, then rotated pads, then every pad number.
+
         Args:
             painter: QPainter object
             cx: Center X
@@ -236,49 +299,99 @@ class FootprintPreviewWidget(QWidget):
         if not self._footprint:
             return
 
-        for pad in self._footprint.pads:
-            # Convert mm to pixels
-            x_px = cx + pad.x * scale
-            y_px = cy + pad.y * scale
-            w_px = pad.width * scale
-            h_px = pad.height * scale
-
-            # Check if this pad is selected
-            is_selected = (self._selected_pad == pad)
-
-            # Set pad color (highlight if selected)
-            if is_selected:
-                painter.setPen(QPen(QColor("#ff6600"), 3))  # Orange highlight
-                painter.setBrush(QBrush(QColor("#ffaa00")))  # Lighter orange fill
-            else:
-                painter.setPen(QPen(self._pad_color, 1))
-                painter.setBrush(QBrush(self._pad_color))
-
-            # Draw pad rectangle
-            rect = QRectF(
-                x_px - w_px / 2,
-                y_px - h_px / 2,
-                w_px,
-                h_px
-            )
-
-            # Apply rotation if needed
-            if pad.rotation != 0:
-                painter.save()
-                painter.translate(x_px, y_px)
-                painter.rotate(pad.rotation)
-                painter.translate(-x_px, -y_px)
+        pads = self._footprint.pads
+        rects = [self._pad_rect(pad, cx, cy, scale) for pad in pads]
 
-            painter.drawRect(rect)
+        painter.setPen(self._pad_pen)
+        painter.setBrush(self._pad_brush)
+
+        painter.drawRects([rect for rect, pad in zip(rects, pads) if pad.rotation == 0])
 
+        for rect, pad in zip(rects, pads):
             if pad.rotation != 0:
-                painter.restore()
+                self._draw_rotated_rect(painter, rect, pad.rotation)
 
-            # Draw pad number
-            painter.setPen(QColor("#000000"))  # Black text on gold pad
-            painter.setFont(QFont("Arial", 8, QFont.Weight.Bold))
+        # Draw pad numbers
+        painter.setPen(self._pad_text_color)
+        painter.setFont(self._label_font)
+        for rect, pad in zip(rects, pads):
             painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, pad.name)
 
+    def _draw_pad(self, painter: QPainter, pad: Pad, cx: float, cy: float, scale: float,
+                  selected: bool = False):
+        """Draw a single pad with its number.
+
+        Args:
+            painter: QPainter object
+            pad: Pad to draw
+            cx: Center X
+            cy: Center Y
+            scale: Pixels per mm
+            selected: If True, draw with the selection highlight
+        """
+        # Set pad color (highlight if selected)
+        if selected:
+            painter.setPen(self._sel_pen)
+            painter.setBrush(self._sel_brush)
+        else:
+            painter.setPen(self._pad_pen)
+            painter.setBrush(self._pad_brush)
+
+        rect = self._pad_rect(pad, cx, cy, scale)
+
+        if pad.rotation != 0:
+            self._draw_rotated_rect(painter, rect, pad.rotation)
+        else:
+            painter.drawRect(rect)
+
+        # Draw pad number
+        painter.setPen(self._pad_text_color)
+        painter.setFont(self._label_font)
+        painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, pad.name)
+
+    @staticmethod
+    def _pad_rect(pad: Pad, cx: float, cy: float, scale: float) -> QRectF:
+        """Get a pad's unrotated rectangle in widget coordinates.
+
+        Args:
+            pad: Pad to convert
+            cx: Center X
+            cy: Center Y
+            scale: Pixels per mm
+
+        Returns:
+            Pad rectangle in pixels
+        """
+        # Convert mm to pixels
+        x_px = cx + pad.x * scale
+        y_px = cy + pad.y * scale
+        w_px = pad.width * scale
+        h_px = pad.height * scale
+
+        return QRectF(
+            x_px - w_px / 2,
+            y_px - h_px / 2,
+            w_px,
+            h_px
+        )
+
+    @staticmethod
+    def _draw_rotated_rect(painter: QPainter, rect: QRectF, rotation: float):
+        """Draw a rectangle rotated about its center.
+
+        Args:
+            painter: QPainter object
+            rect: Unrotated rectangle
+            rotation: Rotation in degrees
+        """
+        center = rect.center()
+        painter.save()
+        painter.translate(center)
+        painter.rotate(rotation)
+        painter.translate(-center)
+        painter.drawRect(rect)
+        painter.restore()
+
     def _draw_dimensions(self, painter: QPainter, cx: float, cy: float, scale: float):
         """Draw dimension annotations.
 
@@ -292,7 +405,7 @@ class FootprintPreviewWidget(QWidget):
             return
 
         painter.setPen(self._text_color)
-        painter.setFont(QFont("Arial", 10))
+        painter.setFont(self._dimension_font)
 
         # Draw body dimensions in top-left corner
         dims_text = f"Body: {self._footprint.body_width:.2f} x {self._footprint.body_height:.2f} mm"
@@ -311,32 +424,22 @@ class FootprintPreviewWidget(QWidget):
         if not self._footprint:
             return
 
-        # Get click position
-        click_x = event.position().x()
-        click_y = event.position().y()
-
-        # Check each pad
-        for pad in self._footprint.pads:
-            # Convert pad position to widget coordinates
-            pad_x_px = self._center_x + pad.x * self._scale
-            pad_y_px = self._center_y + pad.y * self._scale
-            pad_w_px = pad.width * self._scale
-            pad_h_px = pad.height * self._scale
-
-            # Create pad rectangle
-            pad_rect = QRectF(
-                pad_x_px - pad_w_px / 2,
-                pad_y_px - pad_h_px / 2,
-                pad_w_px,
-                pad_h_px
-            )
-
-            # Check if click is inside pad
-            if pad_rect.contains(click_x, click_y):
-                self._selected_pad = pad
-                self.pad_clicked.emit(pad)
-                self.update()  # Repaint with highlight
-                return
+        # Convert click position to mm relative to the footprint center
+        click_x = (event.position().x() - self._center_x) / self._scale
+        click_y = (event.position().y() - self._center_y) / self._scale
+
+        # Test the click against all pad bounds at once
+        bounds = self._pad_bounds
+        hits = ((bounds[:, 0] <= click_x) & (click_x <= bounds[:, 2]) &
+                (bounds[:, 1] <= click_y) & (click_y <= bounds[:, 3]))
+
+        if hits.any():
+            # First matching pad, same as checking pads in order
+            pad = self._footprint.pads[int(np.argmax(hits))]
+            self._selected_pad = pad
+            self.pad_clicked.emit(pad)
+            self.update()  # Repaint with highlight
+            return
 
         # Click outside any pad - deselect
         self._selected_pad = None
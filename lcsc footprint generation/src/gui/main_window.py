@@ -3,34 +3,285 @@
 This module contains the primary GUI window and orchestrates the overall workflow.
 """
 
+import asyncio
+import bisect
+import functools
+import multiprocessing
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 from typing import Optional
 
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QLabel, QFileDialog, QMessageBox,
-    QTableWidget, QTableWidgetItem, QProgressBar,
+    QTableView, QProgressBar,
     QStatusBar, QGroupBox, QSplitter, QHeaderView, QTextEdit,
     QLineEdit, QComboBox
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QMutex, QWaitCondition
+from PyQt6.QtCore import Qt, QSettings, QThread, QTimer, pyqtSignal
 from PyQt6.QtGui import QAction
 
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent))
-from scraper.lcsc_client import LCSCClient, LCSCApiError
-from scraper.footprint_parser import FootprintParser
-from models.footprint import Package
-from models.part import Part
-from gui.footprint_widget import FootprintPreviewWidget
-from openpnp.backup import BackupManager, BackupError
+from ..scraper.lcsc_client import AsyncLCSCClient, LCSCApiError
+from ..scraper.response_cache import get_shared_cache
+from ..scraper.footprint_parser import parse_easyeda_response
+from ..models.footprint import Package
+from ..models.part import Part
+from .footprint_widget import FootprintPreviewWidget
+from .bom_table_model import BomTableModel
+from ..openpnp.backup import BackupManager, BackupError
+from ..openpnp.lockcheck import is_openpnp_running
 from datetime import datetime
 
+# Skip per-file custom icon lookups, which stall on network shares and
+# large directories
+_FILE_DIALOG_OPTIONS = QFileDialog.Option.DontUseCustomDirectoryIcons
+
+# C/R/L component prefix on a size code (C0402 -> 0402)
+_NOZZLE_PREFIX_RE = re.compile(r'^[CRL](?=\d)')
+
+# Leading size code of a cleaned footprint name (0402_1005Metric -> 0402)
+_SIZE_CODE_RE = re.compile(r'\d+')
+
+# Package patterns -> nozzle name (shifted one size smaller)
+_NOZZLE_PATTERNS = (
+    ('CN040', ('01005', '0201', '0402')),
+    ('CN065', ('0603', '0805')),
+    ('CN140', ('1206', '1210')),
+    ('CN220', ('1812', '2512', 'SOT-23', 'SOT-223', 'SOD-123',
+               'SOIC', 'TSSOP', 'QFN', 'DFN')),
+    ('CN400', ('QFP', 'PLCC', 'LQFP', 'TQFP')),
+    ('CN750', ('CONNECTOR', 'SHIELD', 'LARGE')),
+)
+
+# Nozzle mapping for the edit combo (adjusted per user request - one size smaller)
+_EDIT_NOZZLE_PATTERNS = (
+    ('CN040', ('01005', '0201', '0402')),
+    ('CN065', ('0603', '0805')),
+    ('CN140', ('1206', '1210')),
+    ('CN220', ('1812', '2512', 'SOT-23', 'SOT-223', 'SOT-89')),
+    ('CN400', ('SOIC', 'SOP', 'TSSOP', 'QFP', 'LQFP')),
+)
+
+
+def _build_nozzle_lookup(nozzle_patterns: tuple) -> tuple:
+    """Flatten a nozzle pattern table for matching.
+
+    Args:
+        nozzle_patterns: (nozzle name, package patterns) pairs
+
+    Returns:
+        Tuple of (size code -> nozzle dict, (pattern, nozzle) pairs with
+        the longest, most specific patterns first)
+    """
+    pairs = sorted(
+        ((pattern, nozzle) for nozzle, patterns in nozzle_patterns for pattern in patterns),
+        key=lambda pair: -len(pair[0])
+    )
+    sizes = {pattern: nozzle for pattern, nozzle in pairs if pattern.isdigit()}
+    return sizes, tuple(pairs)
+
+
+def _match_nozzle(footprint_name: str, lookup: tuple, default: str) -> str:
+    """Pick a nozzle name for a footprint.
+
+    Args:
+        footprint_name: Footprint name (e.g., "C0402", "SOT-23")
+        lookup: Table built by _build_nozzle_lookup()
+        default: Nozzle to use when nothing matches
+
+    Returns:
+        Nozzle name (e.g., "CN040")
+    """
+    # Remove C/R/L prefix if followed by digits (C0402 → 0402, R0603 → 0603)
+    name_clean = _NOZZLE_PREFIX_RE.sub('', footprint_name.upper())
+    sizes, pairs = lookup
+
+    size_code = _SIZE_CODE_RE.match(name_clean)
+    if size_code and size_code.group() in sizes:
+        return sizes[size_code.group()]
+    return next((nozzle for pattern, nozzle in pairs if pattern in name_clean), default)
+
+
+_NOZZLE_LOOKUP = _build_nozzle_lookup(_NOZZLE_PATTERNS)
+_EDIT_NOZZLE_LOOKUP = _build_nozzle_lookup(_EDIT_NOZZLE_PATTERNS)
+
+
+@functools.lru_cache(maxsize=512)
+def _resolve_nozzle_name(footprint_name: str, for_edit: bool = False) -> str:
+    """Pick the nozzle name for a footprint, memoized per footprint.
+
+    A BOM repeats the same few footprints across many rows.
+
+    Args:
+        footprint_name: Footprint name (e.g., "C0402", "SOT-23")
+        for_edit: Use the edit combo's table and default (CN140) instead
+            of the processing table and default (CN065)
+
+    Returns:
+        Nozzle name (e.g., "CN040")
+    """
+    if for_edit:
+        return _match_nozzle(footprint_name, _EDIT_NOZZLE_LOOKUP, 'CN140')
+    return _match_nozzle(footprint_name, _NOZZLE_LOOKUP, 'CN065')
+
+
+# Application stylesheet for dark mode
+_DARK_STYLESHEET = """
+    QMainWindow, QWidget {
+        background-color: #2b2b2b;
+        color: #f0f0f0;
+    }
+    QGroupBox {
+        border: 1px solid #555555;
+        border-radius: 5px;
+        margin-top: 10px;
+        padding-top: 10px;
+        color: #f0f0f0;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        subcontrol-position: top left;
+        padding: 0 5px;
+        color: #f0f0f0;
+    }
+    QPushButton {
+        background-color: #3d3d3d;
+        border: 1px solid #555555;
+        border-radius: 3px;
+        padding: 5px 15px;
+        color: #f0f0f0;
+    }
+    QPushButton:hover {
+        background-color: #4a4a4a;
+    }
+    QPushButton:pressed {
+        background-color: #2a2a2a;
+    }
+    QPushButton:disabled {
+        background-color: #2b2b2b;
+        color: #666666;
+    }
+    QLineEdit, QComboBox, QTextEdit {
+        background-color: #3d3d3d;
+        border: 1px solid #555555;
+        border-radius: 3px;
+        padding: 3px;
+        color: #f0f0f0;
+    }
+    QComboBox::drop-down {
+        border: none;
+    }
+    QComboBox::down-arrow {
+        image: none;
+        border-left: 5px solid transparent;
+        border-right: 5px solid transparent;
+        border-top: 5px solid #f0f0f0;
+    }
+    QTableView {
+        background-color: #3d3d3d;
+        alternate-background-color: #353535;
+        border: 1px solid #555555;
+        color: #f0f0f0;
+        gridline-color: #555555;
+    }
+    QTableView::item {
+        padding: 5px;
+    }
+    QTableView::item:selected {
+        background-color: #0078d4;
+        color: #ffffff;
+    }
+    QHeaderView::section {
+        background-color: #3d3d3d;
+        color: #f0f0f0;
+        padding: 5px;
+        border: 1px solid #555555;
+    }
+    QLabel {
+        color: #f0f0f0;
+    }
+    QProgressBar {
+        border: 1px solid #555555;
+        border-radius: 3px;
+        text-align: center;
+        color: #f0f0f0;
+    }
+    QProgressBar::chunk {
+        background-color: #0078d4;
+    }
+    QStatusBar {
+        background-color: #2b2b2b;
+        color: #f0f0f0;
+    }
+    QMenuBar {
+        background-color: #2b2b2b;
+        color: #f0f0f0;
+    }
+    QMenuBar::item:selected {
+        background-color: #3d3d3d;
+    }
+    QMenu {
+        background-color: #2b2b2b;
+        color: #f0f0f0;
+        border: 1px solid #555555;
+    }
+    QMenu::item:selected {
+        background-color: #0078d4;
+    }
+    QTextBrowser {
+        background-color: #3d3d3d;
+        color: #f0f0f0;
+        border: 1px solid #555555;
+    }
+"""
+
+# Footprint parsing is CPU-bound; it runs in worker processes so it
+# doesn't hold the GIL shared with the GUI thread
+_PARSE_POOL: Optional[ProcessPoolExecutor] = None
+
+
+def _get_parse_pool() -> ProcessPoolExecutor:
+    """Get the shared footprint parse pool, creating it on first use."""
+    global _PARSE_POOL
+    if _PARSE_POOL is None:
+        workers = min(os.cpu_count() or 1, FootprintFetchWorker.MAX_CONCURRENT_FETCHES)
+        # Never fork: the pool starts from a worker thread while Qt and the
+        # cache threads are running, and a forked child can deadlock on
+        # locks those threads held
+        _PARSE_POOL = ProcessPoolExecutor(max_workers=workers,
+                                          mp_context=multiprocessing.get_context("spawn"))
+    return _PARSE_POOL
+
+
+def _discard_parse_pool(pool: ProcessPoolExecutor):
+    """Drop a broken parse pool so the next use starts a fresh one.
+
+    Args:
+        pool: The pool that failed; a newer pool is left alone
+    """
+    global _PARSE_POOL
+    if _PARSE_POOL is pool:
+        _PARSE_POOL = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def shutdown_parse_pool():
+    """Stop the footprint parse worker processes, if started."""
+    global _PARSE_POOL
+    if _PARSE_POOL is not None:
+        _PARSE_POOL.shutdown(wait=False, cancel_futures=True)
+        _PARSE_POOL = None
+
 
 class FootprintFetchWorker(QThread):
     """Worker thread for fetching footprints from LCSC.
 
-    Waits for user confirmation (via proceed() call) before fetching next footprint.
+    Components are fetched concurrently in the background, but results are
+    still shown one at a time: the worker waits for user confirmation (via
+    proceed() call) before emitting the next footprint.
 
     Signals:
         progress: Emitted with (current, total, status_message)
@@ -44,6 +295,9 @@ class FootprintFetchWorker(QThread):
     error = pyqtSignal(str, str)  # name, error_message
     finished = pyqtSignal()
 
+    # Components fetched ahead of the one awaiting confirmation
+    MAX_CONCURRENT_FETCHES = 8
+
     def __init__(self, footprint_groups: list, session_id: str):
         """Initialize worker.
 
@@ -54,70 +308,170 @@ class FootprintFetchWorker(QThread):
         super().__init__()
         self._groups = footprint_groups
         self._session_id = session_id
-        self._client = None
-        self._parser = None
-        self._mutex = QMutex()
-        self._wait_condition = QWaitCondition()
-        self._can_proceed = False
+        # Created on the worker's event loop; set from the GUI thread
+        # through call_soon_threadsafe
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._proceed_event: Optional[asyncio.Event] = None
+        self._interrupt_event: Optional[asyncio.Event] = None
 
     def proceed(self):
         """Signal that worker can proceed to next footprint.
 
         Called by GUI when user clicks Confirm or Skip.
         """
-        self._mutex.lock()
-        self._can_proceed = True
-        self._wait_condition.wakeOne()
-        self._mutex.unlock()
+        self._set_threadsafe(self._proceed_event)
+
+    def requestInterruption(self):
+        """Request interruption and wake any pending wait."""
+        super().requestInterruption()
+        self._set_threadsafe(self._interrupt_event)
+
+    def _set_threadsafe(self, event: Optional[asyncio.Event]):
+        """Set an event on the worker loop from another thread."""
+        loop = self._loop
+        if loop is None or event is None:
+            return
+        try:
+            loop.call_soon_threadsafe(event.set)
+        except RuntimeError:
+            # Loop already closed; the worker has finished
+            pass
 
     def run(self):
         """Fetch footprints in background thread."""
-        self._client = LCSCClient()
-        self._parser = FootprintParser()
+        asyncio.run(self._fetch_all())
 
-        total = len(self._groups)
+        self.finished.emit()
 
-        for i, group in enumerate(self._groups):
-            if self.isInterruptionRequested():
-                break
+    async def _fetch_all(self):
+        """Fetch all components concurrently and emit them in order."""
+        self._proceed_event = asyncio.Event()
+        self._interrupt_event = asyncio.Event()
+        self._loop = asyncio.get_running_loop()
+        if self.isInterruptionRequested():
+            return
 
-            footprint_name = group.footprint_name
-            lcsc_id = group.lcsc_number
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_FETCHES)
+        total = len(self._groups)
+        # Every package in the session records the same import time
+        import_date = datetime.now().isoformat()
+
+        async with AsyncLCSCClient(cache=get_shared_cache()) as client:
+            async def fetch(group):
+                async with semaphore:
+                    component = await client.fetch_component(group.lcsc_number)
+                args = (component.footprint_data, group.footprint_name,
+                        group.lcsc_number, self._session_id, import_date)
+                # Parse in a worker process while later fetches continue
+                pool = _get_parse_pool()
+                try:
+                    return await self._loop.run_in_executor(pool, parse_easyeda_response, *args)
+                except BrokenProcessPool:
+                    # A worker died; replace the pool for later footprints
+                    # and parse this one here instead of failing it
+                    _discard_parse_pool(pool)
+                    return parse_easyeda_response(*args)
 
-            self.progress.emit(i + 1, total, f"Fetching {footprint_name} ({lcsc_id})...")
+            tasks = [asyncio.ensure_future(fetch(g)) for g in self._groups]
 
             try:
-                # Fetch component data from LCSC
-                component = self._client.fetch_component(lcsc_id)
-
-                # Parse footprint with metadata
-                package = self._parser.parse(
-                    component.footprint_data,
-                    footprint_name,
-                    lcsc_id=lcsc_id,
-                    session_id=self._session_id
-                )
+                for i, (group, task) in enumerate(zip(self._groups, tasks)):
+                    footprint_name = group.footprint_name
+                    lcsc_id = group.lcsc_number
 
-                # Emit success
-                self.footprint_fetched.emit(footprint_name, package, lcsc_id)
+                    self.progress.emit(i + 1, total, f"Fetching {footprint_name} ({lcsc_id})...")
 
-            except LCSCApiError as e:
-                self.error.emit(footprint_name, f"API Error: {e}")
-            except Exception as e:
-                self.error.emit(footprint_name, f"Parse Error: {e}")
+                    # Clear before emitting so an immediate proceed() isn't lost
+                    self._proceed_event.clear()
 
-            # Wait for user to confirm/skip before proceeding to next
-            self._mutex.lock()
-            self._can_proceed = False
-            while not self._can_proceed and not self.isInterruptionRequested():
-                self._wait_condition.wait(self._mutex)
-            self._mutex.unlock()
+                    if not await self._wait_or_interrupt(task):
+                        break
 
-        # Cleanup
-        if self._client and self._client._client:
-            self._client._client.close()
+                    try:
+                        # Fetched and parsed footprint with metadata
+                        package = task.result()
+
+                        # Emit success
+                        self.footprint_fetched.emit(footprint_name, package, lcsc_id)
+
+                    except LCSCApiError as e:
+                        self.error.emit(footprint_name, f"API Error: {e}")
+                    except Exception as e:
+                        self.error.emit(footprint_name, f"Parse Error: {e}")
+
+                    # Wait for user to confirm/skip before proceeding to next;
+                    # later fetches keep running on the loop meanwhile
+                    if not await self._wait_or_interrupt(self._proceed_event.wait()):
+                        break
+            finally:
+                # Cleanup
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _wait_or_interrupt(self, awaitable) -> bool:
+        """Wait for an awaitable unless interruption is requested first.
 
-        self.finished.emit()
+        Returns:
+            True if the awaitable completed, False if interrupted
+        """
+        future = asyncio.ensure_future(awaitable)
+        interrupted = asyncio.ensure_future(self._interrupt_event.wait())
+        try:
+            await asyncio.wait({future, interrupted}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            interrupted.cancel()
+        if self.isInterruptionRequested():
+            future.cancel()
+            return False
+        return True
+
+
+class BomParseWorker(QThread):
+    """Worker thread for parsing a BOM file.
+
+    Entries are emitted in chunks as they are built so the table can fill
+    in while the rest of the file is converted.
+
+    Signals:
+        chunk_ready: Emitted with a list of BomEntry objects
+        parsed: Emitted with (entries, footprint_groups) when parsing completes
+        error: Emitted with the exception if parsing fails
+    """
+
+    chunk_ready = pyqtSignal(list)
+    parsed = pyqtSignal(list, list)  # entries, groups
+    error = pyqtSignal(object)
+
+    # BOM entries per chunk_ready signal
+    CHUNK_SIZE = 1000
+
+    def __init__(self, parser, bom_path: Path):
+        """Initialize worker.
+
+        Args:
+            parser: BomParser to parse with
+            bom_path: Path to the BOM file
+        """
+        super().__init__()
+        self._parser = parser
+        self._bom_path = bom_path
+
+    def run(self):
+        """Parse the BOM in background thread."""
+        try:
+            entries = []
+            for chunk in self._parser.parse_iter(self._bom_path, self.CHUNK_SIZE):
+                if self.isInterruptionRequested():
+                    return
+                entries.extend(chunk)
+                self.chunk_ready.emit(chunk)
+            groups = self._parser.group_by_footprint(entries)
+        except Exception as e:
+            self.error.emit(e)
+            return
+
+        self.parsed.emit(entries, groups)
 
 
 class MainWindow(QMainWindow):
@@ -141,9 +495,20 @@ class MainWindow(QMainWindow):
         self._openpnp_config_path: Optional[Path] = None
         self._bom_entries: list = []  # List of BomEntry objects
         self._footprint_groups: list = []  # List of FootprintGroup objects
+        self._bom_parser = None  # BomParser, kept so column mappings are reused on reload
+        self._bom_worker: Optional[BomParseWorker] = None
         self._nozzle_tips: list = []  # List of (id, name) tuples for nozzle tips
+        self._rows_by_fp_lcsc: dict = {}  # (base_footprint, lcsc_number) -> BOM table rows
+        self._entries_by_base_footprint: dict = {}  # base_footprint -> {part_id: first BomEntry}
+        self._rows_by_base_footprint: dict = {}  # base_footprint -> BOM table rows
+        self._nozzle_tip_cache: dict = {}  # (machine.xml path, mtime_ns) -> nozzle tips
+        self._nozzle_index_cache: dict = {}  # (nozzle code, match on ID) -> combo index or None
+        self._nozzle_ids_sorted: list = []  # (tip ID, combo index) pairs sorted for prefix lookups
+        self._confirmed_closed_configs: set = set()  # Config dirs the user said OpenPnP is closed for
         self._packages_manager = None  # PackagesManager instance
+        self._backup_manager: Optional[BackupManager] = None  # For the current config path
         self._parts_manager = None  # PartsManager instance
+        self._mgr_cache: dict = {}  # file path -> ((mtime_ns, size), loaded manager)
         self._analysis_results = None  # Analysis results dict
 
         # Processing state
@@ -153,11 +518,20 @@ class MainWindow(QMainWindow):
         self._current_lcsc_id: Optional[str] = None
         self._worker: Optional[FootprintFetchWorker] = None
         self._confirmed_packages: list = []  # List of (Package, footprint_name, lcsc_id, height, nozzle) tuples
+        self._confirmed_index: dict = {}  # (footprint_name, lcsc_id) -> first index in _confirmed_packages
         self._confirmed_packages_map: dict = {}  # Map (footprint_name, lcsc_id, value) -> Package for lookup
+        self._footprint_to_package: dict = {}  # base_footprint -> latest confirmed Package
         self._current_session_id: Optional[str] = None  # Current import session ID
         self._footprints_fetched: int = 0  # Counter for fetched footprints
         self._selected_bom_row: Optional[int] = None  # Currently selected BOM row for editing
 
+        # Worker progress is applied at most ~30 times a second
+        self._pending_progress: Optional[tuple] = None  # (current, total, message)
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.setInterval(33)
+        self._progress_timer.timeout.connect(self._flush_progress)
+
         self._setup_ui()
         self._setup_menu()
         self._setup_statusbar()
@@ -246,16 +620,22 @@ class MainWindow(QMainWindow):
         group = QGroupBox("BOM Contents")
         layout = QVBoxLayout(group)
         
-        self._bom_table = QTableWidget()
-        self._bom_table.setColumnCount(8)
-        self._bom_table.setHorizontalHeaderLabels([
-            "Reference", "Value", "OpenPnP Part Name", "Footprint", "LCSC #", "Height (mm)", "Nozzle", "Status"
-        ])
+        self._bom_model = BomTableModel(self)
+        self._bom_table = QTableView()
+        self._bom_table.setModel(self._bom_model)
         header = self._bom_table.horizontalHeader()
         header.setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
-        self._bom_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self._bom_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)  # Make table read-only
-        self._bom_table.cellClicked.connect(self._on_bom_row_clicked)
+        # Every row is one line of text; fixed heights let the view lay out
+        # rows by arithmetic instead of tracking a size per section
+        rows_header = self._bom_table.verticalHeader()
+        rows_header.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        rows_header.setDefaultSectionSize(self._bom_table.fontMetrics().height() + 6)
+        self._bom_table.setWordWrap(False)
+        self._bom_table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        self._bom_table.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)  # Make table read-only
+        self._bom_table.clicked.connect(
+            lambda index: self._on_bom_row_clicked(index.row(), index.column())
+        )
 
         layout.addWidget(self._bom_table)
         
@@ -346,7 +726,22 @@ class MainWindow(QMainWindow):
         btn_layout.addWidget(self._skip_btn)
         layout.addLayout(btn_layout)
 
-        # Edit section (for clicking BOM rows after processing)
+        # Edit section (for clicking BOM rows after processing); built on
+        # first use since many sessions never edit a row
+        self._edit_group: Optional[QGroupBox] = None
+        self._edit_section_layout = layout
+
+        return group
+
+    def _ensure_edit_group(self) -> QGroupBox:
+        """Get the edit section, creating it on first use.
+
+        Returns:
+            The "Edit Selected Part" group box (initially hidden)
+        """
+        if self._edit_group is not None:
+            return self._edit_group
+
         self._edit_group = QGroupBox("Edit Selected Part")
         edit_layout = QVBoxLayout(self._edit_group)
 
@@ -365,6 +760,8 @@ class MainWindow(QMainWindow):
         edit_nozzle_row.addWidget(QLabel("Nozzle Tip:"))
         self._edit_nozzle_combo = QComboBox()
         self._edit_nozzle_combo.setMaximumWidth(150)
+        for tip_id, name in self._nozzle_tips:
+            self._edit_nozzle_combo.addItem(name, tip_id)
         edit_nozzle_row.addWidget(self._edit_nozzle_combo)
         edit_nozzle_row.addStretch()
         edit_layout.addLayout(edit_nozzle_row)
@@ -376,12 +773,11 @@ class MainWindow(QMainWindow):
         apply_btn_layout.addWidget(self._apply_changes_btn)
         edit_layout.addLayout(apply_btn_layout)
 
-        layout.addWidget(self._edit_group)
-
-        # Initially hide edit section
+        # Initially hidden, at the end of the preview section
         self._edit_group.setVisible(False)
+        self._edit_section_layout.addWidget(self._edit_group)
 
-        return group
+        return self._edit_group
     
     def _create_action_section(self) -> QHBoxLayout:
         """Create the action buttons and progress section."""
@@ -463,7 +859,7 @@ class MainWindow(QMainWindow):
     
     def _detect_openpnp_config(self):
         """Auto-detect OpenPnP configuration directory."""
-        from openpnp.config import find_openpnp_config
+        from ..openpnp.config import find_openpnp_config
         
         config_path = find_openpnp_config()
         if config_path:
@@ -479,6 +875,8 @@ class MainWindow(QMainWindow):
             path: Path to .openpnp2 directory
         """
         self._openpnp_config_path = path
+        self._backup_manager = BackupManager(path / "footprint_manager_backups", path)
+        self._forget_loaded_managers()
         self._config_label.setText(str(path))
         self._config_label.setStyleSheet("color: green;")
         self._statusbar.showMessage(f"OpenPnP config: {path}")
@@ -498,10 +896,12 @@ class MainWindow(QMainWindow):
         path = QFileDialog.getExistingDirectory(
             self,
             "Select OpenPnP Configuration Directory",
-            str(Path.home())
+            self._dialog_start_dir("dialogs/config_dir"),
+            QFileDialog.Option.ShowDirsOnly | _FILE_DIALOG_OPTIONS
         )
         if path:
             config_path = Path(path)
+            self._remember_dialog_dir("dialogs/config_dir", config_path.parent)
             # Verify it looks like an OpenPnP config
             if (config_path / "packages.xml").exists():
                 self._set_openpnp_config(config_path)
@@ -513,90 +913,186 @@ class MainWindow(QMainWindow):
                     "Expected to find packages.xml in the directory."
                 )
     
+    def _dialog_start_dir(self, key: str) -> str:
+        """Get the directory a file dialog should open in.
+
+        Args:
+            key: Settings key the directory was remembered under
+
+        Returns:
+            Last used directory if it still exists, otherwise the home directory
+        """
+        last_dir = QSettings().value(key, "", type=str)
+        if last_dir and Path(last_dir).is_dir():
+            return last_dir
+        return str(Path.home())
+
+    def _remember_dialog_dir(self, key: str, directory: Path):
+        """Remember a file dialog directory for next time.
+
+        Args:
+            key: Settings key to store the directory under
+            directory: Directory to open in next time
+        """
+        QSettings().setValue(key, str(directory))
+
     def _load_bom(self):
         """Load a BOM file."""
         path, _ = QFileDialog.getOpenFileName(
             self,
             "Load BOM File",
-            str(Path.home()),
-            "BOM Files (*.csv *.xlsx *.xls);;All Files (*)"
+            self._dialog_start_dir("dialogs/bom_dir"),
+            "BOM Files (*.csv *.xlsx *.xls);;All Files (*)",
+            options=_FILE_DIALOG_OPTIONS
         )
         if path:
             self._bom_path = Path(path)
+            self._remember_dialog_dir("dialogs/bom_dir", self._bom_path.parent)
             self._bom_label.setText(self._bom_path.name)
-            self._analyze_btn.setEnabled(True)
             self._statusbar.showMessage(f"Loaded BOM: {path}")
             
             # TODO: Parse BOM and populate table
             self._parse_and_display_bom()
     
     def _parse_and_display_bom(self):
-        """Parse the loaded BOM and display in table."""
+        """Start parsing the loaded BOM; rows are added to the table as they arrive."""
         if not self._bom_path:
             return
 
-        try:
-            from bom.parser import BomParser, BomParseError
-
-            parser = BomParser()
-            self._bom_entries = parser.parse(self._bom_path)
-            self._footprint_groups = parser.group_by_footprint(self._bom_entries)
-
-            # Populate the table
-            self._bom_table.setRowCount(len(self._bom_entries))
-
-            for row, entry in enumerate(self._bom_entries):
-                # Reference
-                self._bom_table.setItem(row, 0, QTableWidgetItem(entry.reference))
-                # Value
-                self._bom_table.setItem(row, 1, QTableWidgetItem(entry.value))
-                # OpenPnP Part Name
-                self._bom_table.setItem(row, 2, QTableWidgetItem(entry.part_id))
-                # Footprint
-                self._bom_table.setItem(row, 3, QTableWidgetItem(entry.footprint_name))
-                # LCSC #
-                lcsc_text = entry.lcsc_number if entry.lcsc_number else ""
-                self._bom_table.setItem(row, 4, QTableWidgetItem(lcsc_text))
-                # Height
-                height_item = QTableWidgetItem("0.5")
-                self._bom_table.setItem(row, 5, height_item)
-                # Nozzle (initially empty, set during processing)
-                nozzle_item = QTableWidgetItem("")
-                self._bom_table.setItem(row, 6, nozzle_item)
-                # Status
-                status_text = "Has LCSC" if entry.has_lcsc else "No LCSC"
-                self._bom_table.setItem(row, 7, QTableWidgetItem(status_text))
-
-            # Update summary
-            total = len(self._bom_entries)
-            with_lcsc = sum(1 for e in self._bom_entries if e.has_lcsc)
-            without_lcsc = total - with_lcsc
-            unique_footprints = len(self._footprint_groups)
-
-            self._total_label.setText(f"Total: {total}")
-            self._new_parts_label.setText(f"With LCSC: {with_lcsc}")
-            self._new_footprints_label.setText(f"Unique Footprints: {unique_footprints}")
-            self._skip_label.setText(f"No LCSC: {without_lcsc}")
+        from ..bom.parser import BomParser
 
-            self._statusbar.showMessage(
-                f"Parsed {total} entries, {unique_footprints} unique footprints"
+        if self._bom_parser is None:
+            self._bom_parser = BomParser()
+
+        # Stop a worker still parsing a previous BOM; anything it already
+        # queued is ignored since it is no longer the current worker
+        if self._bom_worker is not None and self._bom_worker.isRunning():
+            self._bom_worker.requestInterruption()
+            self._bom_worker.wait()
+
+        self._bom_entries = []
+        self._footprint_groups = []
+        self._rows_by_fp_lcsc = {}
+        self._entries_by_base_footprint = {}
+        self._rows_by_base_footprint = {}
+        self._bom_model.load([])
+        # Enabled again once every entry has arrived
+        self._analyze_btn.setEnabled(False)
+
+        self._bom_worker = BomParseWorker(self._bom_parser, self._bom_path)
+        queued = Qt.ConnectionType.QueuedConnection
+        self._bom_worker.chunk_ready.connect(self._on_bom_chunk, queued)
+        self._bom_worker.parsed.connect(self._on_bom_parsed, queued)
+        self._bom_worker.error.connect(self._on_bom_parse_error, queued)
+        self._bom_worker.start()
+
+    def _on_bom_chunk(self, entries: list):
+        """Append a chunk of parsed BOM entries to the table.
+
+        Args:
+            entries: BomEntry objects in file order
+        """
+        if self.sender() is not self._bom_worker:
+            return
+        # The view only renders visible rows
+        self._bom_model.append_rows(entries)
+
+    def _on_bom_parsed(self, entries: list, groups: list):
+        """Handle BOM parse completion.
+
+        Args:
+            entries: All parsed BomEntry objects
+            groups: FootprintGroup objects for the entries
+        """
+        if self.sender() is not self._bom_worker:
+            return
+
+        self._bom_entries = entries
+        self._footprint_groups = groups
+        self._rows_by_fp_lcsc = {}
+        self._entries_by_base_footprint = {}
+        self._rows_by_base_footprint = {}
+        for row, entry in enumerate(self._bom_entries):
+            key = (entry.base_footprint, entry.lcsc_number)
+            self._rows_by_fp_lcsc.setdefault(key, []).append(row)
+            self._rows_by_base_footprint.setdefault(entry.base_footprint, []).append(row)
+            self._entries_by_base_footprint.setdefault(entry.base_footprint, {}).setdefault(
+                entry.part_id, entry
             )
 
-        except BomParseError as e:
+        # Update summary
+        total = len(self._bom_entries)
+        with_lcsc = self._bom_model.lcsc_count
+        without_lcsc = total - with_lcsc
+        unique_footprints = len(self._footprint_groups)
+
+        self._total_label.setText(f"Total: {total}")
+        self._new_parts_label.setText(f"With LCSC: {with_lcsc}")
+        self._new_footprints_label.setText(f"Unique Footprints: {unique_footprints}")
+        self._skip_label.setText(f"No LCSC: {without_lcsc}")
+        self._analyze_btn.setEnabled(True)
+
+        self._statusbar.showMessage(
+            f"Parsed {total} entries, {unique_footprints} unique footprints"
+        )
+
+    def _on_bom_parse_error(self, error: Exception):
+        """Handle a BOM parse failure.
+
+        Args:
+            error: Exception raised while parsing
+        """
+        if self.sender() is not self._bom_worker:
+            return
+
+        # Drop rows streamed in before the failure; there are no entries
+        # behind them, and Analyze stays disabled
+        self._bom_model.load([])
+
+        from ..bom.parser import BomParseError
+
+        if isinstance(error, BomParseError):
             QMessageBox.critical(
                 self,
                 "BOM Parse Error",
-                f"Failed to parse BOM file:\n{e}"
+                f"Failed to parse BOM file:\n{error}"
             )
-            self._statusbar.showMessage(f"Error parsing BOM: {e}")
-        except Exception as e:
+            self._statusbar.showMessage(f"Error parsing BOM: {error}")
+        else:
             QMessageBox.critical(
                 self,
                 "Error",
-                f"Unexpected error parsing BOM:\n{e}"
+                f"Unexpected error parsing BOM:\n{error}"
             )
-            self._statusbar.showMessage(f"Error: {e}")
+            self._statusbar.showMessage(f"Error: {error}")
     
+    def _confirm_openpnp_closed(self) -> bool:
+        """Ask the user to confirm OpenPnP is closed.
+
+        Returns:
+            True if the user confirmed, False otherwise
+        """
+        # CRITICAL: Warn user that OpenPnP must be closed
+        reply = QMessageBox.warning(
+            self,
+            "OpenPnP Must Be Closed",
+            "IMPORTANT: OpenPnP must be closed before analyzing and importing footprints.\n\n"
+            "If OpenPnP is open, it will overwrite any changes made by this tool when it closes, "
+            "and all your work will be lost.\n\n"
+            "Is OpenPnP currently closed?",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+            QMessageBox.StandardButton.No
+        )
+
+        if reply == QMessageBox.StandardButton.No:
+            QMessageBox.information(
+                self,
+                "Please Close OpenPnP",
+                "Please close OpenPnP and click 'Analyze BOM' again when ready."
+            )
+            return False
+        return True
+
     def _analyze_bom(self):
         """Analyze BOM against existing OpenPnP configuration."""
         if not self._bom_entries:
@@ -615,29 +1111,25 @@ class MainWindow(QMainWindow):
             )
             return
 
-        # CRITICAL: Warn user that OpenPnP must be closed
-        reply = QMessageBox.warning(
-            self,
-            "OpenPnP Must Be Closed",
-            "IMPORTANT: OpenPnP must be closed before analyzing and importing footprints.\n\n"
-            "If OpenPnP is open, it will overwrite any changes made by this tool when it closes, "
-            "and all your work will be lost.\n\n"
-            "Is OpenPnP currently closed?",
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-            QMessageBox.StandardButton.No
-        )
-
-        if reply == QMessageBox.StandardButton.No:
-            QMessageBox.information(
+        # A held lock means OpenPnP definitely has the files open
+        if is_openpnp_running(self._openpnp_config_path):
+            QMessageBox.warning(
                 self,
-                "Please Close OpenPnP",
+                "OpenPnP Is Running",
+                "OpenPnP appears to have its configuration files open.\n\n"
                 "Please close OpenPnP and click 'Analyze BOM' again when ready."
             )
             return
 
+        # No lock doesn't prove OpenPnP is closed, so ask once per config directory
+        if self._openpnp_config_path not in self._confirmed_closed_configs:
+            if not self._confirm_openpnp_closed():
+                return
+            self._confirmed_closed_configs.add(self._openpnp_config_path)
+
         try:
-            from openpnp.packages_manager import PackagesManager, PackagesManagerError
-            from openpnp.parts_manager import PartsManager, PartsManagerError
+            from ..openpnp.packages_manager import PackagesManager, PackagesManagerError
+            from ..openpnp.parts_manager import PartsManager, PartsManagerError
 
             # Load OpenPnP files
             self._statusbar.showMessage("Loading OpenPnP configuration...")
@@ -645,11 +1137,8 @@ class MainWindow(QMainWindow):
             packages_file = self._openpnp_config_path / "packages.xml"
             parts_file = self._openpnp_config_path / "parts.xml"
 
-            self._packages_manager = PackagesManager(packages_file)
-            self._packages_manager.load()
-
-            self._parts_manager = PartsManager(parts_file)
-            self._parts_manager.load()
+            self._packages_manager = self._load_manager(PackagesManager, packages_file)
+            self._parts_manager = self._load_manager(PartsManager, parts_file)
 
             # Check for backups and enable restore button if any exist
             self._check_and_enable_restore_button()
@@ -692,50 +1181,69 @@ class MainWindow(QMainWindow):
         Returns:
             Dict with analysis results
         """
-        results = {
-            "existing_footprints": [],
-            "new_footprints": [],
-            "existing_parts": [],
-            "new_parts": [],
-            "no_lcsc": [],
-            "existing_footprints_count": 0,
-            "new_footprints_count": 0,
-            "existing_parts_count": 0,
-            "new_parts_count": 0,
-            "no_lcsc_count": 0
-        }
-
-        # Check footprints (only those with LCSC numbers)
-        for group in self._footprint_groups:
-            # Skip groups without LCSC numbers - we can't fetch these
-            if not group.has_lcsc:
-                continue
+        existing_pkgs = self._packages_manager.package_ids()
+        existing_parts = self._parts_manager.part_ids()
 
-            if self._packages_manager.has_package(group.footprint_name):
-                results["existing_footprints"].append(group.footprint_name)
-            else:
-                results["new_footprints"].append(group.footprint_name)
+        # Check footprints (only those with LCSC numbers - we can't fetch the rest)
+        fetchable = [g.footprint_name for g in self._footprint_groups if g.has_lcsc]
+        existing_footprints = [name for name in fetchable if name in existing_pkgs]
+        new_footprints = [name for name in fetchable if name not in existing_pkgs]
 
         # Check parts
-        for entry in self._bom_entries:
-            if not entry.has_lcsc:
-                results["no_lcsc"].append(entry)
-                continue
-
-            part_id = entry.part_id
-            if self._parts_manager.has_part(part_id):
-                results["existing_parts"].append(entry)
-            else:
-                results["new_parts"].append(entry)
+        with_lcsc = [e for e in self._bom_entries if e.has_lcsc]
+        no_lcsc = [e for e in self._bom_entries if not e.has_lcsc]
+        existing = [e for e in with_lcsc if e.part_id in existing_parts]
+        new = [e for e in with_lcsc if e.part_id not in existing_parts]
+
+        return {
+            "existing_footprints": existing_footprints,
+            "new_footprints": new_footprints,
+            "existing_parts": existing,
+            "new_parts": new,
+            "no_lcsc": no_lcsc,
+            "existing_footprints_count": len(existing_footprints),
+            "new_footprints_count": len(new_footprints),
+            "existing_parts_count": len(existing),
+            "new_parts_count": len(new),
+            "no_lcsc_count": len(no_lcsc)
+        }
 
-        # Update counts
-        results["existing_footprints_count"] = len(results["existing_footprints"])
-        results["new_footprints_count"] = len(results["new_footprints"])
-        results["existing_parts_count"] = len(results["existing_parts"])
-        results["new_parts_count"] = len(results["new_parts"])
-        results["no_lcsc_count"] = len(results["no_lcsc"])
+    def _load_manager(self, manager_class, path: Path):
+        """Load an OpenPnP file manager, reusing the last one if the file is unchanged.
 
-        return results
+        A cached manager is only reused while it has no unsaved edits and
+        the file's mtime and size still match, so saves and edits made in
+        OpenPnP cause a fresh load. Backup restores copy the original
+        mtime and size back, so callers that write or restore must call
+        _forget_loaded_managers().
+
+        Args:
+            manager_class: PackagesManager or PartsManager
+            path: Path to the XML file
+
+        Returns:
+            Loaded manager instance
+        """
+        try:
+            stat = path.stat()
+            signature = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            signature = None
+
+        cached = self._mgr_cache.get(path)
+        if (signature is not None and cached is not None and cached[0] == signature
+                and isinstance(cached[1], manager_class) and not cached[1].is_modified):
+            return cached[1]
+
+        manager = manager_class(path)
+        manager.load()
+        if signature is not None:
+            self._mgr_cache[path] = (signature, manager)
+        return manager
+
+    def _forget_loaded_managers(self):
+        """Drop cached managers so the next analysis reloads the files."""
+        self._mgr_cache.clear()
 
     def _display_analysis_results(self, results: dict):
         """Display analysis results in a dialog.
@@ -814,28 +1322,31 @@ class MainWindow(QMainWindow):
         self._bom_table.setEnabled(False)  # Prevent clicking during processing
 
         # Hide edit section during processing
-        self._edit_group.setVisible(False)
+        if self._edit_group is not None:
+            self._edit_group.setVisible(False)
         self._selected_bom_row = None
 
         # Reset preview
         self._preview_widget.set_footprint(None)
         self._details_label.setText("Starting footprint fetch...")
         self._confirmed_packages = []
+        self._confirmed_index = {}
         self._confirmed_packages_map = {}
+        self._footprint_to_package = {}
         self._footprints_fetched = 0
 
         # Generate unique session ID for this import batch
-        from datetime import datetime
         import uuid
         session_id = f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}"
         self._current_session_id = session_id
 
         # Create and start worker thread
         self._worker = FootprintFetchWorker(self._processing_queue, session_id)
-        self._worker.progress.connect(self._on_fetch_progress)
-        self._worker.footprint_fetched.connect(self._on_footprint_fetched)
-        self._worker.error.connect(self._on_fetch_error)
-        self._worker.finished.connect(self._on_fetch_finished)
+        queued = Qt.ConnectionType.QueuedConnection
+        self._worker.progress.connect(self._on_fetch_progress, queued)
+        self._worker.footprint_fetched.connect(self._on_footprint_fetched, queued)
+        self._worker.error.connect(self._on_fetch_error, queued)
+        self._worker.finished.connect(self._on_fetch_finished, queued)
         self._worker.start()
 
         self._statusbar.showMessage(f"Processing {len(self._processing_queue)} footprints... (Session: {session_id})")
@@ -848,6 +1359,18 @@ class MainWindow(QMainWindow):
             total: Total items
             message: Status message
         """
+        # Only the latest update matters; apply it on the next timer tick
+        self._pending_progress = (current, total, message)
+        if not self._progress_timer.isActive():
+            self._progress_timer.start()
+
+    def _flush_progress(self):
+        """Apply the latest pending progress update, if any."""
+        self._progress_timer.stop()
+        if self._pending_progress is None:
+            return
+        current, total, message = self._pending_progress
+        self._pending_progress = None
         self._progress_bar.setValue(int(current / total * 100))
         self._statusbar.showMessage(f"[{current}/{total}] {message}")
 
@@ -859,6 +1382,9 @@ class MainWindow(QMainWindow):
             package: Parsed Package object
             lcsc_id: LCSC part number used
         """
+        # Show progress first so it doesn't overwrite the status below later
+        self._flush_progress()
+
         # Increment counter
         self._footprints_fetched += 1
         total = len(self._processing_queue)
@@ -892,6 +1418,8 @@ class MainWindow(QMainWindow):
             footprint_name: Name of the footprint that failed
             error_message: Error description
         """
+        self._flush_progress()
+
         # Clear preview and show error in details
         self._preview_widget.set_footprint(None)
         self._details_label.setText(
@@ -906,6 +1434,7 @@ class MainWindow(QMainWindow):
 
     def _on_fetch_finished(self):
         """Handle worker thread completion."""
+        self._flush_progress()
         self._progress_bar.setValue(100)
         self._statusbar.showMessage("Footprint fetching complete!")
 
@@ -955,7 +1484,6 @@ class MainWindow(QMainWindow):
 
         # Reset preview
         self._preview_widget.set_footprint(None)
-        self._details_label.setText("Processing complete.\n\nLoad a new BOM or re-analyze to continue.")
         self._details_label.setText("No footprint selected")
 
     def _get_height_for_entry(self, entry) -> float:
@@ -967,19 +1495,14 @@ class MainWindow(QMainWindow):
         Returns:
             Height in mm (float)
         """
-        # Find the row in the BOM table that matches this entry
-        for row in range(self._bom_table.rowCount()):
-            # Check if reference matches (column 0)
-            ref_item = self._bom_table.item(row, 0)
-            if ref_item and ref_item.text() == entry.reference:
-                # Get height from column 5
-                height_item = self._bom_table.item(row, 5)
-                if height_item:
-                    try:
-                        return float(height_item.text())
-                    except ValueError:
-                        return 0.5  # Default if invalid
-        return 0.5  # Default if not found
+        # Find the row in the BOM table that matches this entry's reference
+        row = self._bom_model.row_for_reference(entry.reference)
+        if row is None:
+            return 0.5  # Default if not found
+        try:
+            return float(self._bom_model.height(row))
+        except ValueError:
+            return 0.5  # Default if invalid
 
     def _get_nozzle_for_footprint(self, footprint_name: str, lcsc_id: str) -> Optional[str]:
         """Get the nozzle tip ID from BOM table for a specific footprint/LCSC combo.
@@ -991,20 +1514,12 @@ class MainWindow(QMainWindow):
         Returns:
             Nozzle tip ID (str) or None if not found
         """
-        # Find any row in the BOM table that matches this footprint and LCSC
-        for row in range(self._bom_table.rowCount()):
-            # Get the entry for this row
-            if row < len(self._bom_entries):
-                entry = self._bom_entries[row]
-                if entry.base_footprint == footprint_name and entry.lcsc_number == lcsc_id:
-                    # Get nozzle from column 6
-                    nozzle_item = self._bom_table.item(row, 6)
-                    if nozzle_item and nozzle_item.text():
-                        # Find the nozzle tip ID from the name
-                        nozzle_name = nozzle_item.text()
-                        for tip_id, tip_name in self._nozzle_tips:
-                            if tip_name == nozzle_name:
-                                return tip_id
+        # Check the rows in the BOM table that match this footprint and LCSC
+        for row in self._rows_by_fp_lcsc.get((footprint_name, lcsc_id), ()):
+            # The tip ID is stored alongside the row's nozzle name
+            nozzle_id = self._bom_model.nozzle_id(row)
+            if nozzle_id:
+                return nozzle_id
         return None
 
     def _write_to_openpnp(self):
@@ -1013,8 +1528,7 @@ class MainWindow(QMainWindow):
             self._statusbar.showMessage("Creating backup...")
 
             # Create backup
-            backup_dir = self._openpnp_config_path / "footprint_manager_backups"
-            backup_manager = BackupManager(backup_dir, self._openpnp_config_path)
+            backup_manager = self._backup_manager
             backup = backup_manager.create_backup(
                 description=f"Before adding {len(self._confirmed_packages)} footprints from session {self._current_session_id}"
             )
@@ -1027,58 +1541,53 @@ class MainWindow(QMainWindow):
 
             # Add confirmed packages to packages.xml
             self._statusbar.showMessage("Writing packages...")
+            existing_packages = self._packages_manager.package_ids()
             for package, footprint_name, lcsc_id, height, nozzle_tip_id in self._confirmed_packages:
                 # Get the current nozzle from BOM table (in case user changed it after confirming)
                 current_nozzle_id = self._get_nozzle_for_footprint(footprint_name, lcsc_id)
                 if current_nozzle_id is None:
                     current_nozzle_id = nozzle_tip_id  # Fall back to originally confirmed nozzle
 
-                # Replace old nozzle tip with new one if user changed it
+                # Replace old nozzle tip with new one if user changed it,
+                # otherwise just ensure the nozzle is in the list
                 if current_nozzle_id != nozzle_tip_id:
-                    # User changed the nozzle - remove old one and add new one
-                    if nozzle_tip_id in package.compatible_nozzle_tip_ids:
-                        package.compatible_nozzle_tip_ids.remove(nozzle_tip_id)
-                    if current_nozzle_id not in package.compatible_nozzle_tip_ids:
-                        package.compatible_nozzle_tip_ids.append(current_nozzle_id)
-                else:
-                    # No change - just ensure the nozzle is in the list
-                    if current_nozzle_id and current_nozzle_id not in package.compatible_nozzle_tip_ids:
-                        package.compatible_nozzle_tip_ids.append(current_nozzle_id)
+                    package.remove_nozzle_tip(nozzle_tip_id)
+                if current_nozzle_id:
+                    package.add_nozzle_tip(current_nozzle_id)
 
-                # Check if package already exists (skip if it does)
-                if not self._packages_manager.has_package(package.id):
-                    self._packages_manager.add_package(package)
-                    packages_added.append(package.id)
-                else:
-                    # Package exists - update it to add the new nozzle tip
-                    self._packages_manager.update_package(package)
+                # Existing packages are updated to add the new nozzle tip
+                if package.id in existing_packages:
                     packages_added.append(f"{package.id} (updated)")
+                else:
+                    packages_added.append(package.id)
 
-            # Save packages.xml
+            # Apply all packages in one batch, then save packages.xml
+            self._packages_manager.add_packages(
+                [confirmed[0] for confirmed in self._confirmed_packages], update_existing=True
+            )
             self._packages_manager.save()
             self._statusbar.showMessage(f"Wrote {len(packages_added)} packages to packages.xml")
 
             # Add parts to parts.xml (one part per BOM entry)
             self._statusbar.showMessage("Writing parts...")
 
-            # Track which parts we've already written to avoid duplicates
-            written_parts = set()
+            existing_parts = self._parts_manager.part_ids()
+            new_parts = []
 
-            for package, footprint_name, lcsc_id, height, nozzle_tip_id in self._confirmed_packages:
+            # The first package confirmed for a footprint owns its parts
+            packages_by_footprint = {}
+            for package, footprint_name, *_ in self._confirmed_packages:
+                packages_by_footprint.setdefault(footprint_name, package)
+
+            for footprint_name, package in packages_by_footprint.items():
                 # Find ALL BOM entries that use this footprint (regardless of LCSC number)
                 # This ensures we create parts for all components sharing the same footprint:
                 # - Resistors: R0402-10K, R0402-1K, R0402-100Ω, etc.
                 # - Capacitors: C0402-100nF, C0402-1uF, C0402-10uF, etc.
                 # - Inductors: L0603-10uH, L0603-22uH, etc.
-                # Each gets its own part with unique LCSC number
-                matching_entries = [e for e in self._bom_entries
-                                    if e.base_footprint == footprint_name]
-
-                for entry in matching_entries:
-                    # Skip if we've already written this part
-                    if entry.part_id in written_parts:
-                        continue
-                    written_parts.add(entry.part_id)
+                # Each gets its own part with unique LCSC number; the index
+                # already holds one entry per part ID
+                for entry in self._entries_by_base_footprint.get(footprint_name, {}).values():
                     # Get height from BOM table for this specific entry
                     entry_height = self._get_height_for_entry(entry)
 
@@ -1096,14 +1605,14 @@ class MainWindow(QMainWindow):
                     )
 
                     # Add or update part (allows re-writing with updated heights)
-                    if self._parts_manager.has_part(part.id):
-                        self._parts_manager.update_part(part)
+                    if part.id in existing_parts:
                         parts_added.append(f"{part.id} (updated)")
                     else:
-                        self._parts_manager.add_part(part)
                         parts_added.append(part.id)
+                    new_parts.append(part)
 
-            # Save parts.xml
+            # Apply all parts in one tree pass, then save parts.xml
+            self._parts_manager.add_parts(new_parts, update_existing=True)
             self._parts_manager.save()
             self._statusbar.showMessage(f"Wrote {len(parts_added)} parts to parts.xml")
 
@@ -1158,6 +1667,11 @@ class MainWindow(QMainWindow):
             )
             self._statusbar.showMessage(f"Write error: {e}")
 
+        finally:
+            # A restored file gets its old mtime and size back, which the
+            # manager cache can't tell apart from the pre-write file
+            self._forget_loaded_managers()
+
     def _display_footprint_preview(self, package: Package, footprint_name: str, lcsc_id: str):
         """Display footprint preview graphically.
 
@@ -1230,10 +1744,7 @@ class MainWindow(QMainWindow):
         # This handles cases where multiple parts share the same footprint
         # (e.g., R0402-1M, R0402-10K, R0402-100K all use R0402 footprint)
         if not package:
-            for map_key, map_package in self._confirmed_packages_map.items():
-                if map_key[0] == entry.base_footprint:  # map_key[0] is the footprint name
-                    package = map_package
-                    break
+            package = self._footprint_to_package.get(entry.base_footprint)
 
         if not package:
             self._statusbar.showMessage(
@@ -1269,24 +1780,18 @@ class MainWindow(QMainWindow):
 
         # Show edit section and populate with current values
         self._selected_bom_row = row
-        self._edit_group.setVisible(True)
+        self._ensure_edit_group().setVisible(True)
 
         # Get current height from BOM table
-        height_item = self._bom_table.item(row, 5)
-        if height_item:
-            self._edit_height_input.setText(height_item.text())
-        else:
-            self._edit_height_input.setText("0.5")
+        self._edit_height_input.setText(self._bom_model.height(row))
 
         # Get current nozzle from BOM table and set it in edit combo
-        nozzle_item = self._bom_table.item(row, 6)
-        if nozzle_item and nozzle_item.text():
+        nozzle_name = self._bom_model.nozzle(row)
+        if nozzle_name:
             # Find and select this nozzle in the combo
-            nozzle_name = nozzle_item.text()
-            for i in range(self._edit_nozzle_combo.count()):
-                if self._edit_nozzle_combo.itemText(i) == nozzle_name:
-                    self._edit_nozzle_combo.setCurrentIndex(i)
-                    break
+            index = self._edit_nozzle_combo.findText(nozzle_name)
+            if index >= 0:
+                self._edit_nozzle_combo.setCurrentIndex(index)
         else:
             # Auto-select nozzle based on footprint if not set
             self._auto_select_nozzle_for_edit(entry.base_footprint)
@@ -1321,6 +1826,9 @@ class MainWindow(QMainWindow):
         nozzle_tip_name = self._nozzle_combo.currentText()
 
         # Add to confirmed list with height and nozzle
+        self._confirmed_index.setdefault(
+            (self._current_footprint_name, self._current_lcsc_id), len(self._confirmed_packages)
+        )
         self._confirmed_packages.append((
             self._current_package,
             self._current_footprint_name,
@@ -1332,20 +1840,17 @@ class MainWindow(QMainWindow):
         # Store in map AND update height/nozzle in BOM table for ALL entries that use this footprint
         # This handles cases where multiple parts share the same footprint (e.g., C0402-1uF, C0402-10uF, C0402-100nF)
         # All parts with the same footprint get the same height and nozzle
-        for row, entry in enumerate(self._bom_entries):
-            if entry.base_footprint == self._current_footprint_name:
-                # Use (footprint, lcsc, value) as key to differentiate parts with same footprint
-                key = (entry.base_footprint, entry.lcsc_number, entry.value)
-                self._confirmed_packages_map[key] = self._current_package
-
-                # Update height and nozzle in BOM table for ALL entries with this footprint
-                height_item = QTableWidgetItem(str(height))
-                self._bom_table.setItem(row, 5, height_item)
-
-                # Update nozzle (show just the name)
-                nozzle_name = self._nozzle_combo.currentText()
-                nozzle_item = QTableWidgetItem(nozzle_name)
-                self._bom_table.setItem(row, 6, nozzle_item)
+        rows = self._rows_by_base_footprint.get(self._current_footprint_name, [])
+        for row in rows:
+            entry = self._bom_entries[row]
+            # Use (footprint, lcsc, value) as key to differentiate parts with same footprint
+            key = (entry.base_footprint, entry.lcsc_number, entry.value)
+            self._confirmed_packages_map[key] = self._current_package
+        self._footprint_to_package[self._current_footprint_name] = self._current_package
+
+        # Update height and nozzle (show just the name) in BOM table
+        # for ALL entries with this footprint, in one model update
+        self._bom_model.set_rows_part_settings(rows, str(height), nozzle_tip_name, nozzle_tip_id)
 
         self._statusbar.showMessage(
             f"Confirmed {self._current_footprint_name} (height: {height}mm) "
@@ -1422,25 +1927,38 @@ class MainWindow(QMainWindow):
             return
 
         try:
-            from lxml import etree
-            tree = etree.parse(str(machine_file))
-            root = tree.getroot()
-
-            self._nozzle_tips = []
-            nozzle_tip_elements = root.findall('.//nozzle-tip')
-
-            for tip_elem in nozzle_tip_elements:
-                tip_id = tip_elem.get('id', '')
-                name = tip_elem.get('name', tip_id)
-                if tip_id:
-                    self._nozzle_tips.append((tip_id, name))
+            # Re-selecting a config only re-parses machine.xml if it changed
+            key = (machine_file, machine_file.stat().st_mtime_ns)
+            cached = self._nozzle_tip_cache.get(key)
+            if cached is None:
+                from lxml import etree
+
+                # Stream the file; only the nozzle tip attributes are needed
+                cached = []
+                for _, tip_elem in etree.iterparse(str(machine_file), tag='nozzle-tip'):
+                    tip_id = tip_elem.get('id', '')
+                    name = tip_elem.get('name', tip_id)
+                    if tip_id:
+                        cached.append((tip_id, name))
+                    tip_elem.clear()
+                    while tip_elem.getprevious() is not None:
+                        del tip_elem.getparent()[0]
+                self._nozzle_tip_cache[key] = cached
+
+            self._nozzle_tips = cached
+            self._nozzle_index_cache = {}
+            self._nozzle_ids_sorted = sorted(
+                (tip_id, i) for i, (tip_id, _) in enumerate(cached)
+            )
 
             # Populate combo boxes (show only name, store ID as data)
             self._nozzle_combo.clear()
-            self._edit_nozzle_combo.clear()
             for tip_id, name in self._nozzle_tips:
                 self._nozzle_combo.addItem(name, tip_id)
-                self._edit_nozzle_combo.addItem(name, tip_id)
+            if self._edit_group is not None:
+                self._edit_nozzle_combo.clear()
+                for tip_id, name in self._nozzle_tips:
+                    self._edit_nozzle_combo.addItem(name, tip_id)
 
             self._statusbar.showMessage(f"Loaded {len(self._nozzle_tips)} nozzle tips")
 
@@ -1462,56 +1980,59 @@ class MainWindow(QMainWindow):
         - QFP, PLCC: CN400 (4.00mm)
         - Large connectors, shields: CN750 (7.50mm)
         """
-        import re
-
-        # Strip common component prefixes (C, R, L for capacitor, resistor, inductor)
-        name_upper = footprint_name.upper()
-        # Remove C/R/L prefix if followed by digits (C0402 → 0402, R0603 → 0603)
-        name_clean = re.sub(r'^[CRL](?=\d)', '', name_upper)
-
-        # Mapping: package patterns -> nozzle name (shifted one size smaller)
-        nozzle_map = {
-            'CN040': ['01005', '0201', '0402'],
-            'CN065': ['0603', '0805'],
-            'CN140': ['1206', '1210'],
-            'CN220': ['1812', '2512', 'SOT-23', 'SOT-223', 'SOD-123',
-                      'SOIC', 'TSSOP', 'QFN', 'DFN'],
-            'CN400': ['QFP', 'PLCC', 'LQFP', 'TQFP'],
-            'CN750': ['CONNECTOR', 'SHIELD', 'LARGE']
-        }
-
-        # Find matching nozzle
-        selected_nozzle = 'CN065'  # Default to CN065 (common size)
-
-        for nozzle_name, patterns in nozzle_map.items():
-            for pattern in patterns:
-                if pattern in name_clean:
-                    selected_nozzle = nozzle_name
-                    break
-            if selected_nozzle != 'CN065' or nozzle_name == 'CN065':
-                break
-
-        # Get list of available nozzle names
-        available_nozzles = [self._nozzle_combo.itemText(i) for i in range(self._nozzle_combo.count())]
+        # Find matching nozzle, defaulting to CN065 (common size)
+        selected_nozzle = _resolve_nozzle_name(footprint_name)
 
         # Try to find exact match first
-        found = False
-        for i in range(self._nozzle_combo.count()):
-            if selected_nozzle in self._nozzle_combo.itemText(i):
-                self._nozzle_combo.setCurrentIndex(i)
-                found = True
-                break
+        index = self._find_nozzle_tip_index(selected_nozzle)
+        if index is not None:
+            self._nozzle_combo.setCurrentIndex(index)
 
         # If not found and nozzle ends with 0, try ##5 fallback
-        if not found and selected_nozzle.endswith('0'):
+        elif selected_nozzle.endswith('0'):
             fallback_nozzle = selected_nozzle[:-1] + '5'  # CN040 → CN045
-            for i in range(self._nozzle_combo.count()):
-                if fallback_nozzle in self._nozzle_combo.itemText(i):
-                    self._nozzle_combo.setCurrentIndex(i)
-                    self._statusbar.showMessage(
-                        f"Auto-selected {fallback_nozzle} (fallback for {selected_nozzle})"
-                    )
-                    break
+            index = self._find_nozzle_tip_index(fallback_nozzle)
+            if index is not None:
+                self._nozzle_combo.setCurrentIndex(index)
+                self._statusbar.showMessage(
+                    f"Auto-selected {fallback_nozzle} (fallback for {selected_nozzle})"
+                )
+
+    def _find_nozzle_tip_index(self, nozzle: str, match_id: bool = False) -> Optional[int]:
+        """Find the first nozzle tip matching a nozzle name.
+
+        Both nozzle combos list self._nozzle_tips in order, so the index
+        applies to either; results are cached until the tips are reloaded.
+
+        Args:
+            nozzle: Nozzle name (e.g., "CN040")
+            match_id: Match tips whose ID starts with the name instead of
+                tips whose name contains it
+
+        Returns:
+            Combo index, or None if no tip matches
+        """
+        key = (nozzle, match_id)
+        if key not in self._nozzle_index_cache:
+            if match_id:
+                # IDs sharing the prefix sit together in the sorted list;
+                # the first tip in combo order is the lowest index among them
+                ids = self._nozzle_ids_sorted
+                start = bisect.bisect_left(ids, (nozzle,))
+                index = None
+                for pos in range(start, len(ids)):
+                    tip_id, i = ids[pos]
+                    if not tip_id.startswith(nozzle):
+                        break
+                    if index is None or i < index:
+                        index = i
+            else:
+                index = next(
+                    (i for i, (_, name) in enumerate(self._nozzle_tips) if nozzle in name),
+                    None
+                )
+            self._nozzle_index_cache[key] = index
+        return self._nozzle_index_cache[key]
 
     def _check_and_enable_restore_button(self):
         """Check if backups exist and enable restore button if so."""
@@ -1519,9 +2040,7 @@ class MainWindow(QMainWindow):
             self._restore_btn.setEnabled(False)
             return
 
-        backup_dir = self._openpnp_config_path / "footprint_manager_backups"
-        backup_manager = BackupManager(backup_dir, self._openpnp_config_path)
-        backups = backup_manager.list_backups()
+        backups = self._backup_manager.list_backups()
 
         if backups:
             self._restore_btn.setEnabled(True)
@@ -1540,8 +2059,7 @@ class MainWindow(QMainWindow):
             return
 
         # Get list of available backups
-        backup_dir = self._openpnp_config_path / "footprint_manager_backups"
-        backup_manager = BackupManager(backup_dir, self._openpnp_config_path)
+        backup_manager = self._backup_manager
         backups = backup_manager.list_backups()
 
         if not backups:
@@ -1585,6 +2103,7 @@ class MainWindow(QMainWindow):
         if reply == QMessageBox.StandardButton.Yes:
             try:
                 backup_manager.restore_backup(backup)
+                self._forget_loaded_managers()
 
                 # Reload the managers
                 self._packages_manager.load()
@@ -1617,9 +2136,8 @@ class MainWindow(QMainWindow):
             return
 
         try:
-            backup_dir = self._openpnp_config_path / "footprint_manager_backups"
-            backup_manager = BackupManager(backup_dir, self._openpnp_config_path)
-            backup = backup_manager.create_backup(
+            backup_dir = self._backup_manager.backup_dir
+            backup = self._backup_manager.create_backup(
                 description=f"Manual backup created at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
             )
 
@@ -1650,7 +2168,7 @@ class MainWindow(QMainWindow):
             )
             return
 
-        backup_dir = self._openpnp_config_path / "footprint_manager_backups"
+        backup_dir = self._backup_manager.backup_dir
 
         # Create backup directory if it doesn't exist
         if not backup_dir.exists():
@@ -1742,116 +2260,7 @@ class MainWindow(QMainWindow):
         from PyQt6.QtWidgets import QApplication
 
         if checked:
-            # Dark mode stylesheet
-            dark_stylesheet = """
-                QMainWindow, QWidget {
-                    background-color: #2b2b2b;
-                    color: #f0f0f0;
-                }
-                QGroupBox {
-                    border: 1px solid #555555;
-                    border-radius: 5px;
-                    margin-top: 10px;
-                    padding-top: 10px;
-                    color: #f0f0f0;
-                }
-                QGroupBox::title {
-                    subcontrol-origin: margin;
-                    subcontrol-position: top left;
-                    padding: 0 5px;
-                    color: #f0f0f0;
-                }
-                QPushButton {
-                    background-color: #3d3d3d;
-                    border: 1px solid #555555;
-                    border-radius: 3px;
-                    padding: 5px 15px;
-                    color: #f0f0f0;
-                }
-                QPushButton:hover {
-                    background-color: #4a4a4a;
-                }
-                QPushButton:pressed {
-                    background-color: #2a2a2a;
-                }
-                QPushButton:disabled {
-                    background-color: #2b2b2b;
-                    color: #666666;
-                }
-                QLineEdit, QComboBox, QTextEdit {
-                    background-color: #3d3d3d;
-                    border: 1px solid #555555;
-                    border-radius: 3px;
-                    padding: 3px;
-                    color: #f0f0f0;
-                }
-                QComboBox::drop-down {
-                    border: none;
-                }
-                QComboBox::down-arrow {
-                    image: none;
-                    border-left: 5px solid transparent;
-                    border-right: 5px solid transparent;
-                    border-top: 5px solid #f0f0f0;
-                }
-                QTableWidget {
-                    background-color: #3d3d3d;
-                    alternate-background-color: #353535;
-                    border: 1px solid #555555;
-                    color: #f0f0f0;
-                    gridline-color: #555555;
-                }
-                QTableWidget::item {
-                    padding: 5px;
-                }
-                QTableWidget::item:selected {
-                    background-color: #0078d4;
-                    color: #ffffff;
-                }
-                QHeaderView::section {
-                    background-color: #3d3d3d;
-                    color: #f0f0f0;
-                    padding: 5px;
-                    border: 1px solid #555555;
-                }
-                QLabel {
-                    color: #f0f0f0;
-                }
-                QProgressBar {
-                    border: 1px solid #555555;
-                    border-radius: 3px;
-                    text-align: center;
-                    color: #f0f0f0;
-                }
-                QProgressBar::chunk {
-                    background-color: #0078d4;
-                }
-                QStatusBar {
-                    background-color: #2b2b2b;
-                    color: #f0f0f0;
-                }
-                QMenuBar {
-                    background-color: #2b2b2b;
-                    color: #f0f0f0;
-                }
-                QMenuBar::item:selected {
-                    background-color: #3d3d3d;
-                }
-                QMenu {
-                    background-color: #2b2b2b;
-                    color: #f0f0f0;
-                    border: 1px solid #555555;
-                }
-                QMenu::item:selected {
-                    background-color: #0078d4;
-                }
-                QTextBrowser {
-                    background-color: #3d3d3d;
-                    color: #f0f0f0;
-                    border: 1px solid #555555;
-                }
-            """
-            QApplication.instance().setStyleSheet(dark_stylesheet)
+            QApplication.instance().setStyleSheet(_DARK_STYLESHEET)
             self._statusbar.showMessage("Dark mode enabled")
         else:
             # Light mode - clear stylesheet to use default
@@ -1867,55 +2276,25 @@ class MainWindow(QMainWindow):
         if not self._nozzle_tips or self._edit_nozzle_combo.count() == 0:
             return
 
-        import re
-
-        # Remove common prefixes (C, R, L) and convert to uppercase
-        name_upper = footprint_name.upper()
-        name_clean = re.sub(r'^[CRL](?=\d)', '', name_upper)
-
-        # Nozzle mapping (adjusted per user request - one size smaller)
-        nozzle_map = {
-            'CN040': ['01005', '0201', '0402'],
-            'CN065': ['0603', '0805'],
-            'CN140': ['1206', '1210'],
-            'CN220': ['1812', '2512', 'SOT-23', 'SOT-223', 'SOT-89'],
-            'CN400': ['SOIC', 'SOP', 'TSSOP', 'QFP', 'LQFP'],
-        }
-
-        # Find matching nozzle
-        selected_nozzle = None
-        for nozzle_id, patterns in nozzle_map.items():
-            for pattern in patterns:
-                if pattern in name_clean:
-                    selected_nozzle = nozzle_id
-                    break
-            if selected_nozzle:
-                break
-
-        # If no match, default to CN140
-        if not selected_nozzle:
-            selected_nozzle = 'CN140'
+        # Find matching nozzle; if no match, default to CN140
+        selected_nozzle = _resolve_nozzle_name(footprint_name, for_edit=True)
 
         # Try to select the nozzle
-        found = False
-        for i in range(self._edit_nozzle_combo.count()):
-            nozzle_id = self._edit_nozzle_combo.itemData(i)
-            if nozzle_id and nozzle_id.startswith(selected_nozzle):
-                self._edit_nozzle_combo.setCurrentIndex(i)
-                found = True
-                break
+        index = self._find_nozzle_tip_index(selected_nozzle, match_id=True)
 
         # If nozzle ends with '0', try fallback to '5' version (dual-head scheme)
-        if not found and selected_nozzle.endswith('0'):
-            fallback_nozzle = selected_nozzle[:-1] + '5'
-            for i in range(self._edit_nozzle_combo.count()):
-                nozzle_id = self._edit_nozzle_combo.itemData(i)
-                if nozzle_id and nozzle_id.startswith(fallback_nozzle):
-                    self._edit_nozzle_combo.setCurrentIndex(i)
-                    break
+        if index is None and selected_nozzle.endswith('0'):
+            index = self._find_nozzle_tip_index(selected_nozzle[:-1] + '5', match_id=True)
+
+        if index is not None:
+            self._edit_nozzle_combo.setCurrentIndex(index)
 
     def _apply_part_changes(self):
-        """Apply changes from edit controls to the selected BOM row."""
+        """Apply changes from edit controls to the selected BOM row.
+
+        Reports the result in the status bar instead of a modal dialog so
+        repeated edits don't need a click each.
+        """
         if self._selected_bom_row is None:
             return
 
@@ -1942,40 +2321,27 @@ class MainWindow(QMainWindow):
         nozzle_name = self._edit_nozzle_combo.currentText()
 
         # Update the BOM table height and nozzle columns
-        height_item = QTableWidgetItem(str(height))
-        self._bom_table.setItem(self._selected_bom_row, 5, height_item)
-
-        nozzle_item = QTableWidgetItem(nozzle_name)
-        self._bom_table.setItem(self._selected_bom_row, 6, nozzle_item)
+        self._bom_model.set_part_settings(self._selected_bom_row, str(height), nozzle_name, nozzle_id)
 
         # Update the confirmed packages list with new nozzle tip
         # Find the package that matches this entry's footprint and LCSC
         entry = self._bom_entries[self._selected_bom_row]
-        for i, (package, footprint_name, lcsc_id, old_height, old_nozzle_id) in enumerate(self._confirmed_packages):
-            if footprint_name == entry.base_footprint and lcsc_id == entry.lcsc_number:
-                # Update the Package object's nozzle list directly
-                # Remove old nozzle and add new nozzle
-                if old_nozzle_id in package.compatible_nozzle_tip_ids:
-                    package.compatible_nozzle_tip_ids.remove(old_nozzle_id)
-                if nozzle_id not in package.compatible_nozzle_tip_ids:
-                    package.compatible_nozzle_tip_ids.append(nozzle_id)
-
-                # Replace the tuple with updated nozzle_tip_id
-                self._confirmed_packages[i] = (package, footprint_name, lcsc_id, old_height, nozzle_id)
-                break
+        i = self._confirmed_index.get((entry.base_footprint, entry.lcsc_number))
+        if i is not None:
+            package, footprint_name, lcsc_id, old_height, old_nozzle_id = self._confirmed_packages[i]
+            # Update the Package object's nozzle list directly
+            # Remove old nozzle and add new nozzle
+            package.remove_nozzle_tip(old_nozzle_id)
+            if nozzle_id:
+                package.add_nozzle_tip(nozzle_id)
+
+            # Replace the tuple with updated nozzle_tip_id
+            self._confirmed_packages[i] = (package, footprint_name, lcsc_id, old_height, nozzle_id)
 
         # Show confirmation
         self._statusbar.showMessage(
-            f"Updated {entry.part_id}: Height={height}mm, Nozzle={nozzle_name}"
-        )
-
-        QMessageBox.information(
-            self,
-            "Changes Applied",
-            f"Updated part: {entry.part_id}\n"
-            f"Height: {height} mm\n"
-            f"Nozzle: {nozzle_name}\n\n"
-            f"Click 'Write to OpenPnP' to save changes."
+            f"Updated {entry.part_id}: Height={height}mm, Nozzle={nozzle_name} - "
+            f"click 'Write to OpenPnP' to save changes"
         )
 
     def _show_about(self):
@@ -2020,3 +2386,12 @@ class MainWindow(QMainWindow):
         layout.addWidget(close_btn)
 
         dialog.exec()
+
+    def closeEvent(self, event):
+        """Stop the worker threads before the window closes."""
+        for worker in (self._worker, self._bom_worker):
+            if worker is not None and worker.isRunning():
+                worker.requestInterruption()
+                worker.wait()
+        shutdown_parse_pool()
+        super().closeEvent(event)
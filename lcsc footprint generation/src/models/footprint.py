@@ -3,12 +3,39 @@
 These models represent the footprint/package data used by OpenPnP.
 """
 
+import math
+import sys
 from dataclasses import dataclass, field
-from typing import Optional
+from pathlib import Path
+from typing import Iterator, Optional
 from lxml import etree
 
+# Package version written by current OpenPnP; loaded packages share it
+_DEFAULT_PACKAGE_VERSION = "1.1"
 
-@dataclass
+# Pad attributes Pad.from_xml_element() converts with float()
+_PAD_NUMERIC_ATTRIBUTES = ("x", "y", "width", "height", "rotation", "roundness")
+
+# Pad count above which calculate_bounds() uses NumPy; below it the
+# array setup costs more than a plain loop
+_VECTORIZE_MIN_PADS = 64
+
+
+def _format_mm(value: float) -> str:
+    """Format a length attribute, skipping formatting for the common 0.0."""
+    if value == 0.0 and math.copysign(1.0, value) > 0:
+        return "0.0000"
+    return f"{value:.4f}"
+
+
+def _format_1(value: float) -> str:
+    """Format a rotation/roundness attribute, skipping formatting for 0.0."""
+    if value == 0.0 and math.copysign(1.0, value) > 0:
+        return "0.0"
+    return f"{value:.1f}"
+
+
+@dataclass(slots=True)
 class Pad:
     """Represents a single pad in a footprint.
     
@@ -29,22 +56,27 @@ class Pad:
     rotation: float = 0.0
     roundness: float = 0.0
     
-    def to_xml_element(self) -> etree._Element:
+    def to_xml_element(self, parent: Optional[etree._Element] = None) -> etree._Element:
         """Convert pad to OpenPnP XML element.
         
+        Args:
+            parent: If given, the pad is created as its last child
+        
         Returns:
             lxml Element representing the pad
         """
-        return etree.Element(
-            "pad",
-            name=self.name,
-            x=f"{self.x:.4f}",
-            y=f"{self.y:.4f}",
-            width=f"{self.width:.4f}",
-            height=f"{self.height:.4f}",
-            rotation=f"{self.rotation:.1f}",
-            roundness=f"{self.roundness:.1f}"
-        )
+        attribs = {
+            "name": self.name,
+            "x": _format_mm(self.x),
+            "y": _format_mm(self.y),
+            "width": f"{self.width:.4f}",
+            "height": f"{self.height:.4f}",
+            "rotation": _format_1(self.rotation),
+            "roundness": _format_1(self.roundness),
+        }
+        if parent is not None:
+            return etree.SubElement(parent, "pad", attribs)
+        return etree.Element("pad", attribs)
     
     @classmethod
     def from_xml_element(cls, element: etree._Element) -> "Pad":
@@ -56,18 +88,19 @@ class Pad:
         Returns:
             Pad instance
         """
+        attrib = element.attrib
         return cls(
-            name=element.get("name", ""),
-            x=float(element.get("x", 0)),
-            y=float(element.get("y", 0)),
-            width=float(element.get("width", 0)),
-            height=float(element.get("height", 0)),
-            rotation=float(element.get("rotation", 0)),
-            roundness=float(element.get("roundness", 0))
+            name=attrib.get("name", ""),
+            x=float(attrib.get("x", 0)),
+            y=float(attrib.get("y", 0)),
+            width=float(attrib.get("width", 0)),
+            height=float(attrib.get("height", 0)),
+            rotation=float(attrib.get("rotation", 0)),
+            roundness=float(attrib.get("roundness", 0))
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Footprint:
     """Represents the footprint (pad layout) within a package.
     
@@ -82,21 +115,27 @@ class Footprint:
     pads: list[Pad] = field(default_factory=list)
     units: str = "Millimeters"
     
-    def to_xml_element(self) -> etree._Element:
+    def to_xml_element(self, parent: Optional[etree._Element] = None) -> etree._Element:
         """Convert footprint to OpenPnP XML element.
         
+        Args:
+            parent: If given, the footprint is created as its last child
+        
         Returns:
             lxml Element representing the footprint
         """
-        footprint_elem = etree.Element(
-            "footprint",
-            units=self.units,
-        )
-        footprint_elem.set("body-width", f"{self.body_width:.4f}")
-        footprint_elem.set("body-height", f"{self.body_height:.4f}")
+        attribs = {
+            "units": self.units,
+            "body-width": f"{self.body_width:.4f}",
+            "body-height": f"{self.body_height:.4f}",
+        }
+        if parent is not None:
+            footprint_elem = etree.SubElement(parent, "footprint", attribs)
+        else:
+            footprint_elem = etree.Element("footprint", attribs)
         
         for pad in self.pads:
-            footprint_elem.append(pad.to_xml_element())
+            pad.to_xml_element(footprint_elem)
         
         return footprint_elem
     
@@ -110,13 +149,14 @@ class Footprint:
         Returns:
             Footprint instance
         """
-        pads = [Pad.from_xml_element(pad_elem) for pad_elem in element.findall("pad")]
+        pads = [Pad.from_xml_element(pad_elem) for pad_elem in element.iterchildren("pad")]
         
+        attrib = element.attrib
         return cls(
-            body_width=float(element.get("body-width", 0)),
-            body_height=float(element.get("body-height", 0)),
+            body_width=float(attrib.get("body-width", 0)),
+            body_height=float(attrib.get("body-height", 0)),
             pads=pads,
-            units=element.get("units", "Millimeters")
+            units=attrib.get("units", "Millimeters")
         )
     
     def calculate_bounds(self) -> tuple[float, float, float, float]:
@@ -128,15 +168,48 @@ class Footprint:
         if not self.pads:
             return (0, 0, 0, 0)
         
-        min_x = min(p.x - p.width / 2 for p in self.pads)
-        max_x = max(p.x + p.width / 2 for p in self.pads)
-        min_y = min(p.y - p.height / 2 for p in self.pads)
-        max_y = max(p.y + p.height / 2 for p in self.pads)
+        if len(self.pads) >= _VECTORIZE_MIN_PADS:
+            return self._calculate_bounds_vectorized()
+        
+        # Single pass over the pads instead of one min()/max() pass per edge
+        min_x = min_y = float("inf")
+        max_x = max_y = float("-inf")
+        for p in self.pads:
+            half_width = p.width / 2
+            half_height = p.height / 2
+            if p.x - half_width < min_x:
+                min_x = p.x - half_width
+            if p.x + half_width > max_x:
+                max_x = p.x + half_width
+            if p.y - half_height < min_y:
+                min_y = p.y - half_height
+            if p.y + half_height > max_y:
+                max_y = p.y + half_height
         
         return (min_x, min_y, max_x, max_y)
+    
+    def _calculate_bounds_vectorized(self) -> tuple[float, float, float, float]:
+        """Calculate the pad bounding box with NumPy reductions.
+        
+        Returns:
+            Tuple of (min_x, min_y, max_x, max_y)
+        """
+        import numpy as np
+        
+        pads = np.fromiter(
+            (v for p in self.pads for v in (p.x, p.y, p.width, p.height)),
+            dtype=np.float64, count=4 * len(self.pads)
+        ).reshape(-1, 4)
+        x, y = pads[:, 0], pads[:, 1]
+        half_width, half_height = pads[:, 2] / 2, pads[:, 3] / 2
+        
+        return (
+            float((x - half_width).min()), float((y - half_height).min()),
+            float((x + half_width).max()), float((y + half_height).max())
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class Package:
     """Represents an OpenPnP package (footprint definition).
 
@@ -156,13 +229,31 @@ class Package:
     id: str
     footprint: Footprint
     description: Optional[str] = None
-    version: str = "1.1"
+    version: str = _DEFAULT_PACKAGE_VERSION
     generator: Optional[str] = None
     import_date: Optional[str] = None
     session_id: Optional[str] = None
     lcsc_id: Optional[str] = None
     compatible_nozzle_tip_ids: list[str] = field(default_factory=list)
     
+    def add_nozzle_tip(self, nozzle_tip_id: str) -> None:
+        """Add a compatible nozzle tip, keeping the list free of duplicates.
+
+        Args:
+            nozzle_tip_id: Nozzle tip ID to add
+        """
+        if nozzle_tip_id not in self.compatible_nozzle_tip_ids:
+            self.compatible_nozzle_tip_ids.append(nozzle_tip_id)
+
+    def remove_nozzle_tip(self, nozzle_tip_id: str) -> None:
+        """Remove a compatible nozzle tip if it is listed.
+
+        Args:
+            nozzle_tip_id: Nozzle tip ID to remove
+        """
+        if nozzle_tip_id in self.compatible_nozzle_tip_ids:
+            self.compatible_nozzle_tip_ids.remove(nozzle_tip_id)
+
     def to_xml_element(self) -> etree._Element:
         """Convert package to OpenPnP XML element.
 
@@ -194,16 +285,13 @@ class Package:
             comment = etree.Comment(f" {comment_text} ")
             package_elem.append(comment)
 
-        package_elem.append(self.footprint.to_xml_element())
+        self.footprint.to_xml_element(package_elem)
 
-        # Add compatible nozzle tip IDs
-        nozzle_tips_elem = etree.Element("compatible-nozzle-tip-ids")
-        nozzle_tips_elem.set("class", "java.util.ArrayList")
+        # Add compatible nozzle tip IDs, created in place like the pads
+        nozzle_tips_elem = etree.SubElement(package_elem, "compatible-nozzle-tip-ids",
+                                            {"class": "java.util.ArrayList"})
         for nozzle_id in self.compatible_nozzle_tip_ids:
-            string_elem = etree.Element("string")
-            string_elem.text = nozzle_id
-            nozzle_tips_elem.append(string_elem)
-        package_elem.append(nozzle_tips_elem)
+            etree.SubElement(nozzle_tips_elem, "string").text = nozzle_id
 
         return package_elem
     
@@ -220,17 +308,84 @@ class Package:
         footprint_elem = element.find("footprint")
         footprint = Footprint.from_xml_element(footprint_elem) if footprint_elem is not None else Footprint(0, 0)
 
+        attrib = element.attrib
         return cls(
-            id=element.get("id", ""),
+            id=attrib.get("id", ""),
             footprint=footprint,
-            description=element.get("description"),
-            version=element.get("version", "1.1"),
-            generator=element.get("x-generator"),
-            import_date=element.get("x-import-date"),
-            session_id=element.get("x-session-id"),
-            lcsc_id=element.get("x-lcsc-id")
+            description=attrib.get("description"),
+            # lxml returns a new string per element; keep one copy
+            version=sys.intern(attrib.get("version", _DEFAULT_PACKAGE_VERSION)),
+            generator=attrib.get("x-generator"),
+            import_date=attrib.get("x-import-date"),
+            session_id=attrib.get("x-session-id"),
+            lcsc_id=attrib.get("x-lcsc-id")
         )
     
+    @staticmethod
+    def is_valid_xml_element(element: etree._Element) -> bool:
+        """Check whether from_xml_element() would accept an element.
+        
+        Runs the same numeric conversions without building any objects,
+        so a package index can skip malformed packages up front.
+        
+        Args:
+            element: lxml Element containing package data
+            
+        Returns:
+            True if the element converts without error
+        """
+        footprint_elem = element.find("footprint")
+        if footprint_elem is None:
+            return True
+        try:
+            attrib = footprint_elem.attrib
+            float(attrib.get("body-width", 0))
+            float(attrib.get("body-height", 0))
+            for pad_elem in footprint_elem.iterchildren("pad"):
+                attrib = pad_elem.attrib
+                for name in _PAD_NUMERIC_ATTRIBUTES:
+                    float(attrib.get(name, 0))
+        except ValueError:
+            return False
+        return True
+    
+    @classmethod
+    def iter_from_file(cls, path: Path, skip_malformed: bool = False) -> Iterator["Package"]:
+        """Stream packages from an OpenPnP packages.xml file.
+        
+        Each <package> element is converted and then cleared, so peak
+        memory stays around one package subtree instead of the whole tree.
+        
+        Args:
+            path: Path to packages.xml
+            skip_malformed: If True, packages with unparseable attributes
+                are skipped instead of raising
+            
+        Yields:
+            Package instances in file order
+            
+        Raises:
+            etree.XMLSyntaxError: If the file is not valid XML
+            IOError: If the file can't be read
+        """
+        for _, package_elem in etree.iterparse(str(path), events=("end",),
+                                               tag="package", remove_blank_text=True,
+                                               collect_ids=False, resolve_entities=False,
+                                               no_network=True):
+            try:
+                package = cls.from_xml_element(package_elem)
+            except (KeyError, ValueError):
+                if not skip_malformed:
+                    raise
+                package = None
+            finally:
+                # Free this package and the already-processed siblings
+                package_elem.clear()
+                while package_elem.getprevious() is not None:
+                    del package_elem.getparent()[0]
+            if package is not None:
+                yield package
+    
     def to_xml_string(self, pretty: bool = True) -> str:
         """Convert package to XML string.
         
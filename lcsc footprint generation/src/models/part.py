@@ -3,12 +3,26 @@
 These models represent parts (components) and BOM entries.
 """
 
-from dataclasses import dataclass
-from typing import Optional
+import functools
+import re
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterator, Optional
 from enum import Enum, auto
 from lxml import etree
 
 
+# Common BOM suffixes stripped from footprint names, outermost first
+_FOOTPRINT_SUFFIXES = ("_HandSolder", "_Pad", "_1EP", "_NoVia")
+
+# Matches the suffixes in the nesting order they are stripped in, so each
+# one is removed at most once, outermost first
+_FOOTPRINT_SUFFIX_RE = re.compile(
+    "".join(f"(?:{re.escape(suffix)})?" for suffix in reversed(_FOOTPRINT_SUFFIXES)) + r"\Z"
+)
+
+
 class PartStatus(Enum):
     """Status of a part in the processing queue."""
     PENDING = auto()      # Not yet processed
@@ -19,7 +33,7 @@ class PartStatus(Enum):
     NO_LCSC = auto()      # No LCSC number provided
 
 
-@dataclass
+@dataclass(slots=True)
 class Part:
     """Represents an OpenPnP part definition.
 
@@ -96,18 +110,57 @@ class Part:
         Returns:
             Part instance
         """
+        attrib = element.attrib
         return cls(
-            id=element.get("id", ""),
-            package_id=element.get("package-id", ""),
-            height=float(element.get("height", 0.5)),
-            speed=float(element.get("speed", 1.0)),
-            height_units=element.get("height-units", "Millimeters"),
-            generator=element.get("x-generator"),
-            import_date=element.get("x-import-date"),
-            session_id=element.get("x-session-id"),
-            lcsc_id=element.get("x-lcsc-id")
+            id=attrib.get("id", ""),
+            # Many parts share a package; keep one copy of each id
+            package_id=sys.intern(attrib.get("package-id", "")),
+            height=float(attrib.get("height", 0.5)),
+            speed=float(attrib.get("speed", 1.0)),
+            height_units=attrib.get("height-units", "Millimeters"),
+            generator=attrib.get("x-generator"),
+            import_date=attrib.get("x-import-date"),
+            session_id=attrib.get("x-session-id"),
+            lcsc_id=attrib.get("x-lcsc-id")
         )
     
+    @classmethod
+    def iter_from_file(cls, path: Path, skip_malformed: bool = False) -> Iterator["Part"]:
+        """Stream parts from an OpenPnP parts.xml file.
+        
+        Each <part> element is converted and then cleared, so peak memory
+        stays around one part element instead of the whole tree.
+        
+        Args:
+            path: Path to parts.xml
+            skip_malformed: If True, parts with unparseable attributes are
+                skipped instead of raising
+            
+        Yields:
+            Part instances in file order
+            
+        Raises:
+            etree.XMLSyntaxError: If the file is not valid XML
+            IOError: If the file can't be read
+        """
+        for _, part_elem in etree.iterparse(str(path), events=("end",),
+                                            tag="part", remove_blank_text=True,
+                                            collect_ids=False, resolve_entities=False,
+                                            no_network=True):
+            try:
+                part = cls.from_xml_element(part_elem)
+            except (KeyError, ValueError):
+                if not skip_malformed:
+                    raise
+                part = None
+            finally:
+                # Free this part and the already-processed siblings
+                part_elem.clear()
+                while part_elem.getprevious() is not None:
+                    del part_elem.getparent()[0]
+            if part is not None:
+                yield part
+    
     def to_xml_string(self, pretty: bool = True) -> str:
         """Convert part to XML string.
         
@@ -125,7 +178,7 @@ class Part:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class BomEntry:
     """Represents a single entry from a BOM file.
     
@@ -145,6 +198,8 @@ class BomEntry:
     quantity: int = 1
     status: PartStatus = PartStatus.PENDING
     error_message: Optional[str] = None
+    # part_id, computed on first access
+    _part_id: Optional[str] = field(default=None, init=False, repr=False, compare=False)
     
     @property
     def has_lcsc(self) -> bool:
@@ -155,10 +210,16 @@ class BomEntry:
     def part_id(self) -> str:
         """Generate OpenPnP part ID from footprint and value.
 
+        Computed once and cached; entries with the same footprint and
+        value share one interned ID string.
+
         Returns:
             Part ID string (e.g., "C0402-10K" or "C0402-1uF 25v")
         """
-        return f"{self.footprint_name}-{self.value}"
+        part_id = self._part_id
+        if part_id is None:
+            self._part_id = part_id = sys.intern(f"{self.footprint_name}-{self.value}")
+        return part_id
     
     @property
     def base_footprint(self) -> str:
@@ -170,15 +231,22 @@ class BomEntry:
         Returns:
             Base footprint name (e.g., "C0402" from "C0402_HandSolder")
         """
-        # Common suffixes to strip
-        suffixes = ["_HandSolder", "_Pad", "_1EP", "_NoVia"]
-        name = self.footprint_name
+        return self.strip_footprint_suffixes(self.footprint_name)
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def strip_footprint_suffixes(name: str) -> str:
+        """Strip common BOM suffixes from a footprint name.
         
-        for suffix in suffixes:
-            if name.endswith(suffix):
-                name = name[:-len(suffix)]
+        Cached since a BOM repeats the same few footprints across many rows.
         
-        return name
+        Args:
+            name: Footprint name as it appears in the BOM
+            
+        Returns:
+            Base footprint name
+        """
+        return _FOOTPRINT_SUFFIX_RE.sub("", name, count=1)
     
     def set_error(self, message: str) -> None:
         """Set error status with message.
@@ -206,7 +274,7 @@ class BomEntry:
         self.status = PartStatus.NO_LCSC
 
 
-@dataclass
+@dataclass(slots=True)
 class FootprintGroup:
     """Groups BOM entries by shared footprint.
     
@@ -234,12 +302,8 @@ class FootprintGroup:
         Returns:
             FootprintGroup instance
         """
-        # Find the first entry with an LCSC number
-        lcsc_number = None
-        for entry in entries:
-            if entry.has_lcsc:
-                lcsc_number = entry.lcsc_number
-                break
+        # Stops at the first entry with an LCSC number
+        lcsc_number = next((entry.lcsc_number for entry in entries if entry.has_lcsc), None)
         
         return cls(
             footprint_name=footprint_name,
@@ -247,6 +311,38 @@ class FootprintGroup:
             lcsc_number=lcsc_number
         )
     
+    @classmethod
+    def group_bom_entries(cls, entries: list[BomEntry]) -> list["FootprintGroup"]:
+        """Group BOM entries by base footprint in a single pass.
+        
+        Args:
+            entries: BOM entries to group
+            
+        Returns:
+            FootprintGroup instances in order of first appearance, each
+            carrying the LCSC number of its first entry that has one
+        """
+        groups: dict[str, list[BomEntry]] = {}
+        lcsc_numbers: dict[str, Optional[str]] = {}
+        
+        for entry in entries:
+            footprint_name = entry.base_footprint
+            group_entries = groups.get(footprint_name)
+            if group_entries is None:
+                groups[footprint_name] = group_entries = []
+            group_entries.append(entry)
+            if entry.has_lcsc and footprint_name not in lcsc_numbers:
+                lcsc_numbers[footprint_name] = entry.lcsc_number
+        
+        return [
+            cls(
+                footprint_name=footprint_name,
+                entries=group_entries,
+                lcsc_number=lcsc_numbers.get(footprint_name)
+            )
+            for footprint_name, group_entries in groups.items()
+        ]
+    
     @property
     def part_count(self) -> int:
         """Number of parts using this footprint."""
@@ -0,0 +1,54 @@
+"""Replace OpenPnP configuration files without leaving partial writes.
+
+OpenPnP reads packages.xml and parts.xml on startup, so a save that
+fails half way must leave the previous file intact.
+"""
+
+import contextlib
+import os
+import shutil
+from pathlib import Path
+from typing import BinaryIO, Iterator
+
+
+@contextlib.contextmanager
+def atomic_write(path: Path, buffering: int = -1) -> Iterator[BinaryIO]:
+    """Open a temporary file that replaces path once fully written.
+
+    The temporary file is created next to the resolved path, so a
+    symlinked config file keeps its link and only the target is
+    replaced. The target's permission bits, and its owner where
+    allowed, are copied before the swap.
+
+    Args:
+        path: File to replace
+        buffering: Buffer size passed to open()
+
+    Yields:
+        Binary file object to write the new contents to
+
+    Raises:
+        OSError: If the file can't be written or replaced; the original
+            is left untouched
+    """
+    target = Path(path).resolve()
+    tmp_path = target.with_name(target.name + ".tmp")
+    try:
+        with open(tmp_path, "wb", buffering=buffering) as f:
+            yield f
+        if target.exists():
+            shutil.copymode(target, tmp_path)
+            if hasattr(os, "chown"):
+                stat = target.stat()
+                try:
+                    os.chown(tmp_path, stat.st_uid, stat.st_gid)
+                except PermissionError:
+                    # Only root can give files away; ours is the best we can do
+                    pass
+        os.replace(tmp_path, target)
+    except BaseException:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+        raise
@@ -3,14 +3,41 @@
 Handles creating, restoring, and managing backups of configuration files.
 """
 
+import os
 import shutil
 import hashlib
+import hmac
 import json
+import mmap
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, List
+from typing import Optional, List, Dict, Tuple
 from dataclasses import dataclass, field
 
+try:
+    # Optional faster JSON codec; its JSONDecodeError subclasses json's
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Read size when copying and hashing in one pass
+_HASH_CHUNK_SIZE = 1 << 20
+
+
+def _dump_manifest(data: dict) -> bytes:
+    """Serialize manifest data as indented JSON."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
+def _load_manifest(path: Path) -> dict:
+    """Read manifest data from a JSON file."""
+    data = path.read_bytes()
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
 
 class BackupError(Exception):
     """Error during backup operations."""
@@ -70,6 +97,32 @@ class Backup:
         return datetime.strptime(self.manifest.timestamp, "%Y%m%d_%H%M%S")
 
 
+def compute_file_digest(filepath: Path) -> bytes:
+    """Compute the raw SHA256 digest of a file.
+    
+    Args:
+        filepath: Path to file
+        
+    Returns:
+        32-byte digest of file contents
+    """
+    with open(filepath, "rb") as f:
+        if hasattr(os, "posix_fadvise"):
+            # The file is read once, front to back
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        
+        if hasattr(hashlib, "file_digest"):
+            # Python 3.11+: read/update loop runs in C
+            return hashlib.file_digest(f, "sha256").digest()
+        
+        # Hash straight from the page cache; mmap() rejects empty files
+        hasher = hashlib.sha256()
+        if os.fstat(f.fileno()).st_size:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                hasher.update(mapped)
+    return hasher.digest()
+
+
 def compute_file_hash(filepath: Path) -> str:
     """Compute SHA256 hash of a file.
     
@@ -79,10 +132,29 @@ def compute_file_hash(filepath: Path) -> str:
     Returns:
         Hex digest of file hash
     """
+    return compute_file_digest(filepath).hex()
+
+
+def copy_and_hash(source: Path, dest: Path) -> str:
+    """Copy a file and compute its SHA256 hash in a single read pass.
+    
+    File metadata is copied like shutil.copy2().
+    
+    Args:
+        source: File to copy
+        dest: Destination file path
+        
+    Returns:
+        Hex digest of the copied contents
+    """
     hasher = hashlib.sha256()
-    with open(filepath, "rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            hasher.update(chunk)
+    buffer = bytearray(_HASH_CHUNK_SIZE)
+    view = memoryview(buffer)
+    with open(source, "rb") as src, open(dest, "wb") as dst:
+        while size := src.readinto(buffer):
+            hasher.update(view[:size])
+            dst.write(view[:size])
+    shutil.copystat(source, dest)
     return hasher.hexdigest()
 
 
@@ -103,6 +175,9 @@ class BackupManager:
         self._backup_dir = backup_dir
         self._source_dir = source_dir
         self._current_backup: Optional[Backup] = None
+        self._backups: Optional[List[Backup]] = None  # Last listing, newest first
+        self._backups_mtime_ns: Optional[int] = None  # Backup dir mtime when listed
+        self._manifests: Dict[Path, Tuple[int, BackupManifest]] = {}  # manifest path -> (mtime_ns, manifest)
     
     @property
     def backup_dir(self) -> Path:
@@ -112,27 +187,56 @@ class BackupManager:
     def list_backups(self) -> List[Backup]:
         """List all available backups, newest first.
         
+        The listing is reused until a backup is created or deleted, or the
+        backup directory changes on disk.
+        
         Returns:
             List of Backup objects
         """
-        backups = []
+        try:
+            mtime_ns = self._backup_dir.stat().st_mtime_ns
+        except OSError:
+            return []
         
-        if not self._backup_dir.exists():
-            return backups
+        if self._backups is None or mtime_ns != self._backups_mtime_ns:
+            self._backups = self._scan_backups()
+            self._backups_mtime_ns = mtime_ns
+        return list(self._backups)
+    
+    def _scan_backups(self) -> List[Backup]:
+        """Read the manifests of all backups in the backup directory.
+        
+        Manifests unchanged since the last scan are reused rather than
+        parsed again.
+        
+        Returns:
+            List of Backup objects, newest first
+        """
+        backups = []
+        manifests = {}
         
         for backup_path in self._backup_dir.iterdir():
             if not backup_path.is_dir():
                 continue
             
             manifest_path = backup_path / "manifest.json"
-            if manifest_path.exists():
+            try:
+                mtime_ns = manifest_path.stat().st_mtime_ns
+            except OSError:
+                continue
+            
+            cached = self._manifests.get(manifest_path)
+            if cached is not None and cached[0] == mtime_ns:
+                manifest = cached[1]
+            else:
                 try:
-                    with open(manifest_path) as f:
-                        manifest_data = json.load(f)
-                    manifest = BackupManifest.from_dict(manifest_data)
-                    backups.append(Backup(path=backup_path, manifest=manifest))
-                except (json.JSONDecodeError, KeyError):
+                    manifest = BackupManifest.from_dict(_load_manifest(manifest_path))
+                except (json.JSONDecodeError, UnicodeDecodeError, KeyError):
                     continue
+            manifests[manifest_path] = (mtime_ns, manifest)
+            backups.append(Backup(path=backup_path, manifest=manifest))
+        
+        self._manifests = manifests
         
         # Sort by timestamp, newest first
         backups.sort(key=lambda b: b.timestamp, reverse=True)
@@ -163,17 +267,24 @@ class BackupManager:
         files_to_backup = ["packages.xml", "parts.xml"]
         file_hashes = {}
         
-        for filename in files_to_backup:
-            source_file = self._source_dir / filename
-            if source_file.exists():
-                try:
-                    dest_file = backup_path / filename
-                    shutil.copy2(source_file, dest_file)
-                    file_hashes[filename] = compute_file_hash(dest_file)
-                except IOError as e:
-                    # Cleanup on failure
-                    shutil.rmtree(backup_path, ignore_errors=True)
-                    raise BackupError(f"Failed to backup {filename}: {e}")
+        # File I/O and hashing release the GIL, so the files are copied concurrently
+        sources = [
+            (filename, self._source_dir / filename) for filename in files_to_backup
+            if (self._source_dir / filename).exists()
+        ]
+        with ThreadPoolExecutor(max_workers=len(files_to_backup)) as executor:
+            copies = [
+                (filename, executor.submit(copy_and_hash, source_file, backup_path / filename))
+                for filename, source_file in sources
+            ]
+        
+        for filename, copy in copies:
+            try:
+                file_hashes[filename] = copy.result()
+            except IOError as e:
+                # Cleanup on failure
+                shutil.rmtree(backup_path, ignore_errors=True)
+                raise BackupError(f"Failed to backup {filename}: {e}")
         
         # Create manifest
         manifest = BackupManifest(
@@ -184,13 +295,13 @@ class BackupManager:
         
         manifest_path = backup_path / "manifest.json"
         try:
-            with open(manifest_path, "w") as f:
-                json.dump(manifest.to_dict(), f, indent=2)
+            manifest_path.write_bytes(_dump_manifest(manifest.to_dict()))
         except IOError as e:
             raise BackupError(f"Failed to write manifest: {e}")
         
         backup = Backup(path=backup_path, manifest=manifest)
         self._current_backup = backup
+        self._backups = None
         
         return backup
     
@@ -231,6 +342,8 @@ class BackupManager:
             shutil.rmtree(backup.path)
         except OSError as e:
             raise BackupError(f"Failed to delete backup: {e}")
+        finally:
+            self._backups = None
     
     def cleanup_old_backups(self, keep_count: int = 10) -> int:
         """Remove old backups, keeping the most recent ones.
@@ -241,6 +354,16 @@ class BackupManager:
         Returns:
             Number of backups deleted
         """
+        # Every backup is a directory, so when there aren't more directories
+        # than we keep, nothing can be deleted and no manifests need reading
+        try:
+            with os.scandir(self._backup_dir) as entries:
+                dir_count = sum(1 for entry in entries if entry.is_dir())
+        except OSError:
+            return 0
+        if dir_count <= keep_count:
+            return 0
+        
         backups = self.list_backups()
         deleted = 0
         
@@ -263,14 +386,35 @@ class BackupManager:
         Returns:
             True if backup is valid, False otherwise
         """
-        for filename, expected_hash in backup.manifest.files.items():
-            filepath = backup.path / filename
-            if not filepath.exists():
-                return False
-            
-            actual_hash = compute_file_hash(filepath)
-            if actual_hash != expected_hash:
-                return False
+        files = backup.manifest.files
+        if not files:
+            return True
+        
+        # Manifests keep hex digests; decode each once and compare the
+        # raw bytes, so no hex string is built per file
+        try:
+            expected = {filename: bytes.fromhex(expected_hash)
+                        for filename, expected_hash in files.items()}
+        except (TypeError, ValueError):
+            return False
+        
+        # Hashing releases the GIL, so the files are checked concurrently
+        executor = ThreadPoolExecutor(max_workers=min(len(files), os.cpu_count() or 1))
+        try:
+            checks = {
+                executor.submit(compute_file_digest, backup.path / filename): digest
+                for filename, digest in expected.items()
+            }
+            for check in as_completed(checks):
+                # Opening the file is the existence check; no separate stat()
+                try:
+                    if not hmac.compare_digest(check.result(), checks[check]):
+                        return False
+                except OSError:
+                    return False
+        finally:
+            # Stop on the first failure without waiting for files not yet started
+            executor.shutdown(wait=True, cancel_futures=True)
         
         return True
     
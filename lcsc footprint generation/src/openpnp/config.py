@@ -3,10 +3,12 @@
 Handles finding and validating OpenPnP configuration directories.
 """
 
+import functools
 import os
 import platform
+import sys
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Set
 from dataclasses import dataclass
 
 
@@ -15,9 +17,13 @@ class OpenPnPConfigError(Exception):
     pass
 
 
+@functools.lru_cache(maxsize=1)
 def get_default_openpnp_path() -> Path:
     """Get the default OpenPnP configuration path for the current OS.
     
+    The result is cached; call get_default_openpnp_path.cache_clear()
+    if the home directory changes.
+    
     Returns:
         Default path to .openpnp2 directory
     """
@@ -32,6 +38,40 @@ def get_default_openpnp_path() -> Path:
         return home / ".openpnp2"
 
 
+# Windows and macOS file systems compare names case-insensitively by default
+_CASE_INSENSITIVE_FS = sys.platform in ("win32", "darwin")
+
+
+def _fold_name(name: str) -> str:
+    """Fold a file name for comparison the way the file system does."""
+    return name.casefold() if _CASE_INSENSITIVE_FS else name
+
+
+def _list_dir_names(path: Path) -> Optional[Set[str]]:
+    """List the entry names of a directory with a single scandir call.
+    
+    Names are passed through _fold_name(), so looking up a folded name
+    matches any case on Windows and macOS. Dangling symlinks are left
+    out, as Path.exists() reports them missing.
+    
+    Args:
+        path: Directory to list
+        
+    Returns:
+        Set of folded entry names, or None if path is not a readable
+        directory
+    """
+    try:
+        with os.scandir(path) as entries:
+            return {
+                _fold_name(entry.name) for entry in entries
+                # Only symlinks need the extra stat
+                if not entry.is_symlink() or os.path.exists(entry.path)
+            }
+    except OSError:
+        return None
+
+
 def find_openpnp_config() -> Optional[Path]:
     """Find the OpenPnP configuration directory.
     
@@ -42,10 +82,10 @@ def find_openpnp_config() -> Optional[Path]:
     """
     default_path = get_default_openpnp_path()
     
-    if default_path.exists() and default_path.is_dir():
-        # Verify it contains expected files
-        if (default_path / "packages.xml").exists() or (default_path / "parts.xml").exists():
-            return default_path
+    # Verify it contains expected files
+    names = _list_dir_names(default_path)
+    if names and not names.isdisjoint(("packages.xml", "parts.xml")):
+        return default_path
     
     return None
 
@@ -59,19 +99,13 @@ def validate_openpnp_config(path: Path) -> bool:
     Returns:
         True if path appears to be a valid OpenPnP config directory
     """
-    if not path.exists():
-        return False
-    
-    if not path.is_dir():
+    names = _list_dir_names(path)
+    if names is None:
         return False
     
     # Check for at least one expected file
-    expected_files = ["machine.xml", "packages.xml", "parts.xml", "vision-settings.xml"]
-    for filename in expected_files:
-        if (path / filename).exists():
-            return True
-    
-    return False
+    expected_files = ("machine.xml", "packages.xml", "parts.xml", "vision-settings.xml")
+    return not names.isdisjoint(expected_files)
 
 
 @dataclass
@@ -87,27 +121,30 @@ class OpenPnPConfig:
     """
     config_dir: Path
     
-    @property
+    # The path properties below are cached, so config_dir must not be
+    # reassigned after construction
+    
+    @functools.cached_property
     def packages_file(self) -> Path:
         """Path to packages.xml."""
         return self.config_dir / "packages.xml"
     
-    @property
+    @functools.cached_property
     def parts_file(self) -> Path:
         """Path to parts.xml."""
         return self.config_dir / "parts.xml"
     
-    @property
+    @functools.cached_property
     def machine_file(self) -> Path:
         """Path to machine.xml."""
         return self.config_dir / "machine.xml"
     
-    @property
+    @functools.cached_property
     def backup_dir(self) -> Path:
         """Path to backup directory within config."""
         return self.config_dir / "backup"
     
-    @property
+    @functools.cached_property
     def footprint_manager_backup_dir(self) -> Path:
         """Path to this application's backup directory."""
         return self.config_dir / "footprint_manager_backups"
@@ -134,10 +171,13 @@ class OpenPnPConfig:
         Raises:
             OpenPnPConfigError: If files cannot be created
         """
-        if not self.packages_exists():
+        # One directory listing answers both checks
+        names = _list_dir_names(self.config_dir) or set()
+        
+        if _fold_name("packages.xml") not in names:
             self._create_empty_packages()
         
-        if not self.parts_exists():
+        if _fold_name("parts.xml") not in names:
             self._create_empty_parts()
     
     def _create_empty_packages(self) -> None:
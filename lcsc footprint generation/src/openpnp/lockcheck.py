@@ -0,0 +1,63 @@
+"""Detect other processes holding OpenPnP configuration files.
+
+A best-effort check: a held lock on packages.xml means another process
+has it open for writing, but OpenPnP doesn't always take one, so a free
+file doesn't prove OpenPnP is closed.
+"""
+
+import os
+from pathlib import Path
+
+if os.name == "nt":
+    import msvcrt
+else:
+    import fcntl
+
+
+def is_file_locked(path: Path) -> bool:
+    """Check whether another process holds a lock on a file.
+
+    Args:
+        path: File to check
+
+    Returns:
+        True if the file is locked by another process, False if it is
+        free, missing or can't be opened
+    """
+    try:
+        # msvcrt.locking() works on a read-only handle, so a read-only
+        # file isn't mistaken for a locked one on Windows; POSIX write
+        # locks need the file open for writing
+        handle = open(path, "rb" if os.name == "nt" else "r+b")
+    except OSError:
+        # Includes PermissionError from read-only files and ACLs, which
+        # says nothing about other processes
+        return False
+
+    with handle:
+        try:
+            if os.name == "nt":
+                msvcrt.locking(handle.fileno(), msvcrt.LK_NBLCK, 1)
+                msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                # lockf() uses POSIX record locks, which is what Java's
+                # FileChannel.lock() takes on Linux and macOS
+                fcntl.lockf(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                fcntl.lockf(handle, fcntl.LOCK_UN)
+        except OSError:
+            return True
+    return False
+
+
+def is_openpnp_running(config_path: Path) -> bool:
+    """Check whether OpenPnP appears to have its configuration open.
+
+    Args:
+        config_path: OpenPnP configuration directory
+
+    Returns:
+        True if packages.xml or parts.xml is locked by another process
+    """
+    return any(
+        is_file_locked(config_path / name) for name in ("packages.xml", "parts.xml")
+    )
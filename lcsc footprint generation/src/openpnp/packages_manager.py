@@ -4,11 +4,10 @@ Handles reading, writing, and modifying package (footprint) definitions.
 """
 
 from pathlib import Path
-from typing import Optional, Dict
+from typing import Optional, Dict, Iterable, KeysView, Set
 from lxml import etree
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent))
-from models.footprint import Package, Footprint, Pad
+from ..models.footprint import Package
+from .atomic_write import atomic_write
 
 
 class PackagesManagerError(Exception):
@@ -22,6 +21,9 @@ class PackagesManager:
     Provides methods to read, modify, and write package definitions.
     """
     
+    # Compiled once; fallback for elements missing from the id index
+    _FIND_PACKAGE = etree.XPath("package[@id=$pid]")
+    
     def __init__(self, packages_file: Path):
         """Initialize packages manager.
         
@@ -29,7 +31,15 @@ class PackagesManager:
             packages_file: Path to packages.xml
         """
         self._filepath = packages_file
-        self._packages: Dict[str, Package] = {}
+        # Package per id; None until first accessed after a full load
+        self._packages: Dict[str, Optional[Package]] = {}
+        # <package> element for each id, so updates don't rescan the tree
+        self._package_elems: Dict[str, etree._Element] = {}
+        # Lowercased ids for find_similar_packages, in _packages order
+        self._package_ids_lower: Dict[str, str] = {}
+        # Edits not yet applied to the XML tree; flushed once in save()
+        self._pending_adds: Dict[str, Package] = {}
+        self._pending_removes: Set[str] = set()
         self._tree: Optional[etree._ElementTree] = None
         self._root: Optional[etree._Element] = None
         self._modified = False
@@ -55,15 +65,22 @@ class PackagesManager:
         Raises:
             PackagesManagerError: If loading fails
         """
+        self._pending_adds = {}
+        self._pending_removes = set()
+        
         if not self._filepath.exists():
             # Create empty file
             self._root = etree.Element("openpnp-packages")
             self._tree = etree.ElementTree(self._root)
             self._packages = {}
+            self._package_elems = {}
+            self._package_ids_lower = {}
             return
         
         try:
-            parser = etree.XMLParser(remove_blank_text=True)
+            # No IDs, entities or network access are needed for OpenPnP files
+            parser = etree.XMLParser(remove_blank_text=True, collect_ids=False,
+                                     resolve_entities=False, no_network=True)
             self._tree = etree.parse(str(self._filepath), parser)
             self._root = self._tree.getroot()
         except etree.XMLSyntaxError as e:
@@ -71,39 +88,82 @@ class PackagesManager:
         except IOError as e:
             raise PackagesManagerError(f"Failed to read packages.xml: {e}")
         
-        # Parse packages
-        self._packages = {}
-        for package_elem in self._root.findall("package"):
-            try:
-                package = Package.from_xml_element(package_elem)
-                self._packages[package.id] = package
-            except (KeyError, ValueError) as e:
-                # Skip malformed packages
-                continue
+        # Index packages; each one is parsed when first accessed. Malformed
+        # ones are checked and skipped here, so membership and counts
+        # don't depend on which packages were parsed so far
+        is_valid = Package.is_valid_xml_element
+        self._package_elems = {}
+        for package_elem in self._root.iterchildren("package"):
+            # First element wins, matching the old findall-based removal
+            package_id = package_elem.get("id")
+            if package_id not in self._package_elems and is_valid(package_elem):
+                self._package_elems[package_id] = package_elem
+        self._package_elems.pop(None, None)
+        # fromkeys on a dict sizes the new table once, in the same order
+        self._packages = dict.fromkeys(self._package_elems)
         
+        self._index_lowercase_ids()
         self._modified = False
     
+    def _index_lowercase_ids(self) -> None:
+        """Rebuild the lowercase id lookup from the loaded packages."""
+        self._package_ids_lower = {
+            package_id: package_id.lower() for package_id in self._packages
+        }
+    
+    def _check_writable(self) -> None:
+        """Ensure the loaded packages can be modified.
+        
+        Raises:
+            PackagesManagerError: If nothing is loaded
+        """
+        if self._root is None:
+            raise PackagesManagerError("No packages loaded")
+    
     def save(self) -> None:
         """Save packages to XML file.
         
         Raises:
             PackagesManagerError: If saving fails
         """
-        if self._root is None:
-            raise PackagesManagerError("No packages loaded")
+        self._check_writable()
+        self._flush_pending()
         
         try:
-            # Write with proper formatting
-            self._tree.write(
-                str(self._filepath),
-                encoding="UTF-8",
-                xml_declaration=True,
-                pretty_print=True
-            )
+            # Indent in place, then stream one package at a time to disk
+            # instead of serializing the whole tree into a single buffer
+            etree.indent(self._root)
+            with atomic_write(self._filepath) as f:
+                with etree.xmlfile(f, encoding="UTF-8") as xf:
+                    xf.write_declaration()
+                    with xf.element(self._root.tag, self._root.attrib):
+                        # Skip indentation left over from removed children
+                        if len(self._root) and self._root.text:
+                            xf.write(self._root.text)
+                        for package_elem in self._root:
+                            xf.write(package_elem)
+                f.write(b"\n")
             self._modified = False
         except IOError as e:
             raise PackagesManagerError(f"Failed to write packages.xml: {e}")
     
+    def _flush_pending(self) -> None:
+        """Apply buffered add/update/remove edits to the XML tree."""
+        if not self._pending_adds and not self._pending_removes:
+            return
+        
+        # Updated packages lose their old element and are re-appended
+        for package_id in self._pending_removes | self._pending_adds.keys():
+            self._remove_package_elem(package_id)
+        
+        # Build every element first, then attach them in one call
+        package_elems = [package.to_xml_element() for package in self._pending_adds.values()]
+        self._root.extend(package_elems)
+        self._package_elems.update(zip(self._pending_adds, package_elems))
+        
+        self._pending_adds = {}
+        self._pending_removes = set()
+    
     def get_package(self, package_id: str) -> Optional[Package]:
         """Get a package by ID.
         
@@ -113,7 +173,30 @@ class PackagesManager:
         Returns:
             Package if found, None otherwise
         """
-        return self._packages.get(package_id)
+        package = self._packages.get(package_id)
+        if package is None and package_id in self._packages:
+            package = self._parse_package(package_id)
+        return package
+    
+    def _parse_package(self, package_id: str) -> Optional[Package]:
+        """Build the Package for an indexed element on first access.
+        
+        Args:
+            package_id: Package identifier
+            
+        Returns:
+            Package, or None if the element is malformed
+        """
+        try:
+            package = Package.from_xml_element(self._package_elems[package_id])
+        except (KeyError, ValueError):
+            # Skip malformed packages, as an eager load would have
+            del self._packages[package_id]
+            del self._package_ids_lower[package_id]
+            return None
+        
+        self._packages[package_id] = package
+        return package
     
     def has_package(self, package_id: str) -> bool:
         """Check if a package exists.
@@ -134,6 +217,17 @@ class PackagesManager:
         """
         return list(self._packages.keys())
     
+    def package_ids(self) -> KeysView[str]:
+        """Get a live, set-like view of the package IDs.
+        
+        Unlike list_packages(), nothing is copied, so it is cheap to use
+        for bulk membership tests.
+        
+        Returns:
+            View of package IDs
+        """
+        return self._packages.keys()
+    
     def add_package(self, package: Package) -> None:
         """Add a new package.
         
@@ -143,20 +237,36 @@ class PackagesManager:
         Raises:
             PackagesManagerError: If package already exists
         """
-        if self._root is None:
-            raise PackagesManagerError("No packages loaded")
+        self._check_writable()
         
         if package.id in self._packages:
             raise PackagesManagerError(f"Package already exists: {package.id}")
         
-        # Add to XML tree
-        package_elem = package.to_xml_element()
-        self._root.append(package_elem)
-        
-        # Add to internal dict
+        # Queue for the XML tree and add to internal dicts
+        self._pending_adds[package.id] = package
         self._packages[package.id] = package
+        self._package_ids_lower[package.id] = package.id.lower()
         self._modified = True
     
+    def add_packages(self, packages: Iterable[Package], update_existing: bool = True) -> None:
+        """Add several packages, replacing existing ones.
+        
+        Edits are buffered until save(), so the tree is rewritten once
+        however many packages are given.
+        
+        Args:
+            packages: Packages to add
+            update_existing: Replace existing packages instead of raising
+            
+        Raises:
+            PackagesManagerError: If a package exists and update_existing is False
+        """
+        for package in packages:
+            if update_existing and package.id in self._packages:
+                self.update_package(package)
+            else:
+                self.add_package(package)
+    
     def update_package(self, package: Package) -> None:
         """Update an existing package.
         
@@ -166,21 +276,14 @@ class PackagesManager:
         Raises:
             PackagesManagerError: If package doesn't exist
         """
-        if self._root is None:
-            raise PackagesManagerError("No packages loaded")
+        self._check_writable()
         
         if package.id not in self._packages:
             raise PackagesManagerError(f"Package not found: {package.id}")
         
-        # Find and remove old element
-        for elem in self._root.findall("package"):
-            if elem.get("id") == package.id:
-                self._root.remove(elem)
-                break
-        
-        # Add updated element
-        package_elem = package.to_xml_element()
-        self._root.append(package_elem)
+        # Queue the replacement at the end, as the old remove/append did
+        self._pending_adds.pop(package.id, None)
+        self._pending_adds[package.id] = package
         
         # Update internal dict
         self._packages[package.id] = package
@@ -195,22 +298,36 @@ class PackagesManager:
         Raises:
             PackagesManagerError: If package doesn't exist
         """
-        if self._root is None:
-            raise PackagesManagerError("No packages loaded")
+        self._check_writable()
         
-        if package_id not in self._packages:
+        # Remove from internal dict; one lookup doubles as the existence check
+        try:
+            del self._packages[package_id]
+        except KeyError:
             raise PackagesManagerError(f"Package not found: {package_id}")
         
-        # Remove from XML tree
-        for elem in self._root.findall("package"):
-            if elem.get("id") == package_id:
-                self._root.remove(elem)
-                break
+        # Queue removal from the XML tree
+        self._pending_adds.pop(package_id, None)
+        self._pending_removes.add(package_id)
         
-        # Remove from internal dict
-        del self._packages[package_id]
+        del self._package_ids_lower[package_id]
         self._modified = True
     
+    def _remove_package_elem(self, package_id: str) -> None:
+        """Detach a package's element from the XML tree.
+        
+        Args:
+            package_id: ID of package whose element to remove
+        """
+        elem = self._package_elems.pop(package_id, None)
+        if elem is None:
+            # e.g. a later duplicate of an id whose first element was removed
+            matches = self._FIND_PACKAGE(self._root, pid=package_id)
+            elem = matches[0] if matches else None
+        if elem is not None:
+            # lxml unlinks the node directly; no scan over siblings
+            elem.getparent().remove(elem)
+    
     def get_package_count(self) -> int:
         """Get the number of packages.
         
@@ -230,11 +347,12 @@ class PackagesManager:
         Returns:
             List of packages with matching base names
         """
-        similar = []
         base_lower = base_name.lower()
         
-        for package_id, package in self._packages.items():
-            if base_lower in package_id.lower():
-                similar.append(package)
-        
-        return similar
+        # Only matching packages are parsed
+        matches = [
+            package_id
+            for package_id, id_lower in self._package_ids_lower.items()
+            if base_lower in id_lower
+        ]
+        return [p for p in map(self.get_package, matches) if p is not None]
@@ -4,11 +4,10 @@ Handles reading, writing, and modifying part definitions.
 """
 
 from pathlib import Path
-from typing import Optional, Dict
+from typing import Optional, Dict, Iterable, KeysView, List
 from lxml import etree
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent))
-from models.part import Part
+from ..models.part import Part
+from .atomic_write import atomic_write
 
 
 class PartsManagerError(Exception):
@@ -22,6 +21,12 @@ class PartsManager:
     Provides methods to read, modify, and write part definitions.
     """
     
+    # Write buffer for save(); most files go out in a single write
+    WRITE_BUFFER_SIZE = 1 << 20
+    
+    # Compiled once; fallback for elements missing from the id index
+    _FIND_PART = etree.XPath("part[@id=$pid]")
+    
     def __init__(self, parts_file: Path):
         """Initialize parts manager.
         
@@ -30,6 +35,10 @@ class PartsManager:
         """
         self._filepath = parts_file
         self._parts: Dict[str, Part] = {}
+        # Parts per package id, in _parts order; built on demand
+        self._parts_by_package: Optional[Dict[str, List[Part]]] = None
+        # <part> element for each id, so updates don't rescan the tree
+        self._part_elems: Dict[str, etree._Element] = {}
         self._tree: Optional[etree._ElementTree] = None
         self._root: Optional[etree._Element] = None
         self._modified = False
@@ -60,10 +69,14 @@ class PartsManager:
             self._root = etree.Element("openpnp-parts")
             self._tree = etree.ElementTree(self._root)
             self._parts = {}
+            self._parts_by_package = None
+            self._part_elems = {}
             return
         
         try:
-            parser = etree.XMLParser(remove_blank_text=True)
+            # No IDs, entities or network access are needed for OpenPnP files
+            parser = etree.XMLParser(remove_blank_text=True, collect_ids=False,
+                                     resolve_entities=False, no_network=True)
             self._tree = etree.parse(str(self._filepath), parser)
             self._root = self._tree.getroot()
         except etree.XMLSyntaxError as e:
@@ -73,7 +86,11 @@ class PartsManager:
         
         # Parse parts
         self._parts = {}
-        for part_elem in self._root.findall("part"):
+        self._parts_by_package = None
+        self._part_elems = {}
+        for part_elem in self._root.iterchildren("part"):
+            # First element wins, matching the old scan-based removal
+            self._part_elems.setdefault(part_elem.get("id"), part_elem)
             try:
                 part = Part.from_xml_element(part_elem)
                 self._parts[part.id] = part
@@ -83,22 +100,37 @@ class PartsManager:
         
         self._modified = False
     
+    def _check_writable(self) -> None:
+        """Ensure the loaded parts can be modified.
+        
+        Raises:
+            PartsManagerError: If nothing is loaded
+        """
+        if self._root is None:
+            raise PartsManagerError("No parts loaded")
+    
     def save(self) -> None:
         """Save parts to XML file.
         
         Raises:
             PartsManagerError: If saving fails
         """
-        if self._root is None:
-            raise PartsManagerError("No parts loaded")
+        self._check_writable()
         
         try:
-            self._tree.write(
-                str(self._filepath),
-                encoding="UTF-8",
-                xml_declaration=True,
-                pretty_print=True
-            )
+            # Indent in place, then stream one part at a time into a large
+            # buffer instead of serializing the whole tree into one string
+            etree.indent(self._root)
+            with atomic_write(self._filepath, buffering=self.WRITE_BUFFER_SIZE) as f:
+                with etree.xmlfile(f, encoding="UTF-8") as xf:
+                    xf.write_declaration()
+                    with xf.element(self._root.tag, self._root.attrib):
+                        # Skip indentation left over from removed children
+                        if len(self._root) and self._root.text:
+                            xf.write(self._root.text)
+                        for part_elem in self._root:
+                            xf.write(part_elem)
+                f.write(b"\n")
             self._modified = False
         except IOError as e:
             raise PartsManagerError(f"Failed to write parts.xml: {e}")
@@ -133,6 +165,17 @@ class PartsManager:
         """
         return list(self._parts.keys())
     
+    def part_ids(self) -> KeysView[str]:
+        """Get a live, set-like view of the part IDs.
+        
+        Unlike list_parts(), nothing is copied, so it is cheap to use
+        for bulk membership tests.
+        
+        Returns:
+            View of part IDs
+        """
+        return self._parts.keys()
+    
     def add_part(self, part: Part) -> None:
         """Add a new part.
         
@@ -142,8 +185,7 @@ class PartsManager:
         Raises:
             PartsManagerError: If part already exists
         """
-        if self._root is None:
-            raise PartsManagerError("No parts loaded")
+        self._check_writable()
         
         if part.id in self._parts:
             raise PartsManagerError(f"Part already exists: {part.id}")
@@ -151,9 +193,11 @@ class PartsManager:
         # Add to XML tree
         part_elem = part.to_xml_element()
         self._root.append(part_elem)
+        self._part_elems.setdefault(part.id, part_elem)
         
         # Add to internal dict
         self._parts[part.id] = part
+        self._parts_by_package = None
         self._modified = True
     
     def update_part(self, part: Part) -> None:
@@ -165,24 +209,62 @@ class PartsManager:
         Raises:
             PartsManagerError: If part doesn't exist
         """
-        if self._root is None:
-            raise PartsManagerError("No parts loaded")
+        self._check_writable()
         
         if part.id not in self._parts:
             raise PartsManagerError(f"Part not found: {part.id}")
         
-        # Find and remove old element
-        for elem in self._root.findall("part"):
-            if elem.get("id") == part.id:
-                self._root.remove(elem)
-                break
-        
-        # Add updated element
+        # Remove old element and add updated one at the end
+        self._remove_part_elem(part.id)
         part_elem = part.to_xml_element()
         self._root.append(part_elem)
+        self._part_elems[part.id] = part_elem
         
         # Update internal dict
         self._parts[part.id] = part
+        self._parts_by_package = None
+        self._modified = True
+    
+    def add_parts(self, parts: Iterable[Part], update_existing: bool = True) -> None:
+        """Add several parts, replacing existing ones in a single tree pass.
+        
+        The result is the same as calling add_part() or update_part() for
+        each part in order.
+        
+        Args:
+            parts: Parts to add
+            update_existing: Replace existing parts instead of raising
+            
+        Raises:
+            PartsManagerError: If a part exists and update_existing is False
+        """
+        self._check_writable()
+        
+        # Re-seen IDs move to the end, as a later update_part() would
+        pending: Dict[str, Part] = {}
+        duplicates: List[str] = []
+        for part in parts:
+            if not update_existing and (part.id in self._parts or part.id in pending):
+                duplicates.append(part.id)
+            pending.pop(part.id, None)
+            pending[part.id] = part
+        # Checked up front so a rejected batch leaves nothing half-applied
+        if duplicates:
+            raise PartsManagerError(f"Parts already exist: {', '.join(duplicates)}")
+        if not pending:
+            return
+        
+        # Drop the first element of each replaced part
+        for part_id in pending:
+            if part_id in self._parts:
+                self._remove_part_elem(part_id)
+        
+        # Build every element first, then attach them in one call
+        part_elems = [part.to_xml_element() for part in pending.values()]
+        self._root.extend(part_elems)
+        self._part_elems.update(zip(pending, part_elems))
+        self._parts.update(pending)
+        self._parts_by_package = None
         self._modified = True
     
     def remove_part(self, part_id: str) -> None:
@@ -194,22 +276,34 @@ class PartsManager:
         Raises:
             PartsManagerError: If part doesn't exist
         """
-        if self._root is None:
-            raise PartsManagerError("No parts loaded")
+        self._check_writable()
         
         if part_id not in self._parts:
             raise PartsManagerError(f"Part not found: {part_id}")
         
         # Remove from XML tree
-        for elem in self._root.findall("part"):
-            if elem.get("id") == part_id:
-                self._root.remove(elem)
-                break
+        self._remove_part_elem(part_id)
         
         # Remove from internal dict
         del self._parts[part_id]
+        self._parts_by_package = None
         self._modified = True
     
+    def _remove_part_elem(self, part_id: str) -> None:
+        """Detach a part's element from the XML tree.
+        
+        Args:
+            part_id: ID of part whose element to remove
+        """
+        elem = self._part_elems.pop(part_id, None)
+        if elem is None:
+            # e.g. a later duplicate of an id whose first element was removed
+            matches = self._FIND_PART(self._root, pid=part_id)
+            elem = matches[0] if matches else None
+        if elem is not None:
+            # lxml unlinks the node directly; no scan over siblings
+            self._root.remove(elem)
+    
     def get_part_count(self) -> int:
         """Get the number of parts.
         
@@ -218,6 +312,26 @@ class PartsManager:
         """
         return len(self._parts)
     
+    def _package_index(self) -> Dict[str, List[Part]]:
+        """Get the parts grouped by package id, building it if needed.
+        
+        The index is dropped whenever parts are loaded or edited through
+        the manager, so a part's package_id changed in place is only seen
+        after update_part().
+        
+        Returns:
+            Dict mapping package id to its parts, in _parts order
+        """
+        if self._parts_by_package is None:
+            index: Dict[str, List[Part]] = {}
+            for part in self._parts.values():
+                parts = index.get(part.package_id)
+                if parts is None:
+                    index[part.package_id] = parts = []
+                parts.append(part)
+            self._parts_by_package = index
+        return self._parts_by_package
+    
     def find_parts_by_package(self, package_id: str) -> list[Part]:
         """Find all parts using a specific package.
         
@@ -227,7 +341,7 @@ class PartsManager:
         Returns:
             List of parts using that package
         """
-        return [p for p in self._parts.values() if p.package_id == package_id]
+        return list(self._package_index().get(package_id, ()))
     
     def get_used_packages(self) -> set[str]:
         """Get set of all package IDs used by parts.
@@ -235,4 +349,4 @@ class PartsManager:
         Returns:
             Set of package IDs
         """
-        return {p.package_id for p in self._parts.values()}
+        return set(self._package_index())
@@ -5,11 +5,26 @@ Handles the conversion from EasyEDA's JSON format to OpenPnP's XML structures.
 
 from typing import Dict, Any, List, Optional
 from dataclasses import dataclass
+from datetime import datetime
+import json
 import math
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent))
-from models.footprint import Pad, Footprint, Package
+from ..models.footprint import Pad, Footprint, Package
+
+
+# Pad roundness per EasyEDA shape: 100 = fully round (circle), 50 = oval;
+# anything else (RECT) is 0 = rectangular
+_SHAPE_ROUNDNESS = {"ROUND": 100.0, "CIRCLE": 100.0, "OVAL": 50.0}
+
+# Numeric shape codes EasyEDA sometimes uses instead of names
+_SHAPE_CODES = {1: "RECT", 2: "ROUND", 3: "OVAL", 4: "ELLIPSE"}
+
+# Known shape names in the spellings seen in responses, mapped to the
+# shared uppercase constants so most pads skip str.upper()
+_CANONICAL_SHAPES = {
+    spelling: shape
+    for shape in ("RECT", "ROUND", "OVAL", "ELLIPSE", "CIRCLE", "POLYGON")
+    for spelling in (shape, shape.lower(), shape.capitalize())
+}
 
 
 class FootprintParseError(Exception):
@@ -17,7 +32,7 @@ class FootprintParseError(Exception):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class EasyEDAPad:
     """Raw pad data from EasyEDA format.
     
@@ -46,12 +61,16 @@ class FootprintParser:
     # 1 EasyEDA unit = 10 mils = 0.254 mm
     UNITS_TO_MM = 0.254
     
+    # Pad count above which pads are converted with NumPy; below it the
+    # array setup costs more than converting pad by pad
+    VECTORIZE_MIN_PADS = 64
+    
     def __init__(self):
         """Initialize parser."""
         pass
     
     def parse(self, data: Dict[str, Any], package_id: str, lcsc_id: Optional[str] = None,
-              session_id: Optional[str] = None) -> Package:
+              session_id: Optional[str] = None, import_date: Optional[str] = None) -> Package:
         """Parse EasyEDA data into an OpenPnP Package.
 
         Args:
@@ -59,6 +78,8 @@ class FootprintParser:
             package_id: ID to use for the package
             lcsc_id: LCSC part number (for metadata tracking)
             session_id: Import session ID (for bulk removal)
+            import_date: ISO timestamp to record; defaults to now, so a
+                batch can pass one shared value
 
         Returns:
             OpenPnP Package object
@@ -89,14 +110,14 @@ class FootprintParser:
         if not pads:
             raise FootprintParseError("No valid pads found")
         
-        # Convert to mm coordinates
-        mm_pads = [self._convert_pad_to_mm(p) for p in pads]
-        
-        # Calculate body dimensions from pad extents
-        body_width, body_height = self._calculate_body_size(mm_pads)
-        
-        # Center the footprint
-        mm_pads = self._center_footprint(mm_pads)
+        if len(pads) >= self.VECTORIZE_MIN_PADS:
+            mm_pads, body_width, body_height = self._convert_pads_vectorized(pads)
+        else:
+            # Convert to mm coordinates
+            mm_pads = [self._convert_pad_to_mm(p) for p in pads]
+            
+            # Size the body from pad extents and center the footprint
+            body_width, body_height = self._size_and_center(mm_pads)
         
         # Create OpenPnP footprint
         footprint = Footprint(
@@ -108,9 +129,8 @@ class FootprintParser:
         # Determine description
         description = self._generate_description(mm_pads)
 
-        # Get current timestamp
-        from datetime import datetime
-        import_date = datetime.now().isoformat()
+        if import_date is None:
+            import_date = datetime.now().isoformat()
 
         return Package(
             id=package_id,
@@ -133,44 +153,34 @@ class FootprintParser:
         """
         # Try different possible locations for pad data
         # EasyEDA format varies between versions
+        datastr = data.get("dataStr")
 
         # Format 1: Shape array (current EasyEDA API format)
         # dataStr.shape contains array of strings like "PAD~RECT~x~y~w~h..."
-        if "dataStr" in data:
-            datastr = data["dataStr"]
-            if isinstance(datastr, dict) and "shape" in datastr:
-                shapes = datastr["shape"]
-                if isinstance(shapes, list):
-                    # Parse PAD strings
-                    pads_dict = {}
-                    for shape_str in shapes:
-                        if isinstance(shape_str, str) and shape_str.startswith("PAD~"):
-                            pad = self._parse_pad_string(shape_str)
-                            if pad:
-                                pads_dict[pad.number] = pad
-                    if pads_dict:
-                        # Convert EasyEDAPad objects to dicts for compatibility
-                        return {k: self._easyeda_pad_to_dict(v) for k, v in pads_dict.items()}
+        if isinstance(datastr, dict):
+            shapes = datastr.get("shape")
+            if isinstance(shapes, list):
+                pads_dict = self._parse_shape_array(shapes)
+                if pads_dict:
+                    return pads_dict
 
         # Format 2: Direct PAD key
         if "PAD" in data:
             return data["PAD"]
 
         # Format 3: Nested in dataStr (JSON string)
-        if "dataStr" in data:
-            import json
+        if isinstance(datastr, (str, bytes, bytearray)):
             try:
-                inner = json.loads(data["dataStr"])
-                if "PAD" in inner:
-                    return inner["PAD"]
-            except (json.JSONDecodeError, TypeError):
-                pass
+                inner = json.loads(datastr)
+            except json.JSONDecodeError:
+                inner = None
+            if isinstance(inner, dict) and "PAD" in inner:
+                return inner["PAD"]
 
         # Format 4: In footprint object
-        if "footprint" in data:
-            fp = data["footprint"]
-            if isinstance(fp, dict) and "PAD" in fp:
-                return fp["PAD"]
+        fp = data.get("footprint")
+        if isinstance(fp, dict) and "PAD" in fp:
+            return fp["PAD"]
 
         # Format 5: Direct pad list
         if "pads" in data:
@@ -182,6 +192,25 @@ class FootprintParser:
 
         return {}
 
+    def _parse_shape_array(self, shapes: List[Any]) -> Dict[str, Any]:
+        """Extract pad data from an EasyEDA shape string array.
+
+        Args:
+            shapes: dataStr.shape entries; only "PAD~" strings are used
+
+        Returns:
+            Dict of pad data, empty if no valid PAD strings were found
+        """
+        # Parse PAD strings
+        pads_dict = {}
+        for shape_str in shapes:
+            if isinstance(shape_str, str) and shape_str.startswith("PAD~"):
+                pad = self._parse_pad_string(shape_str)
+                if pad:
+                    pads_dict[pad.number] = pad
+        # Convert EasyEDAPad objects to dicts for compatibility
+        return {k: self._easyeda_pad_to_dict(v) for k, v in pads_dict.items()}
+
     def _parse_pad_string(self, pad_str: str) -> Optional[EasyEDAPad]:
         """Parse EasyEDA PAD string format.
 
@@ -194,7 +223,8 @@ class FootprintParser:
         Returns:
             EasyEDAPad object or None if invalid
         """
-        parts = pad_str.split("~")
+        # Only fields up to rotation are read; the rest stays unsplit
+        parts = pad_str.split("~", 12)
         if len(parts) < 12:  # Need at least 12 parts to get rotation
             return None
 
@@ -259,10 +289,13 @@ class FootprintParser:
         
         # Get shape
         shape = pad_data.get("shape", "RECT")
-        if isinstance(shape, int):
+        if isinstance(shape, str):
+            shape = _CANONICAL_SHAPES.get(shape) or shape.upper()
+        elif isinstance(shape, int):
             # EasyEDA sometimes uses numeric shape codes
-            shape_map = {1: "RECT", 2: "ROUND", 3: "OVAL", 4: "ELLIPSE"}
-            shape = shape_map.get(shape, "RECT")
+            shape = _SHAPE_CODES.get(shape, "RECT")
+        else:
+            shape = "RECT"
         
         # Get coordinates
         try:
@@ -281,7 +314,7 @@ class FootprintParser:
         
         return EasyEDAPad(
             number=str(number),
-            shape=shape.upper() if isinstance(shape, str) else "RECT",
+            shape=shape,
             x=x,
             y=y,
             width=width,
@@ -309,15 +342,6 @@ class FootprintParser:
         width_mm = eda_pad.width * self.UNITS_TO_MM
         height_mm = eda_pad.height * self.UNITS_TO_MM
 
-        # Determine roundness from shape
-        # 100 = fully round (circle), 50 = oval, 0 = rectangular
-        if eda_pad.shape in ("ROUND", "CIRCLE"):
-            roundness = 100.0
-        elif eda_pad.shape == "OVAL":
-            roundness = 50.0
-        else:  # RECT
-            roundness = 0.0
-
         return Pad(
             name=eda_pad.number,
             x=x_mm,
@@ -325,16 +349,70 @@ class FootprintParser:
             width=width_mm,
             height=height_mm,
             rotation=eda_pad.rotation,
-            roundness=roundness
+            roundness=_SHAPE_ROUNDNESS.get(eda_pad.shape, 0.0)
         )
     
-    def _calculate_body_size(self, pads: List[Pad]) -> tuple[float, float]:
-        """Calculate component body size from pad positions.
+    def _convert_pads_vectorized(self, eda_pads: List[EasyEDAPad]) -> tuple[List[Pad], float, float]:
+        """Convert, size and center many pads at once with NumPy.
+        
+        Gives the same pads and body size as _convert_pad_to_mm() and
+        _size_and_center() in turn, but does the arithmetic on coordinate
+        columns instead of pad by pad.
+        
+        Args:
+            eda_pads: EasyEDA pads (more than two)
+            
+        Returns:
+            Tuple of (centered pads in mm, body_width, body_height)
+        """
+        import numpy as np
+        
+        # One row of (x, y, width, height) per pad, converted to mm with
+        # the Y axis inverted as in _convert_pad_to_mm()
+        coords = np.fromiter(
+            (v for p in eda_pads for v in (p.x, p.y, p.width, p.height)),
+            dtype=np.float64, count=4 * len(eda_pads)
+        ).reshape(-1, 4)
+        coords *= self.UNITS_TO_MM
+        np.negative(coords[:, 1], out=coords[:, 1])
+        x, y = coords[:, 0], coords[:, 1]
+        half_width, half_height = coords[:, 2] / 2, coords[:, 3] / 2
+        
+        # Body size from pad extents
+        body_width = float((x + half_width).max() - (x - half_width).min())
+        body_height = float((y + half_height).max() - (y - half_height).min())
+        
+        # Center on the mean pad position; accumulate() adds in pad order,
+        # so the result matches _size_and_center() exactly
+        center_x = float(np.add.accumulate(x)[-1]) / len(eda_pads)
+        center_y = float(np.add.accumulate(y)[-1]) / len(eda_pads)
+        
+        pads = [
+            Pad(
+                name=p.number,
+                x=cx,
+                y=cy,
+                width=width,
+                height=height,
+                rotation=p.rotation,
+                roundness=_SHAPE_ROUNDNESS.get(p.shape, 0.0)
+            )
+            for p, cx, cy, width, height in zip(
+                eda_pads, (x - center_x).tolist(), (y - center_y).tolist(),
+                coords[:, 2].tolist(), coords[:, 3].tolist()
+            )
+        ]
+        
+        return pads, max(body_width, 0.1), max(body_height, 0.1)
+    
+    def _size_and_center(self, pads: List[Pad]) -> tuple[float, float]:
+        """Calculate the body size and center the pads in one pass.
         
-        The body is estimated as slightly larger than pad extents.
+        The body is estimated from the pad extents, and the pads are
+        moved in place so the origin is at their mean position.
         
         Args:
-            pads: List of pads in mm
+            pads: List of pads in mm; modified in place
             
         Returns:
             Tuple of (body_width, body_height) in mm
@@ -342,13 +420,25 @@ class FootprintParser:
         if not pads:
             return (1.0, 1.0)
         
-        # Find pad extents
-        min_x = min(p.x - p.width / 2 for p in pads)
-        max_x = max(p.x + p.width / 2 for p in pads)
-        min_y = min(p.y - p.height / 2 for p in pads)
-        max_y = max(p.y + p.height / 2 for p in pads)
+        # Pad extents and position sums, gathered together
+        inf = math.inf
+        min_x = min_y = inf
+        max_x = max_y = -inf
+        sum_x = sum_y = 0.0
+        for p in pads:
+            x, y = p.x, p.y
+            half_width, half_height = p.width / 2, p.height / 2
+            if x - half_width < min_x:
+                min_x = x - half_width
+            if x + half_width > max_x:
+                max_x = x + half_width
+            if y - half_height < min_y:
+                min_y = y - half_height
+            if y + half_height > max_y:
+                max_y = y + half_height
+            sum_x += x
+            sum_y += y
         
-        # Body size with small margin
         width = max_x - min_x
         height = max_y - min_y
         
@@ -359,38 +449,14 @@ class FootprintParser:
             width = abs(pads[0].x - pads[1].x)
             height = max(p.height for p in pads)
         
-        return (max(width, 0.1), max(height, 0.1))
-    
-    def _center_footprint(self, pads: List[Pad]) -> List[Pad]:
-        """Center footprint so origin is at component center.
-        
-        Args:
-            pads: List of pads
-            
-        Returns:
-            New list with centered pads
-        """
-        if not pads:
-            return pads
-        
-        # Find center of all pads
-        center_x = sum(p.x for p in pads) / len(pads)
-        center_y = sum(p.y for p in pads) / len(pads)
-        
-        # Create new centered pads
-        centered = []
+        # Center on the mean pad position
+        center_x = sum_x / len(pads)
+        center_y = sum_y / len(pads)
         for p in pads:
-            centered.append(Pad(
-                name=p.name,
-                x=p.x - center_x,
-                y=p.y - center_y,
-                width=p.width,
-                height=p.height,
-                rotation=p.rotation,
-                roundness=p.roundness
-            ))
+            p.x -= center_x
+            p.y -= center_y
         
-        return centered
+        return (max(width, 0.1), max(height, 0.1))
     
     def _generate_description(self, pads: List[Pad]) -> str:
         """Generate description for the package.
@@ -413,15 +479,23 @@ class FootprintParser:
             return f"{pad_count}-pin IC"
 
 
-def parse_easyeda_response(data: Dict[str, Any], package_id: str) -> Package:
+def parse_easyeda_response(data: Dict[str, Any], package_id: str, lcsc_id: Optional[str] = None,
+                           session_id: Optional[str] = None,
+                           import_date: Optional[str] = None) -> Package:
     """Convenience function to parse EasyEDA response.
+
+    Being a top-level function, it can also be submitted to a process pool.
     
     Args:
         data: Raw API response data
         package_id: ID for the package
+        lcsc_id: Optional LCSC part number for metadata
+        session_id: Optional import session ID for metadata
+        import_date: Optional ISO timestamp; defaults to now
         
     Returns:
         OpenPnP Package
     """
     parser = FootprintParser()
-    return parser.parse(data, package_id)
+    return parser.parse(data, package_id, lcsc_id=lcsc_id, session_id=session_id,
+                        import_date=import_date)
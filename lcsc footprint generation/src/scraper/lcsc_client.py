@@ -5,17 +5,134 @@ Fetches footprint and component data from LCSC/EasyEDA services.
 Reference: https://github.com/uPesy/easyeda2kicad.py
 """
 
+import asyncio
+import functools
+import importlib.util
+import ssl
+import threading
+import time
+import certifi
 import httpx
 from typing import Optional, Dict, Any
 from dataclasses import dataclass
 import json
 
+from .response_cache import ResponseCache, CachedResponse
+
+try:
+    # Optional faster JSON decoder; its JSONDecodeError subclasses json's
+    import orjson
+except ImportError:
+    orjson = None
+
+# HTTP/2 needs the optional h2 package (httpx[http2])
+_HAS_H2 = importlib.util.find_spec("h2") is not None
+
+# Shared by the sync and async clients; one pool is kept per client session
+_CLIENT_HEADERS = {"User-Agent": "OpenPnP-Footprint-Manager/0.2"}
+_CLIENT_LIMITS = httpx.Limits(max_keepalive_connections=8, max_connections=16)
+
+
+@functools.lru_cache(maxsize=None)
+def _ssl_context() -> ssl.SSLContext:
+    """Get the TLS context shared by all clients.
+
+    Loading the CA bundle is most of the cost of creating a client, so
+    it is done once per process rather than once per fetch batch.
+    """
+    return ssl.create_default_context(cafile=certifi.where())
+
 
 class LCSCApiError(Exception):
     """Error communicating with LCSC API."""
     pass
 
 
+@functools.lru_cache(maxsize=4096)
+def _normalize_lcsc_id(lcsc_id: str) -> str:
+    """Clean up an LCSC part number (e.g., " 60490" -> "C60490").
+    
+    Cached since a BOM repeats the same few ids across many rows.
+    """
+    lcsc_id = lcsc_id.strip().upper()
+    if not lcsc_id.startswith("C"):
+        lcsc_id = "C" + lcsc_id
+    return lcsc_id
+
+
+def _component_info(data: Dict[str, Any], lcsc_id: str) -> tuple[str, str]:
+    """Extract (component UUID, title) from a products/<id>/components response.
+    
+    Raises:
+        LCSCApiError: If the response has no component UUID
+    """
+    if not data.get("success"):
+        raise LCSCApiError(f"API returned error for {lcsc_id}")
+    
+    result = data.get("result")
+    if not result:
+        raise LCSCApiError(f"No result data for {lcsc_id}")
+    
+    component_uuid = result.get("uuid")
+    title = result.get("title", f"Component {lcsc_id}")
+    
+    if not component_uuid:
+        raise LCSCApiError(f"No component UUID for {lcsc_id}")
+    
+    return component_uuid, title
+
+
+def _package_uuid(comp_data: Dict[str, Any], lcsc_id: str) -> str:
+    """Extract the package UUID from a components/<uuid> response.
+    
+    Raises:
+        LCSCApiError: If the response has no package UUID
+    """
+    comp_result = comp_data.get("result", {})
+    package_detail = comp_result.get("packageDetail")
+    
+    if not package_detail:
+        raise LCSCApiError(f"No package detail for {lcsc_id}")
+    
+    package_uuid = package_detail.get("uuid")
+    if not package_uuid:
+        raise LCSCApiError(f"No package UUID for {lcsc_id}")
+    
+    return package_uuid
+
+
+def _decode_json(response: httpx.Response) -> Any:
+    """Decode a JSON response body, using orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def _store_response(cache: ResponseCache, url: str, response: httpx.Response,
+                    data: Any) -> None:
+    """Cache a response body if it carries a result."""
+    # Don't persist API-level failures for the whole TTL
+    if isinstance(data, dict) and data.get("result"):
+        cache.put(url, data, response.headers.get("ETag"),
+                  response.headers.get("Last-Modified"))
+
+
+def _revalidate(cache: ResponseCache, url: str, cached: CachedResponse,
+                timeout: float) -> None:
+    """Refresh a stale cache entry; errors keep the stale data."""
+    try:
+        # Same TLS context, headers and protocol as the fetching clients
+        with httpx.Client(timeout=timeout, http2=_HAS_H2, verify=_ssl_context(),
+                          headers=_CLIENT_HEADERS) as client:
+            response = client.get(url, headers=cached.conditional_headers())
+        if response.status_code == 304:
+            cache.touch(url)
+        elif response.status_code == 200:
+            _store_response(cache, url, response, _decode_json(response))
+    except (httpx.HTTPError, json.JSONDecodeError):
+        pass
+
+
 @dataclass
 class EasyEDAComponent:
     """Raw component data from EasyEDA API.
@@ -43,18 +160,26 @@ class LCSCClient:
     EASYEDA_API_BASE = "https://easyeda.com/api"
     LCSC_API_BASE = "https://lcsc.com/api"
     
-    def __init__(self, timeout: float = 30.0):
+    # Connectivity probe; results are reused for a few seconds
+    CONNECTION_PROBE_URL = "https://easyeda.com/api"
+    CONNECTION_OK_TTL = 30.0
+    CONNECTION_FAIL_TTL = 5.0
+    _connection_status: Optional[tuple[float, bool]] = None  # (expires, reachable)
+    
+    def __init__(self, timeout: float = 30.0, cache: Optional[ResponseCache] = None):
         """Initialize LCSC client.
         
         Args:
             timeout: Request timeout in seconds
+            cache: Optional on-disk cache for API responses
         """
         self._timeout = timeout
+        self._cache = cache
         self._client: Optional[httpx.Client] = None
     
     def __enter__(self):
         """Context manager entry."""
-        self._client = httpx.Client(timeout=self._timeout)
+        self._client = self._new_client()
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
@@ -70,9 +195,57 @@ class LCSCClient:
             httpx.Client instance
         """
         if self._client is None:
-            self._client = httpx.Client(timeout=self._timeout)
+            self._client = self._new_client()
         return self._client
     
+    def _new_client(self) -> httpx.Client:
+        """Create a pooled keep-alive HTTP client.
+        
+        Returns:
+            httpx.Client instance
+        """
+        return httpx.Client(timeout=self._timeout, http2=_HAS_H2, verify=_ssl_context(),
+                            limits=_CLIENT_LIMITS, headers=_CLIENT_HEADERS)
+    
+    def _get_json(self, url: str, not_found: Optional[str] = None) -> Any:
+        """GET a JSON endpoint, going through the response cache.
+        
+        Stale cache entries are returned immediately and refreshed on a
+        background thread.
+        
+        Args:
+            url: Request URL
+            not_found: Error message to raise on a 404 response
+            
+        Returns:
+            Parsed JSON body
+            
+        Raises:
+            LCSCApiError: If the server returns 404 and not_found is set
+            httpx.HTTPError: If the request fails
+        """
+        if self._cache is not None:
+            cached = self._cache.get(url)
+            if cached is not None:
+                if not cached.is_fresh(self._cache.ttl):
+                    threading.Thread(
+                        target=_revalidate,
+                        args=(self._cache, url, cached, self._timeout),
+                        daemon=True
+                    ).start()
+                return cached.data
+        
+        response = self._ensure_client().get(url)
+        
+        if not_found and response.status_code == 404:
+            raise LCSCApiError(not_found)
+        
+        response.raise_for_status()
+        data = _decode_json(response)
+        if self._cache is not None:
+            _store_response(self._cache, url, response, data)
+        return data
+    
     def fetch_component(self, lcsc_id: str) -> EasyEDAComponent:
         """Fetch component data from EasyEDA API.
 
@@ -86,60 +259,13 @@ class LCSCClient:
             LCSCApiError: If fetch fails
         """
         # Clean up LCSC ID
-        lcsc_id = lcsc_id.strip().upper()
-        if not lcsc_id.startswith("C"):
-            lcsc_id = "C" + lcsc_id
-
-        client = self._ensure_client()
+        lcsc_id = _normalize_lcsc_id(lcsc_id)
 
         # Fetch component info from EasyEDA
         try:
-            # Step 1: Get component info (includes UUID and package UUID)
-            url = f"{self.EASYEDA_API_BASE}/products/{lcsc_id}/components"
-            response = client.get(url)
-
-            if response.status_code == 404:
-                raise LCSCApiError(f"Component not found: {lcsc_id}")
-
-            response.raise_for_status()
-            data = response.json()
-
-            if not data.get("success"):
-                raise LCSCApiError(f"API returned error for {lcsc_id}")
-
-            result = data.get("result")
-            if not result:
-                raise LCSCApiError(f"No result data for {lcsc_id}")
-
-            component_uuid = result.get("uuid")
-            title = result.get("title", f"Component {lcsc_id}")
-
-            if not component_uuid:
-                raise LCSCApiError(f"No component UUID for {lcsc_id}")
-
-            # Step 2: Fetch component details to get package UUID
-            comp_url = f"{self.EASYEDA_API_BASE}/components/{component_uuid}"
-            comp_response = client.get(comp_url)
-            comp_response.raise_for_status()
-            comp_data = comp_response.json()
-
-            comp_result = comp_data.get("result", {})
-            package_detail = comp_result.get("packageDetail")
-
-            if not package_detail:
-                raise LCSCApiError(f"No package detail for {lcsc_id}")
-
-            package_uuid = package_detail.get("uuid")
-            if not package_uuid:
-                raise LCSCApiError(f"No package UUID for {lcsc_id}")
-
-            # Step 3: Fetch actual footprint/package data
-            pkg_url = f"{self.EASYEDA_API_BASE}/components/{package_uuid}"
-            pkg_response = client.get(pkg_url)
-            pkg_response.raise_for_status()
-            pkg_data = pkg_response.json()
-
-            footprint_data = pkg_data.get("result")
+            component_uuid, title = self._get_component_info(lcsc_id)
+            package_uuid = self._get_package_uuid(component_uuid, lcsc_id)
+            footprint_data = self._fetch_footprint_data(package_uuid)
 
             return EasyEDAComponent(
                 lcsc_id=lcsc_id,
@@ -152,113 +278,169 @@ class LCSCClient:
         except json.JSONDecodeError as e:
             raise LCSCApiError(f"Invalid JSON response for {lcsc_id}: {e}")
     
-    def _get_component_uuid(self, lcsc_id: str) -> Optional[str]:
-        """Get EasyEDA component UUID from LCSC ID.
+    def _get_component_info(self, lcsc_id: str) -> tuple[str, str]:
+        """Step 1: get the EasyEDA component UUID and title for an LCSC ID.
         
         Args:
-            lcsc_id: LCSC part number
+            lcsc_id: Normalized LCSC part number
             
         Returns:
-            Component UUID if found, None otherwise
+            (component UUID, title) tuple
+            
+        Raises:
+            LCSCApiError: If the component is unknown
         """
-        client = self._ensure_client()
-        
-        # EasyEDA API endpoint for component lookup
-        # Based on easyeda2kicad reverse engineering
         url = f"{self.EASYEDA_API_BASE}/products/{lcsc_id}/components"
-        
-        try:
-            response = client.get(url)
-            
-            if response.status_code == 404:
-                return None
-            
-            response.raise_for_status()
-            data = response.json()
-            
-            # Extract component UUID from response
-            # The exact structure depends on EasyEDA's API
-            if isinstance(data, dict) and "result" in data:
-                result = data["result"]
-                if isinstance(result, list) and len(result) > 0:
-                    return result[0].get("uuid")
-            
-            return None
-            
-        except httpx.HTTPError:
-            return None
+        data = self._get_json(url, not_found=f"Component not found: {lcsc_id}")
+        return _component_info(data, lcsc_id)
     
-    def _fetch_footprint_data(self, component_uuid: str) -> Optional[Dict[str, Any]]:
-        """Fetch footprint data for a component.
+    def _get_package_uuid(self, component_uuid: str, lcsc_id: str) -> str:
+        """Step 2: get the package UUID from the component details.
         
         Args:
             component_uuid: EasyEDA component UUID
+            lcsc_id: LCSC part number, for error messages
             
         Returns:
-            Footprint data dict if found, None otherwise
+            Package UUID
+            
+        Raises:
+            LCSCApiError: If the component has no package
         """
-        client = self._ensure_client()
-        
-        # EasyEDA API for footprint data
         url = f"{self.EASYEDA_API_BASE}/components/{component_uuid}"
+        return _package_uuid(self._get_json(url), lcsc_id)
+    
+    def _fetch_footprint_data(self, package_uuid: str) -> Optional[Dict[str, Any]]:
+        """Step 3: fetch the footprint/package data.
         
-        try:
-            response = client.get(url)
-            response.raise_for_status()
-            data = response.json()
-            
-            if isinstance(data, dict) and "result" in data:
-                return data["result"]
-            
-            return None
+        Many components share a package, so this response is often
+        already in the cache.
+        
+        Args:
+            package_uuid: EasyEDA package UUID
             
-        except httpx.HTTPError:
-            return None
+        Returns:
+            Footprint data dict if present, None otherwise
+        """
+        url = f"{self.EASYEDA_API_BASE}/components/{package_uuid}"
+        return self._get_json(url).get("result")
     
     def check_connection(self) -> bool:
         """Check if API is reachable.
         
+        The result is shared across clients for a short time so repeated
+        probes don't each pay for a round trip.
+        
         Returns:
             True if API responds, False otherwise
         """
+        cached = LCSCClient._connection_status
+        if cached is not None and time.monotonic() < cached[0]:
+            return cached[1]
+        
         client = self._ensure_client()
         
         try:
-            response = client.get("https://easyeda.com/", timeout=5.0)
-            return response.status_code == 200
+            # HEAD avoids downloading the page body
+            response = client.head(self.CONNECTION_PROBE_URL, timeout=2.0,
+                                   follow_redirects=True)
+            reachable = response.status_code < 500
         except httpx.HTTPError:
-            return False
+            reachable = False
+        
+        ttl = self.CONNECTION_OK_TTL if reachable else self.CONNECTION_FAIL_TTL
+        LCSCClient._connection_status = (time.monotonic() + ttl, reachable)
+        return reachable
 
 
-# Async version for future GUI integration
 class AsyncLCSCClient:
     """Async client for LCSC/EasyEDA APIs.
     
-    For use with asyncio in GUI applications.
+    Follows the same three-request chain as LCSCClient, so several
+    components can be fetched concurrently on one event loop.
     """
     
     EASYEDA_API_BASE = "https://easyeda.com/api"
     
-    def __init__(self, timeout: float = 30.0):
+    # Seconds to let background cache refreshes finish on exit
+    REFRESH_GRACE = 5.0
+    
+    def __init__(self, timeout: float = 30.0, cache: Optional[ResponseCache] = None):
         """Initialize async client.
         
         Args:
             timeout: Request timeout in seconds
+            cache: Optional on-disk cache for API responses
         """
         self._timeout = timeout
+        self._cache = cache
         self._client: Optional[httpx.AsyncClient] = None
+        self._refresh_tasks: set[asyncio.Task] = set()
     
     async def __aenter__(self):
         """Async context manager entry."""
-        self._client = httpx.AsyncClient(timeout=self._timeout)
+        self._client = httpx.AsyncClient(timeout=self._timeout, http2=_HAS_H2, verify=_ssl_context(),
+                                         limits=_CLIENT_LIMITS, headers=_CLIENT_HEADERS)
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
+        if self._refresh_tasks:
+            _, pending = await asyncio.wait(self._refresh_tasks, timeout=self.REFRESH_GRACE)
+            for task in pending:
+                task.cancel()
         if self._client:
             await self._client.aclose()
             self._client = None
     
+    async def _get_json(self, url: str, not_found: Optional[str] = None) -> Any:
+        """GET a JSON endpoint, going through the response cache.
+        
+        Stale cache entries are returned immediately and refreshed in a
+        background task.
+        
+        Args:
+            url: Request URL
+            not_found: Error message to raise on a 404 response
+            
+        Returns:
+            Parsed JSON body
+            
+        Raises:
+            LCSCApiError: If the server returns 404 and not_found is set
+            httpx.HTTPError: If the request fails
+        """
+        if self._cache is not None:
+            cached = self._cache.get(url)
+            if cached is not None:
+                if not cached.is_fresh(self._cache.ttl):
+                    task = asyncio.ensure_future(self._revalidate(url, cached))
+                    self._refresh_tasks.add(task)
+                    task.add_done_callback(self._refresh_tasks.discard)
+                return cached.data
+        
+        response = await self._client.get(url)
+        
+        if not_found and response.status_code == 404:
+            raise LCSCApiError(not_found)
+        
+        response.raise_for_status()
+        data = _decode_json(response)
+        if self._cache is not None:
+            _store_response(self._cache, url, response, data)
+        return data
+    
+    async def _revalidate(self, url: str, cached: CachedResponse) -> None:
+        """Refresh a stale cache entry; errors keep the stale data."""
+        try:
+            response = await self._client.get(url, headers=cached.conditional_headers())
+            if response.status_code == 304:
+                self._cache.touch(url)
+            elif response.status_code == 200:
+                _store_response(self._cache, url, response, _decode_json(response))
+        except (httpx.HTTPError, json.JSONDecodeError):
+            pass
+    
     async def fetch_component(self, lcsc_id: str) -> EasyEDAComponent:
         """Async fetch component data.
         
@@ -274,42 +456,27 @@ class AsyncLCSCClient:
         if self._client is None:
             raise LCSCApiError("Client not initialized")
         
-        # Implementation similar to sync version
-        # but using async/await
-        lcsc_id = lcsc_id.strip().upper()
-        if not lcsc_id.startswith("C"):
-            lcsc_id = "C" + lcsc_id
+        lcsc_id = _normalize_lcsc_id(lcsc_id)
         
         try:
-            # Fetch component info
+            # Each step needs the UUID from the previous response
             url = f"{self.EASYEDA_API_BASE}/products/{lcsc_id}/components"
-            response = await self._client.get(url)
+            data = await self._get_json(url, not_found=f"Component not found: {lcsc_id}")
+            component_uuid, title = _component_info(data, lcsc_id)
             
-            if response.status_code == 404:
-                raise LCSCApiError(f"Component not found: {lcsc_id}")
-            
-            response.raise_for_status()
-            data = response.json()
+            comp_url = f"{self.EASYEDA_API_BASE}/components/{component_uuid}"
+            package_uuid = _package_uuid(await self._get_json(comp_url), lcsc_id)
             
-            # Parse response
-            footprint_data = None
-            if isinstance(data, dict) and "result" in data:
-                result = data["result"]
-                if isinstance(result, list) and len(result) > 0:
-                    uuid = result[0].get("uuid")
-                    if uuid:
-                        # Fetch detailed data
-                        detail_url = f"{self.EASYEDA_API_BASE}/components/{uuid}"
-                        detail_response = await self._client.get(detail_url)
-                        if detail_response.status_code == 200:
-                            detail_data = detail_response.json()
-                            footprint_data = detail_data.get("result")
+            pkg_url = f"{self.EASYEDA_API_BASE}/components/{package_uuid}"
+            pkg_data = await self._get_json(pkg_url)
             
             return EasyEDAComponent(
                 lcsc_id=lcsc_id,
-                title=f"Component {lcsc_id}",
-                footprint_data=footprint_data
+                title=title,
+                footprint_data=pkg_data.get("result")
             )
             
         except httpx.HTTPError as e:
             raise LCSCApiError(f"HTTP error fetching {lcsc_id}: {e}")
+        except json.JSONDecodeError as e:
+            raise LCSCApiError(f"Invalid JSON response for {lcsc_id}: {e}")
@@ -0,0 +1,200 @@
+"""On-disk cache for EasyEDA API responses.
+
+Component and package lookups for a given LCSC id are deterministic, so
+responses are kept between sessions and served stale-while-revalidate:
+fresh entries are returned directly, stale entries are returned at once
+and refreshed in the background, and only misses wait on the network.
+"""
+
+import atexit
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Dict, Any
+
+try:
+    # Optional faster JSON codec; its JSONDecodeError subclasses json's
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Entries younger than this are served without revalidating
+DEFAULT_TTL = 30 * 24 * 60 * 60
+
+_shared_cache: Optional["ResponseCache"] = None
+
+
+def _dumps(data: Dict[str, Any]) -> str:
+    """Serialize a response body for storage."""
+    if orjson is not None:
+        return orjson.dumps(data).decode("utf-8")
+    return json.dumps(data)
+
+
+def get_default_cache_path() -> Path:
+    """Get the default location of the response cache.
+
+    Returns:
+        Path to the cache database file
+    """
+    return Path.home() / ".openpnp_fpm" / "lcsc_cache.sqlite3"
+
+
+def get_shared_cache() -> "ResponseCache":
+    """Get the process-wide cache at the default location.
+
+    Created on first use and kept open across fetch batches; the
+    connection is closed at interpreter exit.
+
+    Returns:
+        Shared ResponseCache instance
+    """
+    global _shared_cache
+    if _shared_cache is None:
+        _shared_cache = ResponseCache()
+        atexit.register(_shared_cache.close)
+    return _shared_cache
+
+
+@dataclass
+class CachedResponse:
+    """A cached API response.
+
+    Attributes:
+        data: Parsed JSON body
+        fetched_at: Time the response was last confirmed (seconds since epoch)
+        etag: ETag header from the server, if any
+        last_modified: Last-Modified header from the server, if any
+    """
+    data: Dict[str, Any]
+    fetched_at: float
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    def is_fresh(self, ttl: float) -> bool:
+        """Check if the response is younger than the TTL."""
+        return time.time() - self.fetched_at < ttl
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Build If-None-Match/If-Modified-Since headers for revalidation."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """SQLite-backed cache of JSON responses keyed by URL.
+
+    Safe to share between the GUI thread, the fetch worker and
+    background refresh threads. If the database can't be opened or
+    written, the cache behaves as if empty rather than failing fetches.
+    """
+
+    def __init__(self, cache_file: Optional[Path] = None, ttl: float = DEFAULT_TTL):
+        """Initialize response cache.
+
+        Args:
+            cache_file: Path to the cache database (default in home directory)
+            ttl: Seconds before an entry is revalidated
+        """
+        self._cache_file = cache_file or get_default_cache_path()
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use.
+
+        Returns:
+            sqlite3 connection
+        """
+        if self._conn is None:
+            self._cache_file.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self._cache_file), check_same_thread=False)
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "url TEXT PRIMARY KEY, data TEXT NOT NULL, fetched_at REAL NOT NULL, "
+                "etag TEXT, last_modified TEXT)"
+            )
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def get(self, url: str) -> Optional[CachedResponse]:
+        """Look up a cached response.
+
+        Args:
+            url: Request URL
+
+        Returns:
+            CachedResponse if present, None otherwise
+        """
+        try:
+            with self._lock:
+                row = self._connect().execute(
+                    "SELECT data, fetched_at, etag, last_modified FROM responses WHERE url = ?",
+                    (url,)
+                ).fetchone()
+        except (sqlite3.Error, OSError):
+            return None
+
+        if row is None:
+            return None
+
+        try:
+            data = orjson.loads(row[0]) if orjson is not None else json.loads(row[0])
+        except json.JSONDecodeError:
+            return None
+        return CachedResponse(data, row[1], row[2], row[3])
+
+    def put(self, url: str, data: Dict[str, Any],
+            etag: Optional[str] = None, last_modified: Optional[str] = None) -> None:
+        """Store a response.
+
+        Args:
+            url: Request URL
+            data: Parsed JSON body
+            etag: ETag header from the server
+            last_modified: Last-Modified header from the server
+        """
+        try:
+            with self._lock:
+                conn = self._connect()
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+                    (url, _dumps(data), time.time(), etag, last_modified)
+                )
+                conn.commit()
+        except (sqlite3.Error, OSError):
+            pass
+
+    def touch(self, url: str) -> None:
+        """Mark a cached response as revalidated (e.g., after a 304).
+
+        Args:
+            url: Request URL
+        """
+        try:
+            with self._lock:
+                conn = self._connect()
+                conn.execute(
+                    "UPDATE responses SET fetched_at = ? WHERE url = ?",
+                    (time.time(), url)
+                )
+                conn.commit()
+        except (sqlite3.Error, OSError):
+            pass
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
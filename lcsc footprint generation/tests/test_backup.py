@@ -0,0 +1,102 @@
+"""Tests for OpenPnP configuration backups."""
+
+import hashlib
+import pytest
+from pathlib import Path
+import shutil
+import sys
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.openpnp.backup import BackupManager, compute_file_hash
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+class TestComputeFileHash:
+    """Tests for compute_file_hash."""
+
+    @pytest.mark.parametrize("file_digest", [True, False])
+    def test_matches_sha256(self, tmp_path, monkeypatch, file_digest):
+        """Test both hashing paths agree with hashlib, including empty files."""
+        if not file_digest:
+            monkeypatch.delattr(hashlib, "file_digest", raising=False)
+        sample = FIXTURES / "sample_packages.xml"
+        empty = tmp_path / "empty.xml"
+        empty.write_bytes(b"")
+
+        assert compute_file_hash(sample) == hashlib.sha256(sample.read_bytes()).hexdigest()
+        assert compute_file_hash(empty) == hashlib.sha256(b"").hexdigest()
+
+
+class TestBackupManager:
+    """Tests for BackupManager."""
+
+    def test_backup_listing_tracks_changes(self, tmp_path):
+        """Test the cached listing follows creates, deletes and outside changes."""
+        shutil.copy(FIXTURES / "sample_packages.xml", tmp_path / "packages.xml")
+        manager = BackupManager(tmp_path / "backups", tmp_path)
+
+        assert manager.list_backups() == []
+
+        backup = manager.create_backup(description="first")
+        assert [b.path for b in manager.list_backups()] == [backup.path]
+        assert manager.list_backups() is not manager.list_backups()
+
+        # A rescan reuses manifests that haven't changed on disk
+        manifest = manager.list_backups()[0].manifest
+        manager._backups = None
+        assert manager.list_backups()[0].manifest is manifest
+
+        other = BackupManager(tmp_path / "backups", tmp_path)
+        other.delete_backup(other.list_backups()[0])
+        assert manager.list_backups() == []
+
+    def test_cleanup_old_backups(self, tmp_path):
+        """Test cleanup only deletes backups beyond the keep count."""
+        shutil.copy(FIXTURES / "sample_packages.xml", tmp_path / "packages.xml")
+        manager = BackupManager(tmp_path / "backups", tmp_path)
+
+        assert manager.cleanup_old_backups(keep_count=1) == 0
+        manager.create_backup()
+        assert manager.cleanup_old_backups(keep_count=1) == 0
+        assert len(manager.list_backups()) == 1
+        assert manager.cleanup_old_backups(keep_count=0) == 1
+        assert manager.list_backups() == []
+
+    def test_create_and_restore(self, tmp_path):
+        """Test that a restore brings back the backed-up contents."""
+        packages_file = tmp_path / "packages.xml"
+        shutil.copy(FIXTURES / "sample_packages.xml", packages_file)
+        manager = BackupManager(tmp_path / "backups", tmp_path)
+
+        backup = manager.create_backup()
+        assert manager.verify_backup(backup)
+
+        packages_file.write_text("<openpnp-packages/>")
+        manager.restore_backup(backup)
+        assert packages_file.read_bytes() == (FIXTURES / "sample_packages.xml").read_bytes()
+
+    def test_verify_detects_damage(self, tmp_path):
+        """Test verification fails for changed or missing backup files."""
+        shutil.copy(FIXTURES / "sample_packages.xml", tmp_path / "packages.xml")
+        shutil.copy(FIXTURES / "sample_parts.xml", tmp_path / "parts.xml")
+        manager = BackupManager(tmp_path / "backups", tmp_path)
+        backup = manager.create_backup()
+
+        digest = backup.manifest.files["parts.xml"]
+        backup.manifest.files["parts.xml"] = "not a digest"
+        assert not manager.verify_backup(backup)
+        backup.manifest.files["parts.xml"] = digest.upper()
+        assert manager.verify_backup(backup)
+
+        (backup.path / "parts.xml").write_text("<openpnp-parts/>")
+        assert not manager.verify_backup(backup)
+
+        (backup.path / "parts.xml").unlink()
+        assert not manager.verify_backup(backup)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
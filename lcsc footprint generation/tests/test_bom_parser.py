@@ -0,0 +1,113 @@
+"""Tests for BOM parser."""
+
+import pytest
+from pathlib import Path
+import sys
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.bom.parser import (
+    BomParser, BomEntryBatch, get_unique_footprints,
+    filter_entries_with_lcsc, filter_entries_without_lcsc
+)
+from src.models.part import BomEntry
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+class TestBomParser:
+    """Tests for BomParser."""
+
+    def test_parse_example_bom(self):
+        """Test parsing a comma-separated UTF-8 BOM."""
+        entries = BomParser().parse(FIXTURES / "example_bom.csv")
+
+        assert len(entries) == 9
+        assert entries[0].reference == "R1"
+        assert entries[0].value == "10K"
+        assert entries[0].footprint_name == "C0402"
+        assert entries[0].lcsc_number == "C25804"
+
+    def test_parse_utf16_bom(self):
+        """Test parsing a tab-separated UTF-16 BOM export."""
+        entries = BomParser().parse(FIXTURES / "BOM_Skree-Flex-v5.csv")
+
+        assert len(entries) == 32
+        assert entries[0].reference == "C1"
+        assert entries[0].footprint_name == "C0402"
+        assert entries[0].lcsc_number == "C52923"
+
+    def test_missing_values(self, tmp_path):
+        """Test rows with missing footprint or LCSC values."""
+        bom = tmp_path / "bom.csv"
+        bom.write_text(
+            "Ref,Val,Package,LCSC\n"
+            "R1,10K,R0402,C1\n"
+            "R2,,R0402,\n"
+            ",1K,,C3\n"
+            "R4,5,nan,C4\n",
+            encoding="utf-8"
+        )
+
+        entries = BomParser().parse(bom)
+
+        assert [e.reference for e in entries] == ["R1", "R2"]
+        assert entries[1].value == ""
+        assert entries[1].lcsc_number is None
+
+    def test_parse_iter_chunks(self):
+        """Test chunked parsing yields the same entries as parse()."""
+        parser = BomParser()
+        entries = parser.parse(FIXTURES / "BOM_Skree-Flex-v5.csv")
+
+        chunks = list(parser.parse_iter(FIXTURES / "BOM_Skree-Flex-v5.csv", chunk_size=10))
+
+        assert [len(c) for c in chunks] == [10, 10, 10, 2]
+        assert [e for c in chunks for e in c] == entries
+
+    def test_group_by_footprint(self):
+        """Test grouping entries by shared footprint."""
+        parser = BomParser()
+        entries = parser.parse(FIXTURES / "example_bom.csv")
+
+        groups = parser.group_by_footprint(entries)
+
+        assert [g.footprint_name for g in groups] == [
+            "C0402", "C0603", "LQFP48", "SOT-23", "USB-C-16P"
+        ]
+        assert groups[0].part_count == 4
+        assert groups[0].lcsc_number == "C25804"
+
+
+class TestBomEntryBatch:
+    """Tests for BomEntryBatch and the filter helpers."""
+
+    def test_batch_matches_entries(self):
+        """Test batch round trip gives the same entries as parse()."""
+        parser = BomParser()
+        entries = parser.parse(FIXTURES / "BOM_Skree-Flex-v5.csv")
+        batch = parser.parse_batch(FIXTURES / "BOM_Skree-Flex-v5.csv")
+
+        assert len(batch) == len(entries)
+        assert batch.to_entries() == entries
+        assert BomEntryBatch.from_entries(entries).to_entries() == entries
+        assert get_unique_footprints(batch) == get_unique_footprints(entries)
+
+    def test_filter_helpers(self):
+        """Test LCSC filters on lists and batches agree."""
+        entries = [
+            BomEntry("R1", "10K", "R0402_Pad", "C1"),
+            BomEntry("R2", "10K", "R0402", None),
+            BomEntry("R3", "1K", "R0603", "  "),
+        ]
+        batch = BomEntryBatch.from_entries(entries)
+
+        assert get_unique_footprints(batch) == ["R0402", "R0603"]
+        assert filter_entries_with_lcsc(batch).to_entries() == entries[:1]
+        assert filter_entries_without_lcsc(batch).to_entries() == entries[1:]
+        assert filter_entries_without_lcsc(entries) == entries[1:]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,39 @@
+"""Tests for OpenPnP configuration detection."""
+
+import os
+import pytest
+from pathlib import Path
+import sys
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.openpnp import config
+from src.openpnp.config import OpenPnPConfig, validate_openpnp_config
+
+
+class TestConfigDetection:
+    """Tests for validate_openpnp_config and OpenPnPConfig."""
+
+    @pytest.mark.skipif(os.name == "nt", reason="symlinks need privileges on Windows")
+    def test_dangling_symlink_is_missing(self, tmp_path):
+        """Test that a broken packages.xml link counts as missing, like exists()."""
+        (tmp_path / "packages.xml").symlink_to(tmp_path / "gone.xml")
+
+        assert not validate_openpnp_config(tmp_path)
+
+        OpenPnPConfig(tmp_path).ensure_files_exist()
+        assert (tmp_path / "gone.xml").exists()
+        assert (tmp_path / "parts.xml").exists()
+
+    @pytest.mark.parametrize("case_insensitive", [True, False])
+    def test_name_case_follows_file_system(self, tmp_path, monkeypatch, case_insensitive):
+        """Test that name matching ignores case only on case-insensitive systems."""
+        monkeypatch.setattr(config, "_CASE_INSENSITIVE_FS", case_insensitive)
+        (tmp_path / "Parts.XML").write_text("<openpnp-parts/>")
+
+        assert validate_openpnp_config(tmp_path) == case_insensitive
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,61 @@
+"""Tests for OpenPnP file lock detection."""
+
+import os
+import subprocess
+import pytest
+from pathlib import Path
+import sys
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.openpnp import lockcheck
+from src.openpnp.lockcheck import is_file_locked, is_openpnp_running
+
+
+class TestLockCheck:
+    """Tests for is_file_locked and is_openpnp_running."""
+
+    def test_free_and_missing_files(self, tmp_path):
+        """Test that unlocked and missing files are reported free."""
+        (tmp_path / "packages.xml").write_text("<openpnp-packages/>")
+
+        assert not is_file_locked(tmp_path / "packages.xml")
+        assert not is_openpnp_running(tmp_path)
+        assert (tmp_path / "packages.xml").read_text() == "<openpnp-packages/>"
+
+    def test_unopenable_file_is_not_locked(self, tmp_path, monkeypatch):
+        """Test that a file we lack permission to open isn't reported locked."""
+        (tmp_path / "packages.xml").write_text("<openpnp-packages/>")
+
+        def deny(*args, **kwargs):
+            raise PermissionError("access denied")
+
+        monkeypatch.setattr(lockcheck, "open", deny, raising=False)
+        assert not is_file_locked(tmp_path / "packages.xml")
+
+    @pytest.mark.skipif(os.name == "nt", reason="POSIX record locks")
+    def test_lock_held_by_other_process(self, tmp_path):
+        """Test that a lock taken by another process is detected."""
+        parts_file = tmp_path / "parts.xml"
+        parts_file.write_text("<openpnp-parts/>")
+        holder = subprocess.Popen(
+            [sys.executable, "-c",
+             "import fcntl, sys; f = open(sys.argv[1], 'r+b'); "
+             "fcntl.lockf(f, fcntl.LOCK_EX); print(flush=True); sys.stdin.read()",
+             str(parts_file)],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE
+        )
+        try:
+            holder.stdout.readline()
+            assert is_file_locked(parts_file)
+            assert is_openpnp_running(tmp_path)
+        finally:
+            holder.stdin.close()
+            holder.wait()
+
+        assert not is_file_locked(parts_file)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
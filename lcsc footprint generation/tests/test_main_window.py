@@ -0,0 +1,128 @@
+"""Tests for main window helpers that don't need a running GUI."""
+
+import functools
+import pytest
+from pathlib import Path
+from types import SimpleNamespace
+import shutil
+import sys
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+pytest.importorskip("PyQt6.QtWidgets")
+
+from src.gui.main_window import MainWindow, _resolve_nozzle_name
+from src.models.footprint import Footprint, Package
+from src.openpnp.backup import BackupManager
+from src.openpnp.packages_manager import PackagesManager
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+class TestManagerCache:
+    """Tests for MainWindow._load_manager reuse and invalidation."""
+
+    def test_restore_needs_explicit_invalidation(self, tmp_path):
+        """Test a restored file, which keeps its old mtime and size, is reloaded once forgotten."""
+        packages_file = tmp_path / "packages.xml"
+        shutil.copy(FIXTURES / "sample_packages.xml", packages_file)
+        window = SimpleNamespace(_mgr_cache={})
+        backups = BackupManager(tmp_path / "backups", tmp_path)
+
+        manager = MainWindow._load_manager(window, PackagesManager, packages_file)
+        backup = backups.create_backup()
+        manager.add_packages([Package(id="NEWPKG", footprint=Footprint(1.0, 1.0))])
+        manager.save()
+        backups.restore_backup(backup)
+
+        # The restore brings back the exact signature of the cached load
+        assert MainWindow._load_manager(window, PackagesManager, packages_file) is manager
+
+        MainWindow._forget_loaded_managers(window)
+        reloaded = MainWindow._load_manager(window, PackagesManager, packages_file)
+        assert reloaded is not manager
+        assert not reloaded.has_package("NEWPKG")
+
+
+
+class _FakeCombo:
+    """Stand-in for a nozzle QComboBox that records the selection."""
+
+    def __init__(self, count):
+        self._count = count
+        self.current_index = None
+
+    def count(self):
+        return self._count
+
+    def setCurrentIndex(self, index):
+        self.current_index = index
+
+
+def _nozzle_window(tips):
+    """Build the state the nozzle auto-select methods read."""
+    window = SimpleNamespace(
+        _nozzle_tips=tips,
+        _nozzle_index_cache={},
+        _nozzle_ids_sorted=sorted((tip_id, i) for i, (tip_id, _) in enumerate(tips)),
+        _nozzle_combo=_FakeCombo(len(tips)),
+        _edit_nozzle_combo=_FakeCombo(len(tips)),
+        _statusbar=SimpleNamespace(showMessage=lambda message: None),
+    )
+    window._find_nozzle_tip_index = functools.partial(MainWindow._find_nozzle_tip_index, window)
+    return window
+
+
+class TestNozzleSelection:
+    """Tests for footprint to nozzle mapping."""
+
+    @pytest.mark.parametrize("footprint, nozzle", [
+        ("C0402", "CN040"),
+        ("R0805", "CN065"),
+        ("1206_3216Metric", "CN140"),
+        ("SOT-23", "CN220"),
+        ("SOIC-8", "CN220"),
+        ("LQFP-48", "CN400"),
+        ("CONNECTOR-2P", "CN750"),
+        ("UNKNOWN", "CN065"),
+    ])
+    def test_processing_table(self, footprint, nozzle):
+        """Test every processing pattern group is reachable, not just CN040/CN065."""
+        assert _resolve_nozzle_name(footprint) == nozzle
+
+    @pytest.mark.parametrize("footprint, nozzle", [
+        ("C0201", "CN040"),
+        ("L0603", "CN065"),
+        ("R1210", "CN140"),
+        ("SOT-89", "CN220"),
+        ("TSSOP-20", "CN400"),
+        ("QFN-32", "CN140"),
+    ])
+    def test_edit_table(self, footprint, nozzle):
+        """Test the edit combo's table and its CN140 default."""
+        assert _resolve_nozzle_name(footprint, for_edit=True) == nozzle
+
+    def test_falls_back_to_5_variant(self):
+        """Test a missing CN##0 tip falls back to the CN##5 tip in both combos."""
+        window = _nozzle_window([("CN045", "CN045 Small"), ("CN225", "CN225 Medium")])
+
+        MainWindow._auto_select_nozzle(window, "SOT-23")
+        MainWindow._auto_select_nozzle_for_edit(window, "C0402")
+
+        assert window._nozzle_combo.current_index == 1
+        assert window._edit_nozzle_combo.current_index == 0
+
+    def test_exact_tip_preferred_over_fallback(self):
+        """Test the CN##0 tip is used when it exists."""
+        window = _nozzle_window([("CN405", "CN405"), ("CN400", "CN400")])
+
+        MainWindow._auto_select_nozzle(window, "QFP-44")
+        MainWindow._auto_select_nozzle_for_edit(window, "LQFP-64")
+
+        assert window._nozzle_combo.current_index == 1
+        assert window._edit_nozzle_combo.current_index == 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
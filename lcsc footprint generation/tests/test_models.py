@@ -1,14 +1,15 @@
 """Tests for data models."""
 
+import pickle
 import pytest
 from pathlib import Path
 import sys
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from models.footprint import Pad, Footprint, Package
-from models.part import Part, BomEntry, PartStatus, FootprintGroup
+from src.models.footprint import Pad, Footprint, Package
+from src.models.part import Part, BomEntry, PartStatus, FootprintGroup
 
 
 class TestPad:
@@ -96,6 +97,23 @@ class TestFootprint:
         assert min_x == -1.25  # -1.0 - 0.5/2
         assert max_x == 1.25   # 1.0 + 0.5/2
 
+    def test_calculate_bounds_many_pads(self):
+        """Test the vectorized bounds for large pad counts match the loop."""
+        pads = [
+            Pad(name=str(i), x=(i % 10) * 0.8 - 3.7, y=(i // 10) * 0.65 - 2.1,
+                width=0.3 + (i % 3) * 0.1, height=0.25 + (i % 4) * 0.05)
+            for i in range(100)
+        ]
+        footprint = Footprint(body_width=8.0, body_height=8.0, pads=pads)
+
+        bounds = footprint.calculate_bounds()
+
+        assert bounds == (
+            min(p.x - p.width / 2 for p in pads), min(p.y - p.height / 2 for p in pads),
+            max(p.x + p.width / 2 for p in pads), max(p.y + p.height / 2 for p in pads)
+        )
+        assert all(type(v) is float for v in bounds)
+
 
 class TestPackage:
     """Tests for Package model."""
@@ -133,6 +151,53 @@ class TestPackage:
         assert '<package version="1.1" id="R0402"' in xml_str
         assert '<pad name="1"' in xml_str
 
+    def test_package_uses_slots_and_pickles(self):
+        """Test slotted packages survive the trip to and from parse workers."""
+        package = Package(
+            id="R0402",
+            footprint=Footprint(body_width=1.0, body_height=0.5, pads=[
+                Pad(name="1", x=-0.5, y=0.0, width=0.5, height=0.6)
+            ]),
+            compatible_nozzle_tip_ids=["N1"]
+        )
+
+        assert not hasattr(package, "__dict__")
+        assert not hasattr(package.footprint.pads[0], "__dict__")
+        assert pickle.loads(pickle.dumps(package)) == package
+
+    def test_iter_from_file(self, tmp_path):
+        """Test streamed packages match a full parse and skip bad entries on request."""
+        from lxml import etree
+
+        sample = Path(__file__).parent / "fixtures" / "sample_packages.xml"
+        expected = [
+            Package.from_xml_element(elem)
+            for elem in etree.parse(str(sample)).getroot().iterchildren("package")
+        ]
+        assert list(Package.iter_from_file(sample)) == expected
+
+        bad = tmp_path / "packages.xml"
+        bad.write_text(
+            '<openpnp-packages><package id="A"><footprint body-width="x"/></package>'
+            '<package id="B"/></openpnp-packages>'
+        )
+        with pytest.raises(ValueError):
+            list(Package.iter_from_file(bad))
+        assert [p.id for p in Package.iter_from_file(bad, skip_malformed=True)] == ["B"]
+
+    def test_nozzle_tip_edits(self):
+        """Test nozzle tip add/remove keeps order and skips duplicates."""
+        package = Package(id="R0402", footprint=Footprint(body_width=1.0, body_height=0.5))
+
+        package.add_nozzle_tip("N1")
+        package.add_nozzle_tip("N2")
+        package.add_nozzle_tip("N1")
+        package.remove_nozzle_tip("N3")
+        assert package.compatible_nozzle_tip_ids == ["N1", "N2"]
+
+        package.remove_nozzle_tip("N1")
+        assert package.compatible_nozzle_tip_ids == ["N2"]
+
 
 class TestPart:
     """Tests for Part model."""
@@ -163,6 +228,26 @@ class TestPart:
         assert elem.get("id") == "R0402-10K"
         assert elem.get("package-id") == "R0402"
 
+    def test_iter_from_file(self, tmp_path):
+        """Test streamed parts match a full parse and skip bad entries on request."""
+        from lxml import etree
+
+        sample = Path(__file__).parent / "fixtures" / "sample_parts.xml"
+        expected = [
+            Part.from_xml_element(elem)
+            for elem in etree.parse(str(sample)).getroot().iterchildren("part")
+        ]
+        assert list(Part.iter_from_file(sample)) == expected
+
+        bad = tmp_path / "parts.xml"
+        bad.write_text(
+            '<openpnp-parts><part id="A" package-id="P" height="x"/>'
+            '<part id="B" package-id="P" height="1.0"/></openpnp-parts>'
+        )
+        with pytest.raises(ValueError):
+            list(Part.iter_from_file(bad))
+        assert [p.id for p in Part.iter_from_file(bad, skip_malformed=True)] == ["B"]
+
 
 class TestBomEntry:
     """Tests for BomEntry model."""
@@ -179,7 +264,14 @@ class TestBomEntry:
         assert entry.reference == "R1"
         assert entry.has_lcsc is True
         assert entry.status == PartStatus.PENDING
-    
+
+    def test_bom_entry_uses_slots(self):
+        """Test BOM entries don't carry a per-instance __dict__."""
+        entry = BomEntry("R1", "10K", "C0402", "C60490")
+
+        assert not hasattr(entry, "__dict__")
+        assert entry.lcsc_number == "C60490"
+
     def test_part_id_generation(self):
         """Test part ID generation."""
         entry = BomEntry(
@@ -189,6 +281,8 @@ class TestBomEntry:
         )
         
         assert entry.part_id == "C0402-10K"
+        assert entry.part_id is BomEntry("R2", "10K", "C0402").part_id
+        assert entry == BomEntry("R1", "10K", "C0402")
     
     def test_base_footprint_extraction(self):
         """Test base footprint name extraction."""
@@ -207,7 +301,11 @@ class TestBomEntry:
             footprint_name="C0402_HandSolder"
         )
         assert entry2.base_footprint == "C0402"
-    
+
+        # Stacked suffixes are each stripped once, outermost first
+        assert BomEntry("U1", "MCU", "QFN-32_1EP_Pad_HandSolder").base_footprint == "QFN-32"
+        assert BomEntry("R3", "10K", "C0402_HandSolder_Pad").base_footprint == "C0402_HandSolder"
+
     def test_status_changes(self):
         """Test status change methods."""
         entry = BomEntry(
@@ -241,6 +339,7 @@ class TestFootprintGroup:
         assert group.part_count == 3
         assert group.lcsc_number == "C60490"  # From first entry with LCSC
         assert group.has_lcsc is True
+        assert not hasattr(group, "__dict__")
     
     def test_group_without_lcsc(self):
         """Test group with no LCSC numbers."""
@@ -252,6 +351,21 @@ class TestFootprintGroup:
         
         assert group.has_lcsc is False
 
+    def test_group_bom_entries(self):
+        """Test single-pass grouping keeps order and the first LCSC per group."""
+        entries = [
+            BomEntry("R1", "10K", "R0402", None),
+            BomEntry("C1", "100nF", "C0402_HandSolder", "C1525"),
+            BomEntry("R2", "10K", "R0402", "C25744"),
+            BomEntry("C2", "1uF", "C0402", "C52923"),
+        ]
+
+        groups = FootprintGroup.group_bom_entries(entries)
+
+        assert [g.footprint_name for g in groups] == ["R0402", "C0402"]
+        assert [g.lcsc_number for g in groups] == ["C25744", "C1525"]
+        assert groups[1].entries == [entries[1], entries[3]]
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
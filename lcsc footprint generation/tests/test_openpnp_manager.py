@@ -0,0 +1,244 @@
+"""Tests for OpenPnP packages.xml and parts.xml managers."""
+
+import os
+import pytest
+from pathlib import Path
+import shutil
+import sys
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.models.footprint import Footprint, Pad, Package
+from src.models.part import Part
+from src.openpnp.packages_manager import PackagesManager
+from src.openpnp.parts_manager import PartsManager, PartsManagerError
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+class TestPackagesManager:
+    """Tests for PackagesManager."""
+
+    def test_load_sample_packages(self):
+        """Test loading a real packages.xml."""
+        manager = PackagesManager(FIXTURES / "sample_packages.xml")
+        manager.load()
+
+        assert manager.is_loaded
+        assert manager.has_package("R0805")
+        package = manager.get_package("R0805")
+        assert len(package.footprint.pads) == 2
+        assert package.footprint.body_width == 2.0
+
+    def test_packages_parsed_on_demand(self):
+        """Test that a full load indexes packages and parses them lazily."""
+        manager = PackagesManager(FIXTURES / "sample_packages.xml")
+        manager.load()
+
+        assert manager._packages["R0805"] is None
+        package = manager.get_package("R0805")
+        assert package is manager.get_package("R0805")
+        assert manager.get_package("NO-SUCH-PACKAGE") is None
+
+    def test_malformed_package_skipped_at_load(self, tmp_path):
+        """Test a malformed package is left out before anything is parsed."""
+        packages_file = tmp_path / "packages.xml"
+        packages_file.write_text(
+            '<openpnp-packages>'
+            '<package id="GOOD"><footprint body-width="1.0" body-height="1.0">'
+            '<pad name="1" x="0.5" y="0" width="0.4" height="0.4"/></footprint></package>'
+            '<package id="BAD"><footprint body-width="1.0" body-height="1.0">'
+            '<pad name="1" x="oops" y="0" width="0.4" height="0.4"/></footprint></package>'
+            '</openpnp-packages>'
+        )
+        manager = PackagesManager(packages_file)
+        manager.load()
+
+        assert not manager.has_package("BAD")
+        assert "BAD" not in manager.package_ids()
+        assert manager.list_packages() == ["GOOD"]
+        assert manager.get_package_count() == 1
+        assert manager.get_package("BAD") is None
+        assert manager.get_package_count() == 1
+
+    def test_add_and_save(self, tmp_path):
+        """Test that added packages survive a save/load round trip."""
+        packages_file = tmp_path / "packages.xml"
+        shutil.copy(FIXTURES / "sample_packages.xml", packages_file)
+
+        manager = PackagesManager(packages_file)
+        manager.load()
+        count = manager.get_package_count()
+        manager.add_package(Package(
+            id="TEST-2PAD",
+            footprint=Footprint(
+                body_width=1.0,
+                body_height=0.5,
+                pads=[
+                    Pad(name="1", x=-0.5, y=0.0, width=0.5, height=0.6),
+                    Pad(name="2", x=0.5, y=0.0, width=0.5, height=0.6)
+                ]
+            )
+        ))
+        manager.save()
+
+        reloaded = PackagesManager(packages_file)
+        reloaded.load()
+        assert reloaded.get_package_count() == count + 1
+        assert reloaded.get_package("TEST-2PAD").footprint.pads[1].x == 0.5
+
+    def test_update_and_remove(self, tmp_path):
+        """Test that updates replace and removals drop the XML element."""
+        packages_file = tmp_path / "packages.xml"
+        shutil.copy(FIXTURES / "sample_packages.xml", packages_file)
+
+        manager = PackagesManager(packages_file)
+        manager.load()
+        count = manager.get_package_count()
+        package = manager.get_package("R0805")
+        package.footprint.body_width = 3.0
+        manager.update_package(package)
+        manager.remove_package("FIDUCIAL-1X2")
+        manager.save()
+
+        reloaded = PackagesManager(packages_file)
+        reloaded.load()
+        assert reloaded.get_package_count() == count - 1
+        assert not reloaded.has_package("FIDUCIAL-1X2")
+        assert reloaded.get_package("R0805").footprint.body_width == 3.0
+
+    def test_find_similar_packages(self):
+        """Test case-insensitive substring search tracks removals."""
+        manager = PackagesManager(FIXTURES / "sample_packages.xml")
+        manager.load()
+
+        assert [p.id for p in manager.find_similar_packages("r08")] == ["R0805"]
+
+        manager.remove_package("R0805")
+        assert manager.find_similar_packages("r08") == []
+
+    def test_package_ids_view(self):
+        """Test the package ID view matches list_packages() and stays live."""
+        manager = PackagesManager(FIXTURES / "sample_packages.xml")
+        manager.load()
+        ids = manager.package_ids()
+
+        assert list(ids) == manager.list_packages()
+        assert "R0805" in ids
+
+        manager.remove_package("R0805")
+        assert "R0805" not in ids
+
+
+class TestPartsManager:
+    """Tests for PartsManager."""
+
+    def test_add_parts_matches_single_edits(self, tmp_path):
+        """Test bulk add/update writes the same file as one call per part."""
+        parts = [
+            Part(id="R0805-1K", package_id="R0805", height=0.6),
+            Part(id="NEW-PART", package_id="R0805", height=1.0),
+            Part(id="R0402-1K", package_id="R0402", height=0.3),
+        ]
+
+        single = tmp_path / "single.xml"
+        shutil.copy(FIXTURES / "sample_parts.xml", single)
+        manager = PartsManager(single)
+        manager.load()
+        for part in parts:
+            if manager.has_part(part.id):
+                manager.update_part(part)
+            else:
+                manager.add_part(part)
+        manager.save()
+
+        bulk = tmp_path / "bulk.xml"
+        shutil.copy(FIXTURES / "sample_parts.xml", bulk)
+        manager = PartsManager(bulk)
+        manager.load()
+        manager.add_parts(parts)
+        manager.save()
+
+        assert bulk.read_bytes() == single.read_bytes()
+
+        count = manager.get_part_count()
+        with pytest.raises(PartsManagerError):
+            manager.add_parts([Part(id="OTHER", package_id="R0805", height=1.0)]
+                              + parts[:1], update_existing=False)
+        assert not manager.has_part("OTHER")
+        assert manager.get_part_count() == count
+
+    def test_parts_by_package_follow_edits(self, tmp_path):
+        """Test package lookups match a scan and follow edits."""
+        parts_file = tmp_path / "parts.xml"
+        shutil.copy(FIXTURES / "sample_parts.xml", parts_file)
+        manager = PartsManager(parts_file)
+        manager.load()
+
+        all_parts = [manager.get_part(pid) for pid in manager.list_parts()]
+        r0603 = [p for p in all_parts if p.package_id == "R0603"]
+        assert manager.find_parts_by_package("R0603") == r0603
+        assert manager.get_used_packages() == {p.package_id for p in all_parts}
+
+        manager.update_part(Part(id=r0603[0].id, package_id="R0805", height=0.5))
+        manager.add_part(Part(id="NEW-PART", package_id="NEW-PKG", height=1.0))
+        assert manager.find_parts_by_package("R0603") == r0603[1:]
+        assert "NEW-PKG" in manager.get_used_packages()
+        assert manager.find_parts_by_package("NO-SUCH-PACKAGE") == []
+
+    def test_update_and_remove(self, tmp_path):
+        """Test repeated updates and removals leave one element per part."""
+        parts_file = tmp_path / "parts.xml"
+        shutil.copy(FIXTURES / "sample_parts.xml", parts_file)
+
+        manager = PartsManager(parts_file)
+        manager.load()
+        count = manager.get_part_count()
+        manager.update_part(Part(id="R0805-1K", package_id="R0805", height=0.6))
+        manager.update_part(Part(id="R0805-1K", package_id="R0805", height=0.7))
+        manager.remove_part("R0201-1K")
+        manager.add_part(Part(id="R0201-1K", package_id="R0201", height=0.2))
+        manager.remove_part("R0201-1K")
+        manager.save()
+
+        assert parts_file.read_text().count('id="R0805-1K"') == 1
+        assert list(tmp_path.iterdir()) == [parts_file]
+        reloaded = PartsManager(parts_file)
+        reloaded.load()
+        assert reloaded.get_part_count() == count - 1
+        assert not reloaded.has_part("R0201-1K")
+        assert reloaded.get_part("R0805-1K").height == 0.7
+
+
+
+class TestSafeSave:
+    """Tests for the temp-file-and-replace save shared by both managers."""
+
+    @pytest.mark.skipif(os.name == "nt", reason="symlinks need privileges on Windows")
+    @pytest.mark.parametrize("manager_class, fixture", [
+        (PackagesManager, "sample_packages.xml"),
+        (PartsManager, "sample_parts.xml"),
+    ])
+    def test_save_keeps_symlink_and_mode(self, tmp_path, manager_class, fixture):
+        """Test saving through a symlink replaces the target, keeping its mode."""
+        synced = tmp_path / "synced"
+        synced.mkdir()
+        target = synced / fixture
+        shutil.copy(FIXTURES / fixture, target)
+        target.chmod(0o640)
+        link = tmp_path / fixture
+        link.symlink_to(target)
+
+        manager = manager_class(link)
+        manager.load()
+        manager.save()
+
+        assert link.is_symlink()
+        assert target.stat().st_mode & 0o777 == 0o640
+        assert list(synced.iterdir()) == [target]
+        assert target.read_bytes() == link.read_bytes()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,82 @@
+"""Tests for the EasyEDA response cache."""
+
+import httpx
+import pytest
+from pathlib import Path
+import sys
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.scraper.response_cache import ResponseCache
+from src.scraper import lcsc_client
+from src.scraper.lcsc_client import LCSCClient
+
+
+class TestResponseCache:
+    """Tests for ResponseCache."""
+
+    def test_put_and_get(self, tmp_path):
+        """Test that stored responses survive reopening the cache."""
+        cache = ResponseCache(tmp_path / "cache.sqlite3")
+        cache.put("https://example.com/a", {"result": {"uuid": "abc"}}, etag='"v1"')
+        cache.close()
+
+        reopened = ResponseCache(tmp_path / "cache.sqlite3")
+        cached = reopened.get("https://example.com/a")
+
+        assert cached.data == {"result": {"uuid": "abc"}}
+        assert cached.is_fresh(reopened.ttl)
+        assert cached.conditional_headers() == {"If-None-Match": '"v1"'}
+        assert reopened.get("https://example.com/missing") is None
+
+    def test_staleness_and_touch(self, tmp_path):
+        """Test that touch() marks an entry as revalidated."""
+        cache = ResponseCache(tmp_path / "cache.sqlite3")
+        cache.put("https://example.com/a", {"result": 1})
+        fetched_at = cache.get("https://example.com/a").fetched_at
+
+        assert not cache.get("https://example.com/a").is_fresh(0)
+
+        cache.touch("https://example.com/a")
+        assert cache.get("https://example.com/a").fetched_at >= fetched_at
+
+    def test_client_uses_cached_chain(self, tmp_path):
+        """Test that a fully cached component needs no network access."""
+        base = LCSCClient.EASYEDA_API_BASE
+        cache = ResponseCache(tmp_path / "cache.sqlite3")
+        cache.put(f"{base}/products/C1/components",
+                  {"success": True, "result": {"uuid": "u1", "title": "Resistor"}})
+        cache.put(f"{base}/components/u1", {"result": {"packageDetail": {"uuid": "p1"}}})
+        cache.put(f"{base}/components/p1", {"result": {"dataStr": {"shape": []}}})
+
+        component = LCSCClient(cache=cache).fetch_component("c1")
+
+        assert component.lcsc_id == "C1"
+        assert component.title == "Resistor"
+        assert component.footprint_data == {"dataStr": {"shape": []}}
+
+    def test_revalidate_uses_client_settings(self, tmp_path, monkeypatch):
+        """Test that background revalidation sends the client headers."""
+        url = "https://example.com/a"
+        cache = ResponseCache(tmp_path / "cache.sqlite3", ttl=0)
+        cache.put(url, {"result": 1}, etag='"v1"')
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(304)
+
+        client_class = httpx.Client
+        monkeypatch.setattr(httpx, "Client", lambda **kwargs: client_class(
+            transport=httpx.MockTransport(handler), **kwargs))
+        fetched_at = cache.get(url).fetched_at
+        lcsc_client._revalidate(cache, url, cache.get(url), timeout=5.0)
+
+        assert requests[0].headers["User-Agent"] == lcsc_client._CLIENT_HEADERS["User-Agent"]
+        assert requests[0].headers["If-None-Match"] == '"v1"'
+        assert cache.get(url).fetched_at >= fetched_at
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])